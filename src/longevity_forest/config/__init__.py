@@ -1,32 +1,33 @@
 """Configuration modules for agents, LLMs, and MCPs."""
 
-from longevity_forest.config.llm import (
-    ANTHROPIC_CLAUDE_4_5_HAIKU,
-    ANTHROPIC_CLAUDE_4_5_SONNET,
-)
-from longevity_forest.config.prompts import (
-    QUERY_AGENT_PROMPT,
-    GOOGLE_AGENT_PROMPT,
-    LITERATURE_AGENT_PROMPT,
-    STRUCTURE_AGENT_PROMPT,
-    DATABASE_AGENT_PROMPT,
-    BASE_SCIENTIST_PROMPT,
-    get_gene_analysis_prompt,
-    KEY_PDB_ANALYSIS_PROMPT,
-    SEQUENCE2FUNCTION_REPORT_PROMPT,
-)
+import importlib
 
-__all__ = [
-    "ANTHROPIC_CLAUDE_4_5_HAIKU",
-    "ANTHROPIC_CLAUDE_4_5_SONNET",
-    "QUERY_AGENT_PROMPT",
-    "GOOGLE_AGENT_PROMPT",
-    "LITERATURE_AGENT_PROMPT",
-    "STRUCTURE_AGENT_PROMPT",
-    "DATABASE_AGENT_PROMPT",
-    "BASE_SCIENTIST_PROMPT",
-    "get_gene_analysis_prompt",
-    "KEY_PDB_ANALYSIS_PROMPT",
-    "SEQUENCE2FUNCTION_REPORT_PROMPT",
-]
+# Re-exports are imported on first access (PEP 562): config.llm pulls in just_agents, and importing
+# a single constant module like config.cache must not load every other config module
+_EXPORTS = {
+    "ANTHROPIC_CLAUDE_4_5_HAIKU": "longevity_forest.config.llm",
+    "ANTHROPIC_CLAUDE_4_5_SONNET": "longevity_forest.config.llm",
+    "QUERY_AGENT_PROMPT": "longevity_forest.config.prompts",
+    "GOOGLE_AGENT_PROMPT": "longevity_forest.config.prompts",
+    "LITERATURE_AGENT_PROMPT": "longevity_forest.config.prompts",
+    "STRUCTURE_AGENT_PROMPT": "longevity_forest.config.prompts",
+    "DATABASE_AGENT_PROMPT": "longevity_forest.config.prompts",
+    "BASE_SCIENTIST_PROMPT": "longevity_forest.config.prompts",
+    "get_gene_analysis_prompt": "longevity_forest.config.prompts",
+    "KEY_PDB_ANALYSIS_PROMPT": "longevity_forest.config.prompts",
+    "SEQUENCE2FUNCTION_REPORT_PROMPT": "longevity_forest.config.prompts",
+}
 
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
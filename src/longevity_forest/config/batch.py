@@ -0,0 +1,26 @@
+"""
+Durable batch gene analysis (`forest batch`, `forest worker`)
+"""
+
+from pathlib import Path
+
+from longevity_forest.config.cache import HOUR
+
+# SQLite job queue shared by `forest batch submit`, `run`, `status` and `forest worker`; for workers on
+# several machines, point --queue at a file on storage they all mount
+JOB_QUEUE_PATH: Path = Path("data/batch/jobs.sqlite")
+# WAL needs shared memory between the processes, which network file systems (NFS, SMB) don't provide;
+# use "DELETE" when the queue lives on one
+JOB_QUEUE_JOURNAL_MODE: str = "WAL"
+DEFAULT_BATCH_NAME: str = "default"
+
+# Retry policy: a failed gene is retried after the delay, doubled after every further failure,
+# until it has been attempted BATCH_MAX_ATTEMPTS times
+BATCH_MAX_ATTEMPTS: int = 3
+BATCH_RETRY_DELAY_SECONDS: float = 60.0
+BATCH_MAX_RETRY_DELAY_SECONDS: float = 1 * HOUR
+
+# A running job is leased to its worker, which renews the lease every heartbeat; a job whose lease
+# expired (the worker died or lost the queue) is handed to the next worker that asks
+JOB_LEASE_SECONDS: float = 120.0
+JOB_HEARTBEAT_INTERVAL_SECONDS: float = 30.0
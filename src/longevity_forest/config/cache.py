@@ -0,0 +1,67 @@
+"""
+Cache lifetime settings for host-side caching of expert agent answers
+"""
+
+from pathlib import Path
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# Fallback lifetime for agents without an explicit entry below
+DEFAULT_CACHE_TTL_SECONDS: int = 7 * DAY
+
+# Literature and web results go stale quickly, sequences and orthologs barely change
+AGENT_CACHE_TTL_SECONDS: dict[str, int] = {
+    "google_agent": 1 * DAY,
+    "literature_agent": 3 * DAY,
+    "structure_agent": 30 * DAY,
+    "biomart_agent": 90 * DAY,
+    "opengenes_agent": 30 * DAY,
+    "omnipath_agent": 30 * DAY,
+}
+
+# Near-duplicate matching of expert queries (character n-gram TF-IDF cosine similarity over the
+# query wording, gene/protein identifiers must match exactly)
+# A cached answer is reused when the best match scores at least this much; set above 1.0 to disable
+SIMILARITY_REUSE_THRESHOLD: float = 0.8
+SIMILARITY_NGRAM_RANGE: tuple[int, int] = (3, 5)
+
+# Capitalised words that name data sources rather than genes, ignored when comparing identifiers
+SIMILARITY_IGNORED_IDENTIFIERS: frozenset[str] = frozenset({
+    "PDB", "STRING", "UNIPROT", "BIOMART", "OMNIPATH", "OPENGENES", "INTERPRO", "ALPHAFOLD",
+    "PUBMED", "EUROPEPMC", "ENSEMBL", "KEGG", "REACTOME", "NCBI", "HGNC", "DNA", "RNA", "PTM", "PTMS",
+    "SQL", "API", "ID", "IDS", "AND", "OR", "NOT",
+})
+
+# Cached results prepended to the gene analysis prompt before the first LLM call
+CACHED_CONTEXT_TOKEN_BUDGET: int = 8000
+# Rough token estimate used for budgeting without a tokenizer
+CHARS_PER_TOKEN: int = 4
+
+# Eviction of data/interim by `forest cache gc` (and --auto-gc at the end of a run).
+# Retention is counted from when a result was written, independently of the reuse TTLs above:
+# expired answers are no longer reused, but stay available to the cache search tools until evicted
+DEFAULT_RETENTION_SECONDS: int = 30 * DAY
+AGENT_RETENTION_SECONDS: dict[str, int] = {
+    "google_agent": 14 * DAY,
+    "literature_agent": 30 * DAY,
+    "structure_agent": 180 * DAY,
+    "biomart_agent": 365 * DAY,
+    "opengenes_agent": 180 * DAY,
+    "omnipath_agent": 180 * DAY,
+}
+# Size budget of the interim directory, least recently used results are evicted beyond it
+CACHE_MAX_BYTES: int = 2 * 1024 ** 3
+
+# Result texts are stored zlib-compressed in append-only pack files under data/interim/packs/
+PACK_MAX_BYTES: int = 256 * 1024 ** 2
+PACK_COMPRESSION_LEVEL: int = 6
+# `forest cache gc` rewrites a pack once this fraction of it belongs to evicted results
+PACK_COMPACT_DEAD_RATIO: float = 0.5
+
+# Default character budget of one read_results_by_filenames call (about 10k tokens)
+READ_RESULTS_MAX_CHARS: int = 40000
+
+# Agent YAML configs compiled to JSON (profiles plus the MCP tool schemas resolved when the agents
+# were first built), one file per config content and just-agents version
+PROFILE_CACHE_DIR: Path = Path("data/profiles")
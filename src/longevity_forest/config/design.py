@@ -0,0 +1,44 @@
+"""
+Asynchronous protein hunter designs (`forest hunt-protein --async-designs`, `forest design`)
+"""
+
+from pathlib import Path
+
+from longevity_forest.config.mcp import KNOWLEDGEBASE_MCP_CONFIG, PROTEIN_HUNTER_MCP_CONFIG
+
+DESIGN_MCP_CONFIG: dict = PROTEIN_HUNTER_MCP_CONFIG
+# Used to resolve a gene name to its protein sequence before submitting designs
+DESIGN_SEQUENCE_MCP_CONFIG: dict = KNOWLEDGEBASE_MCP_CONFIG
+DESIGN_SEQUENCE_TOOL: str = "bc_get_uniprot_protein_info"
+
+# Design jobs of all runs, so designs survive the client and can be collected later
+DESIGN_JOBS_PATH: Path = Path("data/designs/jobs.sqlite")
+
+# Job tools of the server: submit returns a job id for a design tool call, status returns
+# {"status": queued|running|completed|failed, "result": ..., "error": ...}. Servers without them
+# get each design as one blocking call from a client thread, which can't outlive the client.
+DESIGN_SUBMIT_TOOL: str = "ph_submit_design"
+DESIGN_STATUS_TOOL: str = "ph_get_design_job"
+
+# Designs running on the GPU server at the same time
+DESIGN_MAX_CONCURRENT: int = 2
+# Status polls start after the initial delay and back off to the maximum delay
+DESIGN_POLL_INITIAL_SECONDS: float = 15.0
+DESIGN_POLL_MAX_SECONDS: float = 120.0
+# Seconds to wait for a blocking design call (servers without job tools)
+DESIGN_CALL_TIMEOUT_SECONDS: float = 30 * 60.0
+
+# Argument names of the design tools
+DESIGN_TARGET_ARGUMENT: str = "target_sequence"
+DESIGN_CONTACTS_ARGUMENT: str = "contact_residues"
+DESIGN_NAME_ARGUMENT: str = "design_name"
+DESIGN_DEFAULT_TOOL: str = "ph_design_protein_binder"
+DESIGN_CONTACTS_TOOL: str = "ph_design_protein_binder_with_contacts"
+# One trial and five cycles, as the protein_hunter agent is instructed to use
+DESIGN_TOOL_DEFAULTS: dict[str, dict] = {
+    "ph_design_protein_binder": {"num_designs": 1, "num_cycles": 5},
+    "ph_design_protein_binder_with_contacts": {"num_designs": 1, "num_cycles": 5},
+    "ph_design_cyclic_peptide_binder": {"num_designs": 1, "num_cycles": 5},
+    "ph_chai_design_protein_binder": {"n_trials": 1, "n_cycles": 5},
+    "ph_chai_design_cyclic_peptide_binder": {"n_trials": 1, "n_cycles": 5},
+}
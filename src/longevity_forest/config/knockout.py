@@ -0,0 +1,40 @@
+"""
+In-silico knockout screens run directly against the cell2sentence4longevity MCP server
+(`forest insilico-knockout --direct`, `forest insilico-knockout-batch`, `forest knockout-scan`)
+"""
+
+from pathlib import Path
+from typing import Optional
+
+from longevity_forest.config.mcp import CELL2SENTENCE4LONGEVITY_MCP_CONFIG
+
+KNOCKOUT_MCP_CONFIG: dict = CELL2SENTENCE4LONGEVITY_MCP_CONFIG
+
+# Age prediction tool and its argument names; metadata arguments are only sent when given
+KNOCKOUT_PREDICT_TOOL: str = "predict_age_with_metadata"
+KNOCKOUT_SENTENCE_ARGUMENT: str = "gene_sentence"
+KNOCKOUT_METADATA_ARGUMENTS: tuple[str, ...] = ("sex", "tissue", "cell_type", "smoking_status")
+# Keys of the predicted age in the tool result, tried in order
+KNOCKOUT_AGE_KEYS: tuple[str, ...] = ("predicted_age", "age", "prediction")
+# Key of the model name in the tool result, shown in knockout reports
+KNOCKOUT_MODEL_KEY: str = "model"
+
+# Tool predicting a list of sentences of the same cell in one call (the list goes in
+# KNOCKOUT_BATCH_SENTENCES_ARGUMENT); the cell2sentence4longevity server has none yet, so None sends
+# one prediction per sentence
+KNOCKOUT_BATCH_PREDICT_TOOL: Optional[str] = None
+KNOCKOUT_BATCH_SENTENCES_ARGUMENT: str = "gene_sentences"
+KNOCKOUT_BATCH_SIZE: int = 32
+
+# The model runs on a single GPU, more concurrent predictions only queue up on the server
+KNOCKOUT_WORKERS: int = 4
+# Seconds to wait for a single prediction
+KNOCKOUT_TIMEOUT_SECONDS: float = 300.0
+
+# |delta age| in years below which a knockout counts as having no effect
+KNOCKOUT_NEUTRAL_DELTA_YEARS: float = 0.5
+
+KNOCKOUT_OUTPUT_DIR: Path = Path("data/output")
+
+# Predictions of every `forest knockout-scan`, one directory per sentence and metadata, so a rerun resumes
+KNOCKOUT_SCAN_DIR: Path = Path("data/knockout_scans")
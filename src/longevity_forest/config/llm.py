@@ -11,3 +11,16 @@ ANTHROPIC_CLAUDE_4_5_SONNET: LLMOptions = {
 }
 
 
+
+# Parallel fan-out of expert sub-agents (call_expert_agents_parallel)
+EXPERT_PARALLEL_MAX_WORKERS: int = 6
+
+# Maximum concurrent calls per expert sub-agent shortname. An agent instance keeps a single
+# conversation memory, so each concurrent call gets its own instance built from the same profile,
+# up to this many per shortname; unlisted agents get up to EXPERT_DEFAULT_MAX_CONCURRENT instances.
+# google_agent misbehaves under parallel calls, structure_agent is backed by a slow GPU-bound server
+EXPERT_MAX_CONCURRENT: dict[str, int] = {
+    "google_agent": 1,
+    "structure_agent": 1,
+}
+EXPERT_DEFAULT_MAX_CONCURRENT: int = 3
@@ -1,4 +1,6 @@
-from just_agents.data_classes import JustMCPServerParameters
+from pathlib import Path
+
+from longevity_forest.config.cache import DAY
 
 GGET_MCP_CONFIG = {
   "mcpServers": {
@@ -90,194 +92,114 @@ PROTEIN_HUNTER_MCP_CONFIG = {
   }
 }
 
-# JustMCPServerParameters wrappers for all MCP servers
-GGET_MCP = JustMCPServerParameters(
-    mcp_client_config=GGET_MCP_CONFIG,
-    exclude_tools=[]
-)
-
-BIO_MCP = JustMCPServerParameters(
-    mcp_client_config=BIO_MCP_CONFIG,
-    exclude_tools=[]
-)
-
-BIOTHINGS_MCP = JustMCPServerParameters(
-    mcp_client_config=BIOTHINGS_MCP_CONFIG,
-    exclude_tools=[]
-)
-
-SYNERGY_AGE_MCP = JustMCPServerParameters(
-    mcp_client_config=SYNERGY_AGE_MCP_CONFIG,
-    exclude_tools=[]
-)
-
-OPENGENES_MCP = JustMCPServerParameters(
-    mcp_client_config=OPENGENES_MCP_CONFIG,
-    exclude_tools=[]
-)
-
-KNOWLEDGEBASE_MCP = JustMCPServerParameters(
-    mcp_client_config=KNOWLEDGEBASE_MCP_CONFIG,
-    exclude_tools=[]
-)
-
-BIOMART_MCP = JustMCPServerParameters(
-    mcp_client_config=BIOMART_MCP_CONFIG,
-    exclude_tools=[]
-)
-
-ATOMICA_MCP = JustMCPServerParameters(
-    mcp_client_config=ATOMICA_MCP_CONFIG,
-    exclude_tools=[]
-)
-
-OMNIPATH_MCP = JustMCPServerParameters(
-    mcp_client_config=OMNIPATH_MCP_CONFIG,
-    exclude_tools=[]
-)
-
-PROTEIN_HUNTER_MCP = JustMCPServerParameters(
-    mcp_client_config=PROTEIN_HUNTER_MCP_CONFIG,
-    exclude_tools=[]
-)
-
-# Full configs with explicit tool lists
-
-# BioMart: call_expert_agent + BioMart tools
-BIOMART_MCP_FULL = JustMCPServerParameters(
-    mcp_client_config=BIOMART_MCP_CONFIG,
-    only_include_tools=[
-        "get_data",
-        "list_marts",
-        "list_datasets",
-        "list_all_attributes",
-        "batch_translate",
-        "get_translation",
-        "list_common_attributes",
-        "list_filters"
-    ],
-    exclude_tools=[]
-)
+CELL2SENTENCE4LONGEVITY_MCP_CONFIG = {
+  "mcpServers": {
+    "cell2sentence4longevity": {
+      "url": "https://cell2sentence-mcp.longevity-genie.info/mcp"
+    }
+  }
+}
 
-# OmniPath: call_expert_agent + OmniPath tools
-OMNIPATH_MCP_FULL = JustMCPServerParameters(
-    mcp_client_config=OMNIPATH_MCP_CONFIG,
-    only_include_tools=[
-        "execute_sql_query_on_omnipath_db"
-    ],
-    exclude_tools=[]
-)
+# Memoization of MCP tool calls shared by all agents (core/tool_cache.py), keyed by server URL, tool
+# name and canonicalized arguments. Only deterministic lookups are listed; tools missing here
+# (searches over changing data, protein design, model predictions) are always invoked.
+MCP_TOOL_CACHE_TTL_SECONDS: dict[str, int] = {
+    # Knowledgebase: identifier resolution and reference databases
+    "bc_get_ensembl_id_from_gene_symbol": 90 * DAY,
+    "bc_get_uniprot_id_by_protein_symbol": 90 * DAY,
+    "bc_get_string_id": 90 * DAY,
+    "bc_get_kegg_id_by_gene_symbol": 90 * DAY,
+    "bc_get_uniprot_protein_info": 30 * DAY,
+    "bc_get_alphafold_info_by_protein_symbol": 30 * DAY,
+    "bc_get_protein_domains": 30 * DAY,
+    "bc_search_interpro_entries": 30 * DAY,
+    "bc_get_interpro_entry": 30 * DAY,
+    "bc_get_go_terms_by_gene": 30 * DAY,
+    "bc_get_string_interactions": 30 * DAY,
+    "bc_get_string_similarity_scores": 30 * DAY,
+    "bc_get_human_protein_atlas_info": 30 * DAY,
+    "bc_get_reactome_info_by_identifier": 30 * DAY,
+    # BioMART
+    "list_marts": 30 * DAY,
+    "list_datasets": 30 * DAY,
+    "list_all_attributes": 30 * DAY,
+    "list_common_attributes": 30 * DAY,
+    "list_filters": 30 * DAY,
+    "get_data": 30 * DAY,
+    "get_translation": 90 * DAY,
+    "batch_translate": 90 * DAY,
+    # OpenGenes and OmniPath databases
+    "opengenes_get_schema_info": 30 * DAY,
+    "opengenes_example_queries": 30 * DAY,
+    "opengenes_db_query": 30 * DAY,
+    "execute_sql_query_on_omnipath_db": 30 * DAY,
+    # BIO
+    "gene_getter": 7 * DAY,
+    "variant_getter": 7 * DAY,
+    "fetch": 1 * DAY,
+}
 
-# OpenGenes: call_expert_agent + OpenGenes tools
-OPENGENES_MCP_FULL = JustMCPServerParameters(
-    mcp_client_config=OPENGENES_MCP_CONFIG,
-    only_include_tools=[
-        "opengenes_db_query",
-        "opengenes_get_schema_info",
-        "opengenes_example_queries"
-    ],
-    exclude_tools=[]
-)
+# Entries kept in the in-process tier of the tool call cache
+MCP_TOOL_CACHE_MEMORY_ENTRIES: int = 512
+
+# Deterministic per-gene lookups prefetched by `forest warm-cache`; "{gene}" is replaced by the gene symbol.
+# Arguments must match what the agents send for the warmed entries to be hit.
+WARM_CACHE_LOOKUPS: list[dict] = [
+    {"tool": "bc_get_ensembl_id_from_gene_symbol", "server": KNOWLEDGEBASE_MCP_CONFIG,
+     "arguments": {"gene_symbol": "{gene}", "species": "9606"}},
+    {"tool": "bc_get_uniprot_id_by_protein_symbol", "server": KNOWLEDGEBASE_MCP_CONFIG,
+     "arguments": {"protein_symbol": "{gene}", "species": "9606"}},
+    {"tool": "bc_get_string_id", "server": KNOWLEDGEBASE_MCP_CONFIG,
+     "arguments": {"protein_symbol": "{gene}", "species": "9606"}},
+    {"tool": "bc_get_uniprot_protein_info", "server": KNOWLEDGEBASE_MCP_CONFIG,
+     "arguments": {"gene_symbol": "{gene}", "species": "9606"}},
+    {"tool": "bc_get_alphafold_info_by_protein_symbol", "server": KNOWLEDGEBASE_MCP_CONFIG,
+     "arguments": {"protein_symbol": "{gene}", "species": "9606"}},
+    {"tool": "bc_get_protein_domains", "server": KNOWLEDGEBASE_MCP_CONFIG,
+     "arguments": {"gene_symbol": "{gene}", "species": "9606"}},
+]
+WARM_CACHE_WORKERS: int = 8
+# Seconds to wait for a single prefetch call
+WARM_CACHE_TIMEOUT_SECONDS: float = 120.0
+
+# Process-wide MCP session pool (core/mcp_pool.py), one client and session per server URL
+# A session unused for this long is pinged before the next call and replaced if it doesn't answer
+MCP_POOL_HEALTH_CHECK_AFTER_SECONDS: float = 60.0
+MCP_POOL_PING_TIMEOUT_SECONDS: float = 5.0
+# Sessions idle for longer are closed (and reopened on the next call), checked every sweep interval
+MCP_POOL_IDLE_SECONDS: float = 600.0
+MCP_POOL_SWEEP_INTERVAL_SECONDS: float = 60.0
+
+# Tool schemas discovered from each MCP server (core/tool_schemas.py), one file per server URL.
+# Agents are built from the stored schemas; older ones are still used but refreshed in the background
+MCP_SCHEMA_CACHE_DIR: Path = Path("data/tool_schemas")
+MCP_SCHEMA_TTL_SECONDS: int = 1 * DAY
+# Seconds to wait for a server's tool list
+MCP_SCHEMA_FETCH_TIMEOUT_SECONDS: float = 60.0
+
+# JustMCPServerParameters wrappers of the servers above live in config/mcp_servers.py, whose import
+# loads just_agents' pydantic models; they are still importable from here and built on first access
+_SERVER_PARAMETERS = {
+    "GGET_MCP",
+    "BIO_MCP",
+    "BIOTHINGS_MCP",
+    "SYNERGY_AGE_MCP",
+    "OPENGENES_MCP",
+    "KNOWLEDGEBASE_MCP",
+    "BIOMART_MCP",
+    "ATOMICA_MCP",
+    "OMNIPATH_MCP",
+    "PROTEIN_HUNTER_MCP",
+    "BIOMART_MCP_FULL",
+    "OMNIPATH_MCP_FULL",
+    "OPENGENES_MCP_FULL",
+    "BIO_MCP_FULL",
+    "KNOWLEDGEBASE_MCP_FULL",
+}
 
-# BIO (Biological data): call_expert_agent + BIO tools
-BIO_MCP_FULL = JustMCPServerParameters(
-    mcp_client_config=BIO_MCP_CONFIG,
-    only_include_tools=[
-        "nci_organization_searcher",
-        "openfda_approval_searcher",
-        "search",
-        "article_getter",
-        "alphagenome_predictor",
-        "trial_references_getter",
-        "article_searcher",
-        "openfda_adverse_searcher",
-        "gene_getter",
-        "nci_disease_searcher",
-        "openfda_shortage_getter",
-        "think",
-        "disease_getter",
-        "nci_intervention_getter",
-        "openfda_device_getter",
-        "trial_locations_getter",
-        "variant_getter",
-        "nci_biomarker_searcher",
-        "trial_searcher",
-        "openfda_recall_getter",
-        "trial_protocol_getter",
-        "openfda_label_searcher",
-        "nci_organization_getter",
-        "openfda_recall_searcher",
-        "trial_outcomes_getter",
-        "nci_intervention_searcher",
-        "drug_getter",
-        "openfda_label_getter",
-        "openfda_shortage_searcher",
-        "variant_searcher",
-        "openfda_approval_getter",
-        "openfda_adverse_getter",
-        "fetch",
-        "trial_getter",
-        "openfda_device_searcher"
-    ],
-    exclude_tools=[]
-)
 
-# Knowledgebase: call_expert_agent + Knowledgebase tools
-KNOWLEDGEBASE_MCP_FULL = JustMCPServerParameters(
-    mcp_client_config=KNOWLEDGEBASE_MCP_CONFIG,
-    only_include_tools=[
-        "bc_search_google_scholar_publications",
-        "bc_get_uniprot_protein_info",
-        "bc_get_term_details",
-        "bc_search_drugs_by_therapeutic_class",
-        "bc_search_interpro_entries",
-        "bc_get_europepmc_articles",
-        "bc_get_interpro_entry",
-        "bc_query_open_targets_graphql",
-        "bc_get_string_interactions",
-        "bc_get_human_protein_atlas_info",
-        "bc_get_string_similarity_scores",
-        "bc_get_recent_biorxiv_preprints",
-        "bc_get_cell_ontology_terms",
-        "bc_get_available_ontologies",
-        "bc_get_go_terms_by_gene",
-        "bc_get_panglaodb_marker_genes",
-        "bc_get_protein_domains",
-        "bc_get_reactome_info_by_identifier",
-        "bc_search_studies",
-        "bc_get_ensembl_id_from_gene_symbol",
-        "bc_get_alphafold_info_by_protein_symbol",
-        "bc_get_string_network_image",
-        "bc_get_study_details",
-        "bc_search_drugs_fda",
-        "bc_get_pride_project",
-        "bc_get_recruiting_studies_by_location",
-        "bc_get_europepmc_fulltext",
-        "bc_get_open_targets_graphql_schema",
-        "bc_get_uniprot_id_by_protein_symbol",
-        "bc_search_ontology_terms",
-        "bc_get_drug_by_application_number",
-        "bc_count_drugs_by_field",
-        "bc_search_pride_projects",
-        "bc_get_efo_id_by_disease_name",
-        "bc_get_biorxiv_preprint_details",
-        "bc_get_term_hierarchical_children",
-        "bc_search_pride_proteins",
-        "bc_get_antibody_information",
-        "bc_get_chebi_terms_by_chemical",
-        "bc_get_studies_by_condition",
-        "bc_get_available_pharmacologic_classes",
-        "bc_get_drug_label_info",
-        "bc_get_studies_by_intervention",
-        "bc_get_kegg_id_by_gene_symbol",
-        "bc_query_kegg",
-        "bc_get_antibody_list",
-        "bc_search_grants_gov",
-        "bc_get_panglaodb_options",
-        "bc_get_open_targets_query_examples",
-        "bc_get_generic_equivalents",
-        "bc_get_string_id",
-        "bc_get_drug_statistics"
-    ],
-    exclude_tools=[]
-)
+def __getattr__(name: str):
+    if name not in _SERVER_PARAMETERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from longevity_forest.config import mcp_servers
+    return getattr(mcp_servers, name)
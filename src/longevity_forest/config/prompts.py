@@ -111,6 +111,33 @@ Additionaly look for notable loss-of-function gain-of-function variants outside
 
 """
 
+def get_cached_context_prompt(gene_name: str, cached_context: str) -> str:
+    """Wrap cached sub-agent results so they can be prepended to the gene analysis prompt.
+    
+    Args:
+        gene_name: The name of the gene being analyzed
+        cached_context: Cached query/result blocks selected for the gene
+        
+    Returns:
+        The formatted prompt prefix
+    """
+    return f"""CACHED RESULTS: answers of your sub-agents to earlier queries about {gene_name}, retrieved from the local cache.
+Use them as already available input and cite their original sources. Do NOT re-query sub-agents for information present here,
+only query the missing information. Truncated entries can be read in full with `read_results_by_filenames`.
+
+{cached_context}
+
+END OF CACHED RESULTS
+
+"""
+
+# Sent when a run is resumed from a checkpoint taken while the initial query was still running
+RESUME_INTERRUPTED_QUERY_PROMPT = """Your previous turn was interrupted before you finished. Continue the task from where you left off,
+building on the sub-agent and tool results above; do not repeat queries whose answers you already have."""
+
+# Sent while the report doesn't end with the REPORT_END marker yet
+CONTINUE_REPORT_PROMPT = "REPORT_END marker not found, continue the report generation from the last response"
+
 KEY_PDB_ANALYSIS_PROMPT = f"""
 Identify and select up to 3 key PDBs with diferent sites/domains/roles or for the most notable longevity variants for analysis with Atomica. 
 Using atomica tool obtain residue predictions. Integrate the computed predictions with the available data, 
@@ -207,3 +234,75 @@ def get_insilico_knockout_prompt(
     ])
     
     return "\n".join(prompt_parts)
+
+
+def get_knockout_interpretation_prompt(
+    setup_table: str,
+    original_age: float,
+    results_table: str,
+    top_n: int
+) -> str:
+    """Generate the prompt interpreting the top hits of a knockout screen whose predictions are already computed.
+    
+    Args:
+        setup_table: Markdown table of the gene sentence and metadata shared by all knockouts
+        original_age: Predicted age of the original sentence
+        results_table: Markdown table of the top knockouts (rank, gene, knockout age, delta age)
+        top_n: Number of knockouts in the results table
+        
+    Returns:
+        The formatted prompt string
+    """
+    return f"""The in-silico knockout predictions below were already computed with the cell2sentence4longevity model.
+Do NOT call any tools; interpret the numbers as they are.
+
+Experimental setup:
+{setup_table}
+
+Original predicted age: {original_age:.2f} years
+
+Top {top_n} knockouts by |delta age| (delta age = knockout age - original age):
+{results_table}
+
+Write a brief interpretation (2-3 paragraphs, markdown) of what these knockouts say about the genes' roles in aging:
+- Positive delta: knockout increases predicted age, the gene may be protective/anti-aging
+- Negative delta: knockout decreases predicted age, the gene may be pro-aging
+- Relate the effect sizes to the genes' positions in the expression ranking where relevant
+Do not repeat the tables."""
+
+
+def get_design_report_prompt(target: str, target_sequence: str, design_results: str) -> str:
+    """Generate the prompt turning binder designs that already ran into a degradation peptide report.
+    
+    Args:
+        target: Gene name or sequence the binders were designed for
+        target_sequence: Resolved target protein sequence
+        design_results: Markdown of every design with its tool, arguments and result or error
+        
+    Returns:
+        The formatted prompt string
+    """
+    return f"""Binder designs for the target {target} already ran on the protein hunter server, their results are below.
+Do NOT call any design tools; work with these results.
+
+Target protein sequence:
+{target_sequence}
+
+Designs:
+{design_results}
+
+Your task:
+1. Compare the designs and select the best binder (look for high iPTM scores 0.9+ and good pLDDT scores)
+2. Create a degradation adaptor by fusing ubiquitin to the C-terminus of the selected binder
+3. Provide the final degradation peptide sequence in the format: BinderSequence + Linker + Ubiquitin
+
+Use a flexible linker like GGSGGS between the binder and ubiquitin.
+
+Please provide:
+- The resolved target protein sequence
+- A table of all designs with their tool, contacts and metrics (failed designs with their error)
+- Design metrics for the selected binder (iPTM, pLDDT, etc.)
+- The final degradation peptide sequence
+- Output file locations for structures
+
+Generate a comprehensive report in markdown format."""
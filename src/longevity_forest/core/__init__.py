@@ -1,28 +1,31 @@
 """Core utilities and helper functions."""
 
-from longevity_forest.core.helpers import (
-    save_result_to_markdown,
-    validate_markdown_file,
-    serialize_memory_to_yaml,
-    serialize_content,
-)
-from longevity_forest.core.experts import (
-    call_expert_agent,
-    write_md_result,
-    grep_cache_full,
-    grep_cache_only_queries,
-    read_results_by_filenames,
-)
+import importlib
 
-__all__ = [
-    "save_result_to_markdown",
-    "validate_markdown_file",
-    "serialize_memory_to_yaml",
-    "serialize_content",
-    "call_expert_agent",
-    "write_md_result",
-    "grep_cache_full",
-    "grep_cache_only_queries",
-    "read_results_by_filenames",
-]
+# Re-exports are imported on first access (PEP 562): helpers and experts pull in just_agents, which
+# the light modules of this package (job queue, interim index, cache gc) don't need
+_EXPORTS = {
+    "save_result_to_markdown": "longevity_forest.core.helpers",
+    "validate_markdown_file": "longevity_forest.core.helpers",
+    "serialize_memory_to_yaml": "longevity_forest.core.helpers",
+    "serialize_content": "longevity_forest.core.helpers",
+    "call_expert_agent": "longevity_forest.core.experts",
+    "write_md_result": "longevity_forest.core.experts",
+    "grep_cache_full": "longevity_forest.core.experts",
+    "grep_cache_only_queries": "longevity_forest.core.experts",
+    "read_results_by_filenames": "longevity_forest.core.experts",
+}
 
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
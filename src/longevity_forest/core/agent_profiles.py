@@ -0,0 +1,171 @@
+import copy
+import hashlib
+import json
+import os
+import threading
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+import yaml
+from just_agents.just_bus import JustLogBus
+from just_agents.just_serialization import JustSerializable
+from just_agents.web.web_agent import WebAgent
+
+from longevity_forest.config.cache import PROFILE_CACHE_DIR
+from longevity_forest.core.tool_schemas import install_tool_schemas
+
+
+PARENT_SECTION = "agent_profiles"
+# Bump when the layout of compiled files changes
+COMPILED_FORMAT = 2
+
+# fingerprint -> compiled config, shared by every agent built in this process
+_compiled: dict[str, dict[str, Any]] = {}
+_compiled_lock = threading.Lock()
+
+
+def _library_version() -> str:
+    try:
+        return version("just-agents")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def config_fingerprint(config_file: Path) -> str:
+    """Return the key of a config's compiled form: a hash of its content, the just-agents version and the format."""
+    digest = hashlib.sha256(config_file.read_bytes())
+    digest.update(f"\0{_library_version()}\0{COMPILED_FORMAT}".encode())
+    return digest.hexdigest()[:16]
+
+
+def validate_profiles(data: Any, config_file: Path) -> dict[str, dict[str, Any]]:
+    """Check the agent profiles of a parsed config before any agent is built from them.
+
+    Returns:
+        Section name -> profile
+
+    Raises:
+        ValueError: Listing every problem found
+    """
+    profiles = data.get(PARENT_SECTION) if isinstance(data, dict) else None
+    if not isinstance(profiles, dict) or not profiles:
+        raise ValueError(f"{config_file} has no '{PARENT_SECTION}' section")
+    problems = []
+    for name, profile in profiles.items():
+        if not isinstance(profile, dict):
+            problems.append(f"{name}: not a mapping")
+            continue
+        if not isinstance(profile.get("class_qualname"), str):
+            problems.append(f"{name}: missing class_qualname")
+        if not isinstance(profile.get("llm_options"), dict) or not profile["llm_options"].get("model"):
+            problems.append(f"{name}: missing llm_options.model")
+        tools = profile.get("tools") or []
+        if not isinstance(tools, list):
+            problems.append(f"{name}: tools is not a list")
+            continue
+        for index, tool in enumerate(tools):
+            if not isinstance(tool, dict) or not tool.get("function"):
+                problems.append(f"{name}: tool {index + 1} has no function")
+    if problems:
+        raise ValueError(f"Invalid agent profiles in {config_file}:\n  " + "\n  ".join(problems))
+    return profiles
+
+
+def _compiled_path(fingerprint: str, cache_dir: Path) -> Path:
+    return cache_dir / f"{fingerprint}.json"
+
+
+def _write_compiled(compiled: dict[str, Any], cache_dir: Path) -> None:
+    # Written to a temporary file first, so a concurrent reader never sees a truncated file
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = _compiled_path(compiled["fingerprint"], cache_dir)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(json.dumps(compiled, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def load_profiles(config_file: Path, cache_dir: Path = PROFILE_CACHE_DIR) -> dict[str, Any]:
+    """Return the compiled form of an agent config, parsing the YAML only if no compiled form exists.
+
+    The compiled form is kept in memory for the process and on disk under cache_dir, keyed by
+    config_fingerprint, so an edited config or a new just-agents version compiles afresh.
+
+    Returns:
+        Dictionary with 'fingerprint', 'config_file' and 'profiles' (section name -> profile)
+
+    Raises:
+        ValueError: If the profiles are invalid
+    """
+    fingerprint = config_fingerprint(config_file)
+    with _compiled_lock:
+        compiled = _compiled.get(fingerprint)
+        if compiled is not None:
+            return compiled
+        path = _compiled_path(fingerprint, cache_dir)
+        try:
+            compiled = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            compiled = None
+        if compiled is None:
+            data = yaml.safe_load(config_file.read_text(encoding="utf-8")) or {}
+            compiled = {
+                "fingerprint": fingerprint,
+                "config_file": str(config_file),
+                "profiles": validate_profiles(data, config_file),
+            }
+            _write_compiled(compiled, cache_dir)
+            JustLogBus().info(f"Compiled agent profiles of {config_file}",
+                              source="agent_profiles",
+                              action="agent_profiles.compile",
+                              config_file=str(config_file),
+                              fingerprint=fingerprint)
+        _compiled[fingerprint] = compiled
+        return compiled
+
+
+def build_agent(
+    section_name: str,
+    config_file: Path,
+    agent_class: type = WebAgent,
+    cache_dir: Path = PROFILE_CACHE_DIR,
+):
+    """Build an agent from the compiled form of its config; a drop-in for agent_class.from_yaml.
+
+    MCP tools take their schemas from the stored tool lists of their servers (core/tool_schemas.py),
+    so only servers never seen before are contacted.
+
+    Args:
+        section_name: Profile name under agent_profiles
+        config_file: Agent YAML config
+        agent_class: Agent class to build, e.g. WebAgent or BaseAgentWithLogging
+        cache_dir: Directory of the compiled configs
+
+    Raises:
+        ValueError: If the config has no such profile or its profiles are invalid
+    """
+    install_tool_schemas()
+    compiled = load_profiles(config_file, cache_dir)
+    if section_name not in compiled["profiles"]:
+        raise ValueError(f"No agent profile '{section_name}' in {config_file}")
+    data = JustSerializable.update_config_data(
+        copy.deepcopy(compiled["profiles"][section_name]), section_name, PARENT_SECTION, config_file
+    )
+    return agent_class.from_json(json_data=data, qualname_check=False)
+
+
+def clear_compiled_profiles(cache_dir: Path = PROFILE_CACHE_DIR) -> int:
+    """Forget compiled configs in memory and on disk.
+
+    Returns:
+        Number of deleted compiled files
+    """
+    with _compiled_lock:
+        _compiled.clear()
+    if not cache_dir.exists():
+        return 0
+    deleted = 0
+    for path in cache_dir.glob("*.json"):
+        path.unlink(missing_ok=True)
+        deleted += 1
+    return deleted
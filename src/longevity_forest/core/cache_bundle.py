@@ -0,0 +1,232 @@
+import hashlib
+import socket
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+
+from longevity_forest.core.interim_index import (
+    INTERIM_DIR,
+    ensure_index,
+    list_entries,
+    parse_result_text,
+    read_result_texts,
+    store_result,
+)
+from longevity_forest.core.tool_cache import connect_tool_cache, tool_cache_path
+
+
+BUNDLE_FORMAT = "longevity-forest-cache"
+BUNDLE_VERSION = 1
+
+BUNDLE_SCHEMA = """
+CREATE TABLE manifest (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE results (
+    filename TEXT PRIMARY KEY,
+    agent_name TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    cache_key TEXT,
+    config_hash TEXT,
+    content_hash TEXT NOT NULL,
+    content BLOB NOT NULL
+);
+CREATE TABLE tool_calls (
+    key TEXT PRIMARY KEY,
+    server TEXT NOT NULL,
+    tool TEXT NOT NULL,
+    arguments TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    content BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+EXPORT_BATCH_SIZE = 256
+
+
+def content_hash(text: str) -> str:
+    """Return the sha256 hex digest of a result or tool call content."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def export_bundle(bundle_path: Path, interim_dir: Path = INTERIM_DIR, include_tool_calls: bool = True) -> dict[str, int]:
+    """Write all cached expert results (and MCP tool calls) into one self-describing SQLite bundle.
+
+    Args:
+        bundle_path: File to create, must not exist
+        interim_dir: Directory holding the interim results
+        include_tool_calls: Also export the unexpired MCP tool cache
+
+    Returns:
+        Dictionary with 'results' and 'tool_calls' counts
+
+    Raises:
+        FileExistsError: If bundle_path already exists
+    """
+    if bundle_path.exists():
+        raise FileExistsError(f"Bundle already exists: {bundle_path}")
+    ensure_index(interim_dir)
+    entries = list_entries(interim_dir)
+
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    counts = {"results": 0, "tool_calls": 0}
+    bundle = sqlite3.connect(bundle_path)
+    try:
+        bundle.executescript(BUNDLE_SCHEMA)
+        filenames = sorted(entries)
+        for start in range(0, len(filenames), EXPORT_BATCH_SIZE):
+            batch = filenames[start:start + EXPORT_BATCH_SIZE]
+            for filename, text in read_result_texts(batch, interim_dir).items():
+                entry = entries[filename]
+                bundle.execute(
+                    "INSERT INTO results (filename, agent_name, created_at, cache_key, config_hash, content_hash, content) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (filename, entry["agent_name"], entry["created_at"], entry["cache_key"], entry["config_hash"],
+                     content_hash(text), zlib.compress(text.encode("utf-8"))),
+                )
+                counts["results"] += 1
+
+        if include_tool_calls and tool_cache_path(interim_dir).exists():
+            with connect_tool_cache(interim_dir) as connection:
+                for key, server, tool, arguments, content, created_at, expires_at in connection.execute(
+                    "SELECT key, server, tool, arguments, content, created_at, expires_at FROM tool_calls "
+                    "WHERE expires_at >= ?", (time.time(),)
+                ):
+                    bundle.execute(
+                        "INSERT INTO tool_calls (content_hash, key, server, tool, arguments, content, created_at, expires_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (content_hash(zlib.decompress(content).decode("utf-8")),
+                         key, server, tool, arguments, content, created_at, expires_at),
+                    )
+                    counts["tool_calls"] += 1
+
+        manifest = {
+            "format": BUNDLE_FORMAT,
+            "version": str(BUNDLE_VERSION),
+            "created_at": str(time.time()),
+            "source_host": socket.gethostname(),
+            "results": str(counts["results"]),
+            "tool_calls": str(counts["tool_calls"]),
+        }
+        bundle.executemany("INSERT INTO manifest (key, value) VALUES (?, ?)", manifest.items())
+        bundle.commit()
+    except BaseException:
+        bundle.close()
+        bundle_path.unlink(missing_ok=True)
+        raise
+    bundle.close()
+    return counts
+
+
+def read_manifest(bundle_path: Path) -> dict[str, str]:
+    """Read and validate the manifest of a bundle.
+
+    Raises:
+        ValueError: If the file is not a cache bundle of a supported version
+    """
+    try:
+        bundle = sqlite3.connect(f"file:{bundle_path}?mode=ro", uri=True)
+        try:
+            manifest = dict(bundle.execute("SELECT key, value FROM manifest"))
+        finally:
+            bundle.close()
+    except sqlite3.Error as e:
+        raise ValueError(f"Not a cache bundle: {bundle_path} ({e})")
+    if manifest.get("format") != BUNDLE_FORMAT:
+        raise ValueError(f"Not a cache bundle: {bundle_path}")
+    if int(manifest.get("version", "0")) > BUNDLE_VERSION:
+        raise ValueError(f"Bundle version {manifest['version']} is newer than supported ({BUNDLE_VERSION})")
+    return manifest
+
+
+def import_bundle(bundle_path: Path, interim_dir: Path = INTERIM_DIR) -> dict[str, int]:
+    """Merge a cache bundle into the local interim cache.
+
+    Results keep their filename, creation time and cache key, so TTLs carry over. Results already
+    present with the same content, or answering the same cache key no later than a local one, are
+    skipped; a different local result under the same filename is kept, and records whose content
+    hash doesn't match are rejected.
+
+    Args:
+        bundle_path: Bundle written by export_bundle
+        interim_dir: Directory holding the interim results
+
+    Returns:
+        Dictionary with 'imported', 'duplicates', 'conflicts', 'corrupt', 'tool_calls' and
+        'tool_call_duplicates' counts
+
+    Raises:
+        ValueError: If the file is not a cache bundle of a supported version
+    """
+    read_manifest(bundle_path)
+    ensure_index(interim_dir)
+    local = list_entries(interim_dir)
+    local_cache_keys: dict[str, float] = {}
+    for entry in local.values():
+        if entry["cache_key"] is not None:
+            local_cache_keys[entry["cache_key"]] = max(local_cache_keys.get(entry["cache_key"], 0.0), entry["created_at"])
+    counts = {"imported": 0, "duplicates": 0, "conflicts": 0, "corrupt": 0, "tool_calls": 0, "tool_call_duplicates": 0}
+
+    bundle = sqlite3.connect(f"file:{bundle_path}?mode=ro", uri=True)
+    try:
+        for filename, agent_name, created_at, cache_key, config_hash, expected_hash, content in bundle.execute(
+            "SELECT filename, agent_name, created_at, cache_key, config_hash, content_hash, content FROM results"
+        ):
+            try:
+                text = zlib.decompress(content).decode("utf-8")
+            except (zlib.error, UnicodeDecodeError):
+                counts["corrupt"] += 1
+                continue
+            if content_hash(text) != expected_hash:
+                counts["corrupt"] += 1
+                continue
+            if filename in local:
+                local_text = read_result_texts([filename], interim_dir).get(filename)
+                if local_text is not None and content_hash(local_text) == expected_hash:
+                    counts["duplicates"] += 1
+                else:
+                    counts["conflicts"] += 1
+                continue
+            if cache_key is not None and local_cache_keys.get(cache_key, -1.0) >= created_at:
+                # The same question is answered locally by an answer at least as fresh
+                counts["duplicates"] += 1
+                continue
+            query, result = parse_result_text(text)
+            store_result(filename, agent_name, query, result, text, cache_key=cache_key, config_hash=config_hash,
+                         interim_dir=interim_dir, created_at=created_at)
+            counts["imported"] += 1
+
+        rows = bundle.execute(
+            "SELECT content_hash, key, server, tool, arguments, content, created_at, expires_at FROM tool_calls "
+            "WHERE expires_at >= ?", (time.time(),)
+        ).fetchall()
+    finally:
+        bundle.close()
+
+    if rows:
+        with connect_tool_cache(interim_dir) as connection:
+            for expected_hash, key, server, tool, arguments, content, created_at, expires_at in rows:
+                try:
+                    valid = content_hash(zlib.decompress(content).decode("utf-8")) == expected_hash
+                except (zlib.error, UnicodeDecodeError):
+                    valid = False
+                if not valid:
+                    counts["corrupt"] += 1
+                    continue
+                # Keep whichever copy of a tool call lives longer
+                cursor = connection.execute(
+                    "INSERT INTO tool_calls (key, server, tool, arguments, content, created_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET content = excluded.content, created_at = excluded.created_at, "
+                    "expires_at = excluded.expires_at WHERE excluded.expires_at > tool_calls.expires_at",
+                    (key, server, tool, arguments, content, created_at, expires_at),
+                )
+                if cursor.rowcount:
+                    counts["tool_calls"] += 1
+                else:
+                    counts["tool_call_duplicates"] += 1
+    return counts
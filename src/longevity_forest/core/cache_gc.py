@@ -0,0 +1,144 @@
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from longevity_forest.config.cache import AGENT_RETENTION_SECONDS, CACHE_MAX_BYTES, DEFAULT_RETENTION_SECONDS
+from longevity_forest.core.interim_index import (
+    INTERIM_DIR,
+    agent_name_from_filename,
+    compact_packs,
+    list_entries,
+    remove_entries,
+)
+
+
+RESULT_SUFFIX = "_result.txt"
+MEMORY_SUFFIX = ".yaml"
+
+
+def retention_for_agent(agent_name: str) -> float:
+    """Return how long in seconds results of the agent are kept in the interim directory."""
+    return AGENT_RETENTION_SECONDS.get(agent_name, DEFAULT_RETENTION_SECONDS)
+
+
+def _unit_stem(filename: str) -> Optional[str]:
+    # A result file and the memory dump of the same call share the "<agent>_<timestamp>" stem
+    if filename.endswith(RESULT_SUFFIX):
+        return filename[: -len(RESULT_SUFFIX)]
+    if filename.endswith(MEMORY_SUFFIX):
+        return filename[: -len(MEMORY_SUFFIX)]
+    return None
+
+
+def collect_cache_units(interim_dir: Path = INTERIM_DIR) -> list[dict[str, Any]]:
+    """Group interim results and files into eviction units, one per expert call.
+
+    Args:
+        interim_dir: Directory holding the interim results
+
+    Returns:
+        List of dictionaries with 'stem', 'agent_name', 'files' (loose files to delete), 'size',
+        'created_at', 'last_accessed' and 'result_filename' (None for memory dumps without a result)
+    """
+    if not interim_dir.exists():
+        return []
+    entries = list_entries(interim_dir)
+
+    units: dict[str, dict[str, Any]] = {}
+
+    def unit_for(filename: str, created_at: float) -> dict[str, Any]:
+        return units.setdefault(_unit_stem(filename), {
+            "stem": _unit_stem(filename),
+            "agent_name": agent_name_from_filename(filename),
+            "files": [],
+            "size": 0,
+            "created_at": created_at,
+            "last_accessed": created_at,
+            "result_filename": None,
+        })
+
+    # Packed results have no file of their own, their size is the record size in the pack
+    for filename, entry in entries.items():
+        if not entry["packed"] or _unit_stem(filename) is None:
+            continue
+        unit = unit_for(filename, entry["created_at"])
+        unit["size"] += entry["size"]
+        unit["result_filename"] = filename
+        unit["created_at"] = entry["created_at"]
+        unit["last_accessed"] = max(unit["last_accessed"], entry["last_accessed"] or entry["created_at"])
+
+    for filepath in interim_dir.iterdir():
+        stem = _unit_stem(filepath.name)
+        if stem is None or not filepath.is_file():
+            continue
+        stat = filepath.stat()
+        unit = unit_for(filepath.name, stat.st_mtime)
+        unit["files"].append(filepath)
+        unit["size"] += stat.st_size
+        unit["created_at"] = min(unit["created_at"], stat.st_mtime)
+        unit["last_accessed"] = max(unit["last_accessed"], stat.st_mtime)
+        if filepath.name.endswith(RESULT_SUFFIX):
+            unit["result_filename"] = filepath.name
+            entry = entries.get(filepath.name)
+            if entry is not None:
+                unit["created_at"] = entry["created_at"]
+                if entry["last_accessed"] is not None:
+                    unit["last_accessed"] = max(unit["last_accessed"], entry["last_accessed"])
+    return list(units.values())
+
+
+def collect_garbage(
+    interim_dir: Path = INTERIM_DIR,
+    max_bytes: Optional[int] = CACHE_MAX_BYTES,
+    dry_run: bool = False,
+) -> dict[str, int]:
+    """Evict expired interim results, then least recently used ones until the size budget is met.
+
+    Args:
+        interim_dir: Directory holding the interim results
+        max_bytes: Size budget of the interim files (None disables size-based eviction)
+        dry_run: Only report what would be removed
+
+    Returns:
+        Dictionary with 'expired', 'evicted', 'removed_results', 'removed_bytes', 'remaining_bytes'
+        and 'compacted_bytes' (dead pack space reclaimed)
+    """
+    now = time.time()
+    units = collect_cache_units(interim_dir)
+
+    expired = [unit for unit in units if now - unit["created_at"] > retention_for_agent(unit["agent_name"])]
+    expired_stems = {unit["stem"] for unit in expired}
+    kept = sorted(
+        (unit for unit in units if unit["stem"] not in expired_stems),
+        key=lambda unit: unit["last_accessed"],
+    )
+
+    remaining_bytes = sum(unit["size"] for unit in kept)
+    evicted = []
+    if max_bytes is not None:
+        # Oldest access first
+        for unit in kept:
+            if remaining_bytes <= max_bytes:
+                break
+            evicted.append(unit)
+            remaining_bytes -= unit["size"]
+
+    removed = expired + evicted
+    stats = {
+        "expired": len(expired),
+        "evicted": len(evicted),
+        "removed_results": len(removed),
+        "removed_bytes": sum(unit["size"] for unit in removed),
+        "remaining_bytes": remaining_bytes,
+        "compacted_bytes": 0,
+    }
+    if dry_run:
+        return stats
+
+    # Drop index rows first so a concurrent reader never gets a filename whose file is gone
+    remove_entries([unit["result_filename"] for unit in removed if unit["result_filename"]], interim_dir)
+    for unit in removed:
+        for filepath in unit["files"]:
+            filepath.unlink(missing_ok=True)
+    stats["compacted_bytes"] = compact_packs(interim_dir)
+    return stats
@@ -0,0 +1,176 @@
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from just_agents.base_memory import BaseMemory
+from just_agents.data_classes import Role
+
+
+CHECKPOINT_DIR = Path("data/checkpoints")
+STATE_FILENAME = "state.json"
+MESSAGES_FILENAME = "messages.jsonl"
+
+# Stages of a gene analysis run
+STARTED = "started"        # the initial query is running
+CONTINUING = "continuing"  # the initial query returned, continuations until REPORT_END
+COMPLETE = "complete"      # REPORT_END found
+
+
+def new_run_id(gene_name: str) -> str:
+    """Return a fresh run id like NRF2_20250101_120000."""
+    return f"{gene_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+
+def _drop_incomplete_tool_calls(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    # A run killed while tools were executing leaves tool calls without results, which the LLM
+    # APIs reject; drop the last assistant turn if any of its calls has no result yet
+    for index in range(len(messages) - 1, -1, -1):
+        message = messages[index]
+        if message.get("role") == Role.assistant and message.get("tool_calls"):
+            answered = {m.get("tool_call_id") for m in messages[index + 1:] if m.get("role") == Role.tool}
+            if any(call.get("id") not in answered for call in message["tool_calls"]):
+                return messages[:index]
+            return messages
+    return messages
+
+
+class RunCheckpoint:
+    """On-disk checkpoint of one gene analysis run: the query agent's conversation and the partial report.
+
+    Messages are appended to messages.jsonl as the agent's memory receives them (every LLM turn and
+    tool result), the stage and partial report are rewritten to state.json after every query.
+    """
+
+    def __init__(self, run_id: str, checkpoint_dir: Path = CHECKPOINT_DIR):
+        self.run_id = run_id
+        self.path = checkpoint_dir / run_id
+        self.state: dict[str, Any] = {}
+        self._memory: Optional[BaseMemory] = None
+
+    @classmethod
+    def create(cls, run_id: str, gene_name: str, checkpoint_dir: Path = CHECKPOINT_DIR) -> "RunCheckpoint":
+        """Start a new checkpoint, replacing an existing one with the same run id."""
+        checkpoint = cls(run_id, checkpoint_dir)
+        if checkpoint.path.exists():
+            shutil.rmtree(checkpoint.path)
+        checkpoint.path.mkdir(parents=True)
+        checkpoint.state = {
+            "run_id": run_id,
+            "gene_name": gene_name,
+            "stage": STARTED,
+            "partial_result": "",
+            "continuation_count": 0,
+            "created_at": time.time(),
+            "updated_at": time.time(),
+        }
+        checkpoint._write_state()
+        (checkpoint.path / MESSAGES_FILENAME).touch()
+        return checkpoint
+
+    @classmethod
+    def load(cls, run_id: str, checkpoint_dir: Path = CHECKPOINT_DIR) -> "RunCheckpoint":
+        """Open an existing checkpoint.
+
+        Raises:
+            FileNotFoundError: If there is no checkpoint with this run id
+        """
+        checkpoint = cls(run_id, checkpoint_dir)
+        state_path = checkpoint.path / STATE_FILENAME
+        if not state_path.exists():
+            raise FileNotFoundError(f"No checkpoint for run {run_id} in {checkpoint_dir}")
+        checkpoint.state = json.loads(state_path.read_text(encoding="utf-8"))
+        return checkpoint
+
+    @classmethod
+    def exists(cls, run_id: str, checkpoint_dir: Path = CHECKPOINT_DIR) -> bool:
+        """Tell whether a checkpoint with this run id exists."""
+        return (checkpoint_dir / run_id / STATE_FILENAME).exists()
+
+    @property
+    def gene_name(self) -> str:
+        return self.state["gene_name"]
+
+    @property
+    def stage(self) -> str:
+        return self.state["stage"]
+
+    def _write_state(self) -> None:
+        # Written to a temporary file first, so a crash never leaves a truncated state behind
+        tmp_path = self.path / (STATE_FILENAME + ".tmp")
+        tmp_path.write_text(json.dumps(self.state, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.path / STATE_FILENAME)
+
+    def save_progress(self, stage: str, partial_result: str, continuation_count: int) -> None:
+        """Record the stage of the run and the report text produced so far."""
+        self.state.update(
+            stage=stage,
+            partial_result=partial_result,
+            continuation_count=continuation_count,
+            updated_at=time.time(),
+        )
+        self._write_state()
+
+    def _append_message(self, message: dict[str, Any]) -> None:
+        # System prompts are re-sent by the agent on every query and never restored
+        if message.get("role") == Role.system:
+            return
+        with open(self.path / MESSAGES_FILENAME, "a", encoding="utf-8") as f:
+            f.write(json.dumps(message, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def record_messages(self, messages: list[dict[str, Any]]) -> None:
+        """Append messages that are already in the memory when checkpointing starts."""
+        for message in messages:
+            self._append_message(message)
+
+    def attach(self, memory: BaseMemory) -> None:
+        """Checkpoint every message the memory receives from now on."""
+        self._memory = memory
+        memory.add_on_message(self._append_message)
+
+    def detach(self) -> None:
+        """Stop checkpointing messages."""
+        if self._memory is not None:
+            # BaseMemory.remove_on_message calls a method that doesn't exist, remove the handler directly
+            for handlers in self._memory._on_message.values():
+                while self._append_message in handlers:
+                    handlers.remove(self._append_message)
+            self._memory = None
+
+    def restore_messages(self) -> list[dict[str, Any]]:
+        """Return the checkpointed conversation, without a trailing turn whose tool calls have no results."""
+        messages = []
+        with open(self.path / MESSAGES_FILENAME, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    messages.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # The last line can be cut off by a crash in the middle of a write
+                    break
+        return _drop_incomplete_tool_calls(messages)
+
+    def discard(self) -> None:
+        """Delete the checkpoint, e.g. once the report has been saved."""
+        self.detach()
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def list_checkpoints(checkpoint_dir: Path = CHECKPOINT_DIR) -> list[dict[str, Any]]:
+    """Return the states of all checkpoints, most recently updated first."""
+    if not checkpoint_dir.exists():
+        return []
+    states = []
+    for state_path in checkpoint_dir.glob(f"*/{STATE_FILENAME}"):
+        try:
+            states.append(json.loads(state_path.read_text(encoding="utf-8")))
+        except (OSError, json.JSONDecodeError):
+            continue
+    return sorted(states, key=lambda state: state.get("updated_at", 0), reverse=True)
@@ -0,0 +1,411 @@
+import json
+import random
+import re
+import sqlite3
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from just_agents.just_bus import JustLogBus
+
+from longevity_forest.config.design import (
+    DESIGN_CALL_TIMEOUT_SECONDS,
+    DESIGN_CONTACTS_ARGUMENT,
+    DESIGN_CONTACTS_TOOL,
+    DESIGN_JOBS_PATH,
+    DESIGN_MAX_CONCURRENT,
+    DESIGN_MCP_CONFIG,
+    DESIGN_NAME_ARGUMENT,
+    DESIGN_POLL_INITIAL_SECONDS,
+    DESIGN_POLL_MAX_SECONDS,
+    DESIGN_SEQUENCE_MCP_CONFIG,
+    DESIGN_SEQUENCE_TOOL,
+    DESIGN_STATUS_TOOL,
+    DESIGN_SUBMIT_TOOL,
+    DESIGN_TARGET_ARGUMENT,
+    DESIGN_TOOL_DEFAULTS,
+)
+from longevity_forest.core.mcp_tools import call_mcp_tool, list_mcp_tool_names, parse_tool_content
+
+
+PENDING = "pending"    # not yet sent to the server
+RUNNING = "running"    # submitted, polled until the server reports an outcome
+DONE = "done"
+FAILED = "failed"
+
+# Server job states that mean the design is finished
+SERVER_DONE_STATES = {"completed", "complete", "done", "succeeded", "success"}
+SERVER_FAILED_STATES = {"failed", "error", "cancelled", "canceled"}
+# Consecutive failed status polls before a design is given up, e.g. after the server lost the job
+MAX_POLL_ERRORS = 5
+# Seconds between checks of blocking design calls, so progress is reported while they run
+BLOCKING_CHECK_SECONDS = 5.0
+
+AMINO_ACIDS = re.compile(r"^[ACDEFGHIKLMNPQRSTVWY]{20,}$")
+
+DESIGN_JOBS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS designs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    target TEXT NOT NULL,
+    tool TEXT NOT NULL,
+    arguments TEXT NOT NULL,
+    state TEXT NOT NULL,
+    server_job_id TEXT,
+    result TEXT,
+    error TEXT,
+    polls INTEGER NOT NULL DEFAULT 0,
+    poll_errors INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    submitted_at REAL,
+    finished_at REAL,
+    next_poll_at REAL
+);
+CREATE INDEX IF NOT EXISTS designs_run_state ON designs (run_id, state);
+"""
+
+DESIGN_COLUMNS = (
+    "id", "run_id", "target", "tool", "arguments", "state", "server_job_id", "result", "error", "polls",
+    "poll_errors", "created_at", "updated_at", "submitted_at", "finished_at", "next_poll_at",
+)
+
+
+@contextmanager
+def connect_designs(jobs_path: Path = DESIGN_JOBS_PATH) -> Iterator[sqlite3.Connection]:
+    """Open the design jobs database, creating the schema if needed, and commit on exit."""
+    jobs_path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(jobs_path, timeout=30.0)
+    try:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(DESIGN_JOBS_SCHEMA)
+        yield connection
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def _design(row: tuple) -> dict[str, Any]:
+    design = dict(zip(DESIGN_COLUMNS, row))
+    design["arguments"] = json.loads(design["arguments"])
+    if design["result"] is not None:
+        design["result"] = json.loads(design["result"])
+    return design
+
+
+def new_design_run_id(target: str) -> str:
+    """Return a fresh design run id like KLF6_20250101_120000 (sequences are shortened to their start)."""
+    label = re.sub(r"[^A-Za-z0-9_.-]", "_", target[:12])
+    return f"{label}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+
+def is_protein_sequence(target: str) -> bool:
+    """Tell whether a target is an amino acid sequence rather than a gene name."""
+    return bool(AMINO_ACIDS.match(target.strip().upper()))
+
+
+def _find_sequence(value: Any) -> Optional[str]:
+    # UniProt entries keep the sequence as {"sequence": {"value": "MKT..."}} or {"sequence": "MKT..."}
+    if isinstance(value, dict):
+        sequence = value.get("sequence")
+        if isinstance(sequence, dict):
+            sequence = sequence.get("value")
+        if isinstance(sequence, str) and is_protein_sequence(sequence):
+            return sequence.strip().upper()
+        values = value.values()
+    elif isinstance(value, list):
+        values = value
+    else:
+        return None
+    for item in values:
+        sequence = _find_sequence(item)
+        if sequence is not None:
+            return sequence
+    return None
+
+
+def resolve_target_sequence(target: str, timeout: float = 120.0) -> str:
+    """Return the protein sequence of a target: the target itself if it is a sequence, else its UniProt sequence.
+
+    Raises:
+        RuntimeError: If the lookup fails
+        ValueError: If the UniProt entry has no sequence
+    """
+    if is_protein_sequence(target):
+        return target.strip().upper()
+    result = call_mcp_tool(DESIGN_SEQUENCE_MCP_CONFIG, DESIGN_SEQUENCE_TOOL,
+                           {"gene_symbol": target, "species": "9606"}, timeout=timeout)
+    if result.error_code != 0:
+        raise RuntimeError(f"{DESIGN_SEQUENCE_TOOL} failed for {target}: {result.content[:200]}")
+    sequence = _find_sequence(parse_tool_content(result.content))
+    if sequence is None:
+        raise ValueError(f"No protein sequence for {target} in the {DESIGN_SEQUENCE_TOOL} result")
+    return sequence
+
+
+def design_specs(
+    target: str,
+    sequence: str,
+    tools: list[str],
+    contact_sets: list[str],
+) -> list[tuple[str, dict[str, Any]]]:
+    """Build one design per tool and one contact-guided design per contact set.
+
+    Args:
+        target: Gene name or sequence, used to name the designs
+        sequence: Target protein sequence
+        tools: Design tools to run without contacts (e.g. ph_design_protein_binder, ph_chai_design_protein_binder)
+        contact_sets: Contact residues, one string per design (e.g. "A10,A25,A31")
+
+    Returns:
+        List of (tool name, tool arguments)
+    """
+    label = re.sub(r"[^A-Za-z0-9_]", "_", target[:12])
+    specs = []
+    for tool in tools:
+        arguments = {**DESIGN_TOOL_DEFAULTS.get(tool, {}), DESIGN_TARGET_ARGUMENT: sequence}
+        arguments[DESIGN_NAME_ARGUMENT] = f"{label}_{tool.removeprefix('ph_')}"
+        specs.append((tool, arguments))
+    for index, contacts in enumerate(contact_sets, start=1):
+        arguments = {**DESIGN_TOOL_DEFAULTS.get(DESIGN_CONTACTS_TOOL, {}), DESIGN_TARGET_ARGUMENT: sequence}
+        arguments[DESIGN_CONTACTS_ARGUMENT] = contacts
+        arguments[DESIGN_NAME_ARGUMENT] = f"{label}_contacts_{index}"
+        specs.append((DESIGN_CONTACTS_TOOL, arguments))
+    return specs
+
+
+def add_designs(
+    run_id: str,
+    target: str,
+    specs: list[tuple[str, dict[str, Any]]],
+    jobs_path: Path = DESIGN_JOBS_PATH,
+) -> list[int]:
+    """Record designs of a run as pending, before anything is sent to the server.
+
+    Returns:
+        Ids of the new designs
+    """
+    now = time.time()
+    ids = []
+    with connect_designs(jobs_path) as connection:
+        for tool, arguments in specs:
+            cursor = connection.execute(
+                "INSERT INTO designs (run_id, target, tool, arguments, state, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (run_id, target, tool, json.dumps(arguments), PENDING, now, now),
+            )
+            ids.append(cursor.lastrowid)
+    return ids
+
+
+def list_designs(run_id: Optional[str] = None, jobs_path: Path = DESIGN_JOBS_PATH) -> list[dict[str, Any]]:
+    """Return the designs of a run (all runs if None), oldest first."""
+    with connect_designs(jobs_path) as connection:
+        if run_id is None:
+            rows = connection.execute(f"SELECT {', '.join(DESIGN_COLUMNS)} FROM designs ORDER BY id").fetchall()
+        else:
+            rows = connection.execute(
+                f"SELECT {', '.join(DESIGN_COLUMNS)} FROM designs WHERE run_id = ? ORDER BY id", (run_id,)
+            ).fetchall()
+    return [_design(row) for row in rows]
+
+
+def list_design_runs(jobs_path: Path = DESIGN_JOBS_PATH) -> list[dict[str, Any]]:
+    """Summarize every design run: target, design counts by state and last update, most recent first."""
+    with connect_designs(jobs_path) as connection:
+        rows = connection.execute(
+            "SELECT run_id, target, state, COUNT(*), MAX(updated_at) FROM designs GROUP BY run_id, target, state"
+        ).fetchall()
+    runs: dict[str, dict[str, Any]] = {}
+    for run_id, target, state, count, updated_at in rows:
+        run = runs.setdefault(run_id, {"run_id": run_id, "target": target, PENDING: 0, RUNNING: 0,
+                                       DONE: 0, FAILED: 0, "updated_at": 0.0})
+        run[state] = count
+        run["updated_at"] = max(run["updated_at"], updated_at)
+    return sorted(runs.values(), key=lambda run: run["updated_at"], reverse=True)
+
+
+def _update(design_id: int, jobs_path: Path, **fields: Any) -> None:
+    fields["updated_at"] = time.time()
+    if "result" in fields and fields["result"] is not None:
+        fields["result"] = json.dumps(fields["result"], default=str)
+    assignments = ", ".join(f"{name} = ?" for name in fields)
+    with connect_designs(jobs_path) as connection:
+        connection.execute(f"UPDATE designs SET {assignments} WHERE id = ?", (*fields.values(), design_id))
+
+
+def poll_delay(polls: int, initial: float = DESIGN_POLL_INITIAL_SECONDS, maximum: float = DESIGN_POLL_MAX_SECONDS) -> float:
+    """Seconds until the next status poll: doubling from initial up to maximum, with jitter so runs spread out."""
+    return min(initial * 2 ** polls, maximum) * random.uniform(1.0, 1.25)
+
+
+def server_has_job_tools(mcp_config: dict, timeout: float = 60.0) -> bool:
+    """Tell whether the design server offers DESIGN_SUBMIT_TOOL and DESIGN_STATUS_TOOL."""
+    names = set(list_mcp_tool_names(mcp_config, timeout=timeout))
+    return DESIGN_SUBMIT_TOOL in names and DESIGN_STATUS_TOOL in names
+
+
+def _submit(design: dict[str, Any], mcp_config: dict, jobs_path: Path, poll_initial: float) -> None:
+    result = call_mcp_tool(mcp_config, DESIGN_SUBMIT_TOOL,
+                           {"tool_name": design["tool"], "arguments": design["arguments"]}, timeout=120.0)
+    value = parse_tool_content(result.content) if result.error_code == 0 else None
+    job_id = value.get("job_id") if isinstance(value, dict) else None
+    now = time.time()
+    if job_id is None:
+        _update(design["id"], jobs_path, state=FAILED, finished_at=now,
+                error=f"{DESIGN_SUBMIT_TOOL} failed: {result.content[:500]}")
+        return
+    _update(design["id"], jobs_path, state=RUNNING, server_job_id=str(job_id), submitted_at=now,
+            polls=0, poll_errors=0, next_poll_at=now + poll_initial)
+    JustLogBus().info(f"Submitted design {design['id']} as server job {job_id}",
+                      source="design_jobs",
+                      action="design_jobs.submit",
+                      run_id=design["run_id"],
+                      tool_name=design["tool"],
+                      server_job_id=str(job_id))
+
+
+def _poll(design: dict[str, Any], mcp_config: dict, jobs_path: Path, poll_initial: float, poll_max: float) -> None:
+    result = call_mcp_tool(mcp_config, DESIGN_STATUS_TOOL, {"job_id": design["server_job_id"]}, timeout=120.0)
+    value = parse_tool_content(result.content) if result.error_code == 0 else None
+    now = time.time()
+    polls = design["polls"] + 1
+    if not isinstance(value, dict):
+        poll_errors = design["poll_errors"] + 1
+        if poll_errors >= MAX_POLL_ERRORS:
+            _update(design["id"], jobs_path, state=FAILED, finished_at=now, polls=polls, poll_errors=poll_errors,
+                    error=f"{DESIGN_STATUS_TOOL} failed {poll_errors} times: {result.content[:500]}")
+        else:
+            _update(design["id"], jobs_path, polls=polls, poll_errors=poll_errors,
+                    next_poll_at=now + poll_delay(polls, poll_initial, poll_max))
+        return
+    status = str(value.get("status", "")).lower()
+    if status in SERVER_DONE_STATES:
+        _update(design["id"], jobs_path, state=DONE, finished_at=now, polls=polls, poll_errors=0,
+                result=value.get("result"))
+    elif status in SERVER_FAILED_STATES:
+        _update(design["id"], jobs_path, state=FAILED, finished_at=now, polls=polls, poll_errors=0,
+                error=str(value.get("error") or status))
+    else:
+        _update(design["id"], jobs_path, polls=polls, poll_errors=0,
+                next_poll_at=now + poll_delay(polls, poll_initial, poll_max))
+
+
+def _call_blocking(design: dict[str, Any], mcp_config: dict, jobs_path: Path, timeout: float) -> None:
+    try:
+        result = call_mcp_tool(mcp_config, design["tool"], design["arguments"], timeout=timeout)
+    except Exception as e:
+        _update(design["id"], jobs_path, state=FAILED, finished_at=time.time(), error=f"{type(e).__name__}: {e}")
+        return
+    if result.error_code != 0:
+        _update(design["id"], jobs_path, state=FAILED, finished_at=time.time(), error=result.content[:2000])
+    else:
+        _update(design["id"], jobs_path, state=DONE, finished_at=time.time(), result=parse_tool_content(result.content))
+
+
+def _next_polls(run_id: str, jobs_path: Path) -> list[tuple]:
+    with connect_designs(jobs_path) as connection:
+        return connection.execute(
+            "SELECT next_poll_at FROM designs WHERE run_id = ? AND state = ? AND next_poll_at IS NOT NULL",
+            (run_id, RUNNING),
+        ).fetchall()
+
+
+def run_designs(
+    run_id: str,
+    mcp_config: Optional[dict] = None,
+    max_concurrent: int = DESIGN_MAX_CONCURRENT,
+    poll_initial: float = DESIGN_POLL_INITIAL_SECONDS,
+    poll_max: float = DESIGN_POLL_MAX_SECONDS,
+    call_timeout: float = DESIGN_CALL_TIMEOUT_SECONDS,
+    jobs_path: Path = DESIGN_JOBS_PATH,
+    on_update: Optional[Callable[[list[dict[str, Any]]], None]] = None,
+) -> list[dict[str, Any]]:
+    """Run the designs of a run on the server until every one is done or failed.
+
+    With server job tools, at most max_concurrent designs are submitted at a time and each is polled
+    with exponential backoff; the server job ids are stored, so a run interrupted on the client side
+    is picked up again by calling this with the same run id. Servers without job tools get one
+    blocking call per design from max_concurrent client threads; designs that were running when the
+    client died are sent again.
+
+    Args:
+        run_id: Design run, see add_designs
+        mcp_config: Design server config (defaults to DESIGN_MCP_CONFIG)
+        max_concurrent: Designs running on the server at the same time
+        poll_initial: Seconds before the first status poll
+        poll_max: Maximum seconds between status polls
+        call_timeout: Maximum seconds of a blocking design call
+        jobs_path: Design jobs database
+        on_update: Called with the designs of the run whenever a design changes state
+
+    Returns:
+        The designs of the run
+    """
+    mcp_config = mcp_config or DESIGN_MCP_CONFIG
+    use_job_tools = server_has_job_tools(mcp_config)
+    with connect_designs(jobs_path) as connection:
+        # Without a server job id there is nothing to poll, the design has to be sent again
+        connection.execute(
+            "UPDATE designs SET state = ?, updated_at = ? WHERE run_id = ? AND state = ? AND server_job_id IS NULL",
+            (PENDING, time.time(), run_id, RUNNING),
+        )
+
+    executor = None if use_job_tools else ThreadPoolExecutor(max_workers=max(1, max_concurrent))
+    futures: dict[Future, int] = {}
+    last_states = None
+    try:
+        while True:
+            designs = list_designs(run_id, jobs_path)
+            states = [design["state"] for design in designs]
+            if on_update is not None and states != last_states:
+                on_update(designs)
+            last_states = states
+            running = [design for design in designs if design["state"] == RUNNING]
+            pending = [design for design in designs if design["state"] == PENDING]
+            if not running and not pending:
+                return designs
+
+            for design in pending[:max(0, max_concurrent - len(running))]:
+                if use_job_tools:
+                    _submit(design, mcp_config, jobs_path, poll_initial)
+                else:
+                    _update(design["id"], jobs_path, state=RUNNING, submitted_at=time.time())
+                    futures[executor.submit(_call_blocking, design, mcp_config, jobs_path, call_timeout)] = design["id"]
+
+            if use_job_tools:
+                now = time.time()
+                for design in running:
+                    if design["next_poll_at"] is None or design["next_poll_at"] <= now:
+                        _poll(design, mcp_config, jobs_path, poll_initial, poll_max)
+                next_polls = [row[0] for row in _next_polls(run_id, jobs_path)]
+                if next_polls:
+                    time.sleep(max(0.0, min(next_polls) - time.time()))
+            elif futures:
+                finished, _ = wait(list(futures), timeout=BLOCKING_CHECK_SECONDS, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    futures.pop(future)
+    finally:
+        if executor is not None:
+            # Blocking calls still running can't be cancelled, their designs are sent again on resume
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def design_results_markdown(designs: list[dict[str, Any]], max_chars: int = 4000) -> str:
+    """Render the designs of a run for the report prompt: tool, arguments without the sequence, and outcome."""
+    sections = []
+    for design in designs:
+        arguments = {key: value for key, value in design["arguments"].items() if key != DESIGN_TARGET_ARGUMENT}
+        outcome = json.dumps(design["result"], ensure_ascii=False, default=str) if design["state"] == DONE else design["error"]
+        outcome = outcome or ""
+        if len(outcome) > max_chars:
+            outcome = outcome[:max_chars] + " …"
+        sections.append(
+            f"### Design {design['id']}: {design['tool']} ({design['state']})\n\n"
+            f"Arguments: `{json.dumps(arguments, ensure_ascii=False)}`\n\n"
+            f"```\n{outcome}\n```"
+        )
+    return "\n\n".join(sections)
@@ -0,0 +1,256 @@
+import hashlib
+import json
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Any, Optional
+
+from longevity_forest.config.cache import (
+    AGENT_CACHE_TTL_SECONDS,
+    CACHED_CONTEXT_TOKEN_BUDGET,
+    CHARS_PER_TOKEN,
+    DEFAULT_CACHE_TTL_SECONDS,
+    SIMILARITY_REUSE_THRESHOLD,
+)
+from longevity_forest.core.interim_index import (
+    INTERIM_DIR,
+    find_cached_entry,
+    parse_result_text,
+    read_result_text,
+    search_index,
+    touch_entries,
+)
+from longevity_forest.core.query_similarity import find_similar_query
+
+
+class CacheMode(str, Enum):
+    """How call_expert_agent uses the host-side cache of expert answers."""
+    off = "off"
+    read = "read"
+    write = "write"
+    readwrite = "readwrite"
+
+    @property
+    def can_read(self) -> bool:
+        return self in (CacheMode.read, CacheMode.readwrite)
+
+    @property
+    def can_write(self) -> bool:
+        return self in (CacheMode.write, CacheMode.readwrite)
+
+
+# Process-wide settings; call_expert_agent is invoked by the LLM as a tool, so they can't be passed as arguments
+_settings: dict[str, Any] = {
+    "mode": CacheMode.readwrite,
+    "ttl_seconds": None,
+    "similarity_threshold": SIMILARITY_REUSE_THRESHOLD,
+}
+
+
+def configure_expert_cache(
+    mode: CacheMode = CacheMode.readwrite,
+    ttl_seconds: Optional[float] = None,
+    similarity_threshold: Optional[float] = None,
+) -> None:
+    """Set the cache mode and optionally a TTL overriding the per-agent defaults.
+
+    Args:
+        mode: Whether cached answers are read, written, both or neither
+        ttl_seconds: Maximum age of a reusable answer for all agents (None uses config.cache per-agent TTLs)
+        similarity_threshold: Minimum similarity for reusing the answer to a near-duplicate query
+            (None uses config.cache.SIMILARITY_REUSE_THRESHOLD)
+    """
+    _settings["mode"] = CacheMode(mode)
+    _settings["ttl_seconds"] = ttl_seconds
+    _settings["similarity_threshold"] = (
+        similarity_threshold if similarity_threshold is not None else SIMILARITY_REUSE_THRESHOLD
+    )
+
+
+def get_expert_cache_settings() -> dict[str, Any]:
+    """Return the current settings as keyword arguments of configure_expert_cache (e.g. for worker processes)."""
+    return {
+        "mode": _settings["mode"],
+        "ttl_seconds": _settings["ttl_seconds"],
+        "similarity_threshold": _settings["similarity_threshold"],
+    }
+
+
+def get_cache_mode() -> CacheMode:
+    """Return the currently configured cache mode."""
+    return _settings["mode"]
+
+
+def get_similarity_threshold() -> float:
+    """Return the minimum similarity for reusing the answer to a near-duplicate query."""
+    return _settings["similarity_threshold"]
+
+
+def ttl_for_agent(agent_name: str) -> float:
+    """Return the maximum age in seconds of a reusable cached answer for the agent."""
+    if _settings["ttl_seconds"] is not None:
+        return _settings["ttl_seconds"]
+    return AGENT_CACHE_TTL_SECONDS.get(agent_name, DEFAULT_CACHE_TTL_SECONDS)
+
+
+def normalize_query(user_query: str) -> str:
+    """Normalize case and whitespace so trivially different phrasings share a key."""
+    return " ".join(user_query.lower().split())
+
+
+def agent_config_hash(agent: Any) -> str:
+    """Hash the parts of an agent's configuration that change its answers (model, prompt, tools).
+
+    Args:
+        agent: The agent instance
+
+    Returns:
+        Hex digest identifying the agent configuration
+    """
+    tools = getattr(agent, "tools", None) or {}
+    tool_names = sorted(tools.keys()) if isinstance(tools, dict) else sorted(str(tool) for tool in tools)
+    config = {
+        "class_qualname": getattr(agent, "class_qualname", None),
+        "llm_options": dict(getattr(agent, "llm_options", None) or {}),
+        "system_prompt": getattr(agent, "system_prompt", None),
+        "tools": tool_names,
+    }
+    payload = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def expert_cache_key(agent_name: str, user_query: str, config_hash: str) -> str:
+    """Build the content address of an expert answer.
+
+    Args:
+        agent_name: Shortname of the expert agent
+        user_query: The query sent to the agent
+        config_hash: Result of agent_config_hash for the agent
+
+    Returns:
+        Hex digest used as the cache key
+    """
+    payload = "\n".join([agent_name, normalize_query(user_query), config_hash])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def lookup_cached_response(
+    agent_name: str,
+    user_query: str,
+    config_hash: str,
+    interim_dir: Path = INTERIM_DIR,
+) -> Optional[tuple[str, str]]:
+    """Find a stored answer for exactly this agent, query and configuration that is still fresh.
+
+    Args:
+        agent_name: Shortname of the expert agent
+        user_query: The query sent to the agent
+        config_hash: Result of agent_config_hash for the agent
+        interim_dir: Directory holding the interim results
+
+    Returns:
+        Tuple of (filename, response) on a hit, None otherwise
+    """
+    key = expert_cache_key(agent_name, user_query, config_hash)
+    filename = find_cached_entry(key, min_created_at=time.time() - ttl_for_agent(agent_name), interim_dir=interim_dir)
+    if filename is None:
+        return None
+
+    response = read_cached_response(filename, interim_dir)
+    return (filename, response) if response is not None else None
+
+
+def closest_cached_query(
+    agent_name: str,
+    user_query: str,
+    config_hash: str,
+    interim_dir: Path = INTERIM_DIR,
+) -> Optional[tuple[str, str, float]]:
+    """Find the fresh cached query of the same agent configuration that is most similar to this one.
+
+    Args:
+        agent_name: Shortname of the expert agent
+        user_query: The query sent to the agent
+        config_hash: Result of agent_config_hash for the agent
+        interim_dir: Directory holding the interim results
+
+    Returns:
+        Tuple of (filename, cached query, similarity score), None if no candidate exists
+    """
+    return find_similar_query(
+        agent_name,
+        user_query,
+        config_hash,
+        min_created_at=time.time() - ttl_for_agent(agent_name),
+        interim_dir=interim_dir,
+    )
+
+
+def read_cached_response(filename: str, interim_dir: Path = INTERIM_DIR) -> Optional[str]:
+    """Read the stored agent response of a cached result, None if it is gone or unreadable."""
+    text = read_result_text(filename, interim_dir)
+    if text is None:
+        return None
+    _, response = parse_result_text(text)
+    touch_entries([filename], interim_dir)
+    return response
+
+
+def collect_cached_context(
+    search_term: str,
+    token_budget: int = CACHED_CONTEXT_TOKEN_BUDGET,
+    interim_dir: Path = INTERIM_DIR,
+) -> tuple[str, list[str]]:
+    """Select fresh cached expert answers mentioning the search term and fit them into a token budget.
+
+    Answers whose query names the term rank first, then newer answers; only the newest answer
+    per agent and normalized query is kept. The last answer that doesn't fit is truncated with
+    a pointer to read_results_by_filenames.
+
+    Args:
+        search_term: Term to look for, usually the gene name
+        token_budget: Approximate maximum number of tokens of the returned context
+        interim_dir: Directory holding the interim results
+
+    Returns:
+        Tuple of (context text, filenames included in it); empty text if nothing is cached
+    """
+    if token_budget <= 0:
+        return "", []
+
+    now = time.time()
+    needle = search_term.lower()
+    candidates = {}
+    for item in search_index(search_term, interim_dir):
+        agent_name = item["agent_name"]
+        if not agent_name or now - item["created_at"] > ttl_for_agent(agent_name):
+            continue
+        # Results come newest first, so the first one seen per query is kept
+        candidates.setdefault((agent_name, normalize_query(item["query"])), item)
+    ranked = sorted(
+        candidates.values(),
+        key=lambda item: (needle not in item["query"].lower(), -item["created_at"]),
+    )
+
+    char_budget = token_budget * CHARS_PER_TOKEN
+    blocks = []
+    filenames = []
+    for item in ranked:
+        response = read_cached_response(item["filename"], interim_dir)
+        if not response:
+            continue
+        header = f"--- {item['agent_name']} | {item['filename']} ---\nQuery: {item['query']}\nResponse:\n"
+        block = header + response
+        if len(block) > char_budget:
+            remaining = char_budget - len(header)
+            if remaining <= 0:
+                break
+            block = (header + response[:remaining] +
+                     f"\n[truncated, full text: read_results_by_filenames(['{item['filename']}'])]")
+        blocks.append(block)
+        filenames.append(item["filename"])
+        char_budget -= len(block)
+        if char_budget <= 0:
+            break
+
+    return "\n\n".join(blocks), filenames
@@ -2,13 +2,50 @@ from just_agents.just_bus import JustLogBus
 from just_agents.base_agent import BaseAgent
 from just_agents.base_memory import BaseMemory
 from just_agents.just_locator import JustAgentsLocator
+from concurrent.futures import ThreadPoolExecutor
+import threading
 from typing import Optional
 from pathlib import Path
 from datetime import datetime
 from longevity_forest.core.helpers import serialize_memory_to_yaml, serialize_content
+from longevity_forest.core.lazy_agents import get_lazy_agent
+from longevity_forest.config.cache import READ_RESULTS_MAX_CHARS
+from longevity_forest.config.llm import EXPERT_DEFAULT_MAX_CONCURRENT, EXPERT_MAX_CONCURRENT, EXPERT_PARALLEL_MAX_WORKERS
+from longevity_forest.core.interim_index import (
+    INTERIM_DIR,
+    QUERY_MARKER,
+    RESULT_MARKER,
+    parse_result_text,
+    read_result_texts,
+    search_index,
+    touch_entries,
+)
+from longevity_forest.core.expert_cache import (
+    agent_config_hash,
+    closest_cached_query,
+    expert_cache_key,
+    get_cache_mode,
+    get_similarity_threshold,
+    lookup_cached_response,
+    read_cached_response,
+)
 from just_agents.data_classes import Message
 
 
+# An agent instance keeps a single conversation memory, so calls to the same instance are serialized
+_agent_locks: dict[int, threading.Lock] = {}
+_agent_locks_guard = threading.Lock()
+
+
+def _agent_lock(agent: BaseAgent) -> threading.Lock:
+    with _agent_locks_guard:
+        return _agent_locks.setdefault(id(agent), threading.Lock())
+
+
+def agent_concurrency_limit(agent_name: str) -> int:
+    """Return how many calls to the agent with this shortname may run at once, each on its own instance."""
+    return max(1, EXPERT_MAX_CONCURRENT.get(agent_name, EXPERT_DEFAULT_MAX_CONCURRENT))
+
 
 def call_expert_agent(agent_name: str, user_query: str, agent_codename: Optional[str] = None, call_the_first_instance: bool = True) -> str:
     """
@@ -26,6 +63,13 @@ def call_expert_agent(agent_name: str, user_query: str, agent_codename: Optional
     locator = JustAgentsLocator()
     log_bus = JustLogBus()
 
+    lazy_agent = get_lazy_agent(agent_name)
+    if lazy_agent is not None and agent_codename is None:
+        # Sub-agents registered by load_agents are built on first use, and concurrent calls each
+        # get their own instance, up to agent_concurrency_limit(agent_name) of them
+        with lazy_agent.checkout() as agent, _agent_lock(agent):
+            return _query_expert(agent, agent_name, user_query)
+
     agents = locator.get_agents_by_shortname(agent_name, bounding_class=BaseAgent)
     if not agents:
         return f"Agent with shortname {agent_name} not found"
@@ -50,17 +94,108 @@ def call_expert_agent(agent_name: str, user_query: str, agent_codename: Optional
         
         agent = locator.get_agent_by_codename(agent_codename)
     
+    # Held across the cache lookup too, so a concurrent identical call is answered from the cache
+    with _agent_lock(agent):
+        return _query_expert(agent, agent_name, user_query)
+
+
+def _query_expert(agent: BaseAgent, agent_name: str, user_query: str) -> str:
+    log_bus = JustLogBus()
+    cache_mode = get_cache_mode()
+    config_hash = agent_config_hash(agent)
+    
+    # Exact-hit cache: identical question to an identically configured agent skips the LLM and MCP calls
+    if cache_mode.can_read:
+        cached = lookup_cached_response(agent_name, user_query, config_hash)
+        if cached is not None:
+            filename, response = cached
+            print(f"✓ Cache hit for {agent_name}: {filename}")
+            log_bus.info(f"Cache hit for {agent_name}",
+                         source="call_expert_agent",
+                         action="expert_cache.hit",
+                         agent_name=agent_name,
+                         filename=filename)
+            return f"Agent {agent_name} response: {response}"
+        
+        # Near-duplicate cache: same agent and identifiers, differently worded question
+        similar = closest_cached_query(agent_name, user_query, config_hash)
+        if similar is not None:
+            filename, cached_query, score = similar
+            threshold = get_similarity_threshold()
+            log_bus.info(f"Closest cached query for {agent_name} scored {score:.3f}",
+                         source="call_expert_agent",
+                         action="expert_cache.similarity",
+                         agent_name=agent_name,
+                         user_query=user_query,
+                         cached_query=cached_query,
+                         filename=filename,
+                         score=score,
+                         threshold=threshold)
+            response = read_cached_response(filename) if score >= threshold else None
+            if response is not None:
+                print(f"✓ Similar cache hit for {agent_name} (score {score:.2f}): {filename}")
+                return (f"Agent {agent_name} response (reused cached answer to the equivalent query "
+                        f"\"{cached_query}\", similarity {score:.2f}): {response}")
+    
     response = agent.query(user_query)
     memory: BaseMemory = agent.memory
     memory.pretty_print_message(memory.last_message)
     
     # Serialize memory to YAML with query
     serialize_memory_to_yaml(agent_name, user_query, memory)
-    serialize_content(agent_name, user_query, response)
+    cache_key = expert_cache_key(agent_name, user_query, config_hash) if cache_mode.can_write else None
+    serialize_content(agent_name, user_query, response, cache_key=cache_key,
+                      config_hash=config_hash if cache_mode.can_write else None)
 
     return f"Agent {agent_name} response: {response}"
 
 
+def call_expert_agents_parallel(agent_names: list[str], queries: list[str]) -> str:
+    """
+    Call several expert sub-agents concurrently, queries[i] goes to agent_names[i]; responses are returned in the same order.
+
+    Calls run in parallel, each on its own agent instance; calls to one agent beyond its cap in
+    EXPERT_MAX_CONCURRENT (e.g. google_agent) wait for a free instance. Every response is cached
+    like a call_expert_agent response.
+
+    Args:
+        agent_names: Names of the agents to call, e.g. ["literature_agent", "structure_agent"]
+        queries: One query per agent name
+
+    Returns:
+        The numbered responses, or the error message
+    """
+    if len(agent_names) != len(queries):
+        return f"Got {len(agent_names)} agent names but {len(queries)} queries, pass exactly one query per agent name"
+    if not agent_names:
+        return "No agent calls given"
+
+    log_bus = JustLogBus()
+    log_bus.debug(f"Calling {len(agent_names)} expert agents in parallel",
+                  source="call_expert_agents_parallel",
+                  action="call_expert_agents_parallel.start",
+                  agent_names=agent_names,
+                  queries=queries)
+
+    # Calls beyond an agent's cap wait for a free instance on their own thread, so the calls to other
+    # agents behind them in the list still start at once
+    with ThreadPoolExecutor(max_workers=min(EXPERT_PARALLEL_MAX_WORKERS, len(agent_names))) as executor:
+        futures = [executor.submit(call_expert_agent, agent_name, user_query)
+                   for agent_name, user_query in zip(agent_names, queries)]
+        responses = []
+        for agent_name, future in zip(agent_names, futures):
+            try:
+                responses.append(future.result())
+            except Exception as e:
+                # One failing agent must not discard the answers of the others
+                responses.append(f"Agent {agent_name} failed: {type(e).__name__}: {e}")
+
+    return "\n\n".join(
+        f"=== {index}. {agent_name}: {user_query} ===\n{response}"
+        for index, (agent_name, user_query, response) in enumerate(zip(agent_names, queries, responses), start=1)
+    )
+
+
 def write_md_result(content: str) -> str:
     """Save markdown report to results directory.
     
@@ -87,6 +222,8 @@ def write_md_result(content: str) -> str:
 def grep_cache_full(search_term: str) -> list[dict[str, str]]:
     """Search cached result files for a search term and return filename, query, and result.
     
+    Uses the interim full-text index, so only the matching results are read from disk.
+    
     Args:
         search_term: Term to search for in result files (case-insensitive)
     
@@ -94,61 +231,22 @@ def grep_cache_full(search_term: str) -> list[dict[str, str]]:
         List of dictionaries with 'filename', 'query', and 'result' fields
     """
     results = []
-    interim_dir = Path("data/interim")
-    
-    if not interim_dir.exists():
-        return results
-    
-    # Find all _result.txt files
-    result_files = list(interim_dir.glob("*_result.txt"))
-    
-    for filepath in result_files:
-        try:
-            content = filepath.read_text(encoding="utf-8")
-            
-            # Case-insensitive search
-            if search_term.lower() not in content.lower():
-                continue
-            
-            # Extract query and result sections
-            query = ""
-            result = ""
-            
-            if "============ Agent query ==============" in content:
-                lines = content.split("\n")
-                in_query_section = False
-                in_result_section = False
-                query_lines = []
-                result_lines = []
-                
-                for line in lines:
-                    if "============ Agent query ==============" in line:
-                        in_query_section = True
-                        in_result_section = False
-                        continue
-                    elif "============ Result ==============" in line:
-                        in_query_section = False
-                        in_result_section = True
-                        continue
-                    
-                    if in_query_section:
-                        query_lines.append(line)
-                    elif in_result_section:
-                        result_lines.append(line)
-                
-                query = "\n".join(query_lines).strip()
-                result = "\n".join(result_lines).strip()
-            
-            results.append({
-                "filename": filepath.name,
-                "query": query,
-                "result": result
-            })
-            
-        except Exception as e:
-            # Skip files that can't be read
+    
+    filenames = [item["filename"] for item in search_index(search_term, INTERIM_DIR)]
+    texts = read_result_texts(filenames, INTERIM_DIR)
+    for filename in filenames:
+        # Skip results that can't be read
+        if filename not in texts:
             continue
+        query, result = parse_result_text(texts[filename])
+        
+        results.append({
+            "filename": filename,
+            "query": query,
+            "result": result
+        })
     
+    touch_entries([item["filename"] for item in results], INTERIM_DIR)
     return results
 
 def grep_cache_only_queries(search_term: str) -> list[dict[str, str]]:
@@ -161,47 +259,131 @@ def grep_cache_only_queries(search_term: str) -> list[dict[str, str]]:
         List of dictionaries with 'filename' and 'query' fields
     """
     print(f"[DEBUG] grep_cache_only_queries called with search_term: {search_term}")
-    full_results = grep_cache_full(search_term)
-    print(f"[DEBUG] grep_cache_full returned {len(full_results)} results")
-    # Remove 'result' field and keep only 'filename' and 'query'
-    results = []
-    for item in full_results:
-        if item["query"] is not None:
-            item.pop("result", None)
-            results.append(item)
-    print(f"[DEBUG] Filtered to {len(results)} results with non-None queries")
-    print(f"[DEBUG] grep_cache_only_queries returning: {results}")
+    # Queries are stored in the index itself, so no result file has to be opened here
+    results = [
+        {"filename": item["filename"], "query": item["query"]}
+        for item in search_index(search_term, INTERIM_DIR)
+    ]
+    print(f"[DEBUG] grep_cache_only_queries returning {len(results)} results: {results}")
     return results
 
-def read_results_by_filenames(filenames: list[str]) -> str:
-    """Read result from a file by filename.
+def _trim_tables(text: str, max_table_rows: int) -> str:
+    # Markdown tables keep their header and separator rows plus the first max_table_rows data rows
+    lines = []
+    table_rows = 0
+    omitted = 0
+    for line in text.split("\n") + [""]:
+        if line.lstrip().startswith("|"):
+            table_rows += 1
+            if table_rows <= max_table_rows + 2:
+                lines.append(line)
+            else:
+                omitted += 1
+            continue
+        if omitted:
+            lines.append(f"[{omitted} more table rows omitted]")
+        table_rows = 0
+        omitted = 0
+        lines.append(line)
+    return "\n".join(lines[:-1])
+
+
+def _render_result(text: str, sections: Optional[list[str]], max_table_rows: Optional[int]) -> str:
+    if sections is None and max_table_rows is None:
+        return text
+    query, result = parse_result_text(text)
+    if max_table_rows is not None:
+        result = _trim_tables(result, max_table_rows)
+    parts = []
+    if sections is None or "query" in sections:
+        parts.append(QUERY_MARKER + "\n" + query)
+    if sections is None or "result" in sections:
+        parts.append(RESULT_MARKER + "\n" + result)
+    return "\n".join(parts)
+
+
+def _parse_handle(handle: str) -> tuple[str, int]:
+    # "name_result.txt@1200" continues a truncated result from character 1200
+    filename, separator, offset = handle.rpartition("@")
+    if separator and offset.isdigit():
+        return filename, int(offset)
+    return handle, 0
+
+
+def read_results_by_filenames(
+    filenames: list[str],
+    max_chars: int = READ_RESULTS_MAX_CHARS,
+    sections: Optional[list[str]] = None,
+    max_table_rows: Optional[int] = None,
+) -> str:
+    """Read cached results by filename within a character budget, truncated results end with a "more available" handle.
+    
+    The budget is shared evenly between the results (unused share goes to the longer ones).
+    A truncated result ends with a "more available" handle like 'name_result.txt@12000';
+    pass it back in filenames, with the same sections and max_table_rows, to read the next part.
     
     Args:
-        filename: Name of the file to read
+        filenames: Result filenames (or "more available" handles) to read
+        max_chars: Maximum number of characters returned in total
+        sections: Parts of each result to return, "query" and/or "result" (default: both)
+        max_table_rows: Keep only the first N data rows of every markdown table (default: all rows)
     
     Returns:
-        Content of the file
+        The requested results, each preceded by a line with its filename
     """
+    log_bus = JustLogBus()
     print(f"[DEBUG] read_results_by_filenames called with {len(filenames)} filenames")
     print(f"[DEBUG] Filenames: {filenames}")
+    requests = [_parse_handle(handle) for handle in filenames]
+    texts = read_result_texts([filename for filename, _ in requests], INTERIM_DIR)
+    touch_entries(list(texts), INTERIM_DIR)
+    
+    views = {}
+    for filename, offset in requests:
+        if filename in texts:
+            views[(filename, offset)] = _render_result(texts[filename], sections, max_table_rows)[offset:]
+    
+    # Shortest first, so the share a short result doesn't need goes to the longer ones
+    allowance = {}
+    remaining = max(max_chars, 0)
+    for position, key in enumerate(sorted(views, key=lambda key: (len(views[key]), key))):
+        allowance[key] = min(len(views[key]), remaining // (len(views) - position))
+        remaining -= allowance[key]
+    
+    view_arguments = "".join(
+        f", {name}={value!r}" for name, value in (("sections", sections), ("max_table_rows", max_table_rows))
+        if value is not None
+    )
     contents = []
-    for filename in filenames:
-        filepath = Path("data/interim") / filename
-        print(f"[DEBUG] Checking filepath: {filepath}")
-        if not filepath.exists():
-            print(f"[DEBUG] File does not exist: {filepath}")
+    truncated = []
+    for filename, offset in requests:
+        key = (filename, offset)
+        if key not in views:
+            print(f"[DEBUG] Result does not exist: {filename}")
+            contents.append(f"=== {filename}: not found ===")
             continue
-        print(f"[DEBUG] Reading file: {filepath}")
-        contents.append(filepath.read_text(encoding="utf-8"))
-    print(f"[DEBUG] Successfully read {len(contents)} files")
+        view = views[key]
+        shown = view[:allowance[key]]
+        if len(shown) < len(view) and "\n" in shown:
+            # Cut at a line boundary so table rows and sequences stay whole
+            shown = shown[:shown.rindex("\n") + 1]
+        contents.append(f"=== {filename} ===\n{shown.rstrip()}")
+        if len(shown) < len(view):
+            end = offset + len(shown)
+            truncated.append(filename)
+            contents.append(f"[more available: {len(view) - len(shown)} characters, "
+                            f"continue with read_results_by_filenames(['{filename}@{end}']{view_arguments})]")
+    
     result = "\n".join(contents)
+    log_bus.info(f"read_results_by_filenames returned {len(result)} characters",
+                 source="read_results_by_filenames",
+                 action="read_results.returned",
+                 requested=len(filenames),
+                 found=len(views),
+                 returned_chars=len(result),
+                 max_chars=max_chars,
+                 sections=sections,
+                 max_table_rows=max_table_rows,
+                 truncated=truncated)
     print(f"[DEBUG] read_results_by_filenames returning {len(result)} characters")
     return result
-
-
-
-
-
-
-
-
@@ -1,7 +1,26 @@
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
+import sqlite3
 import yaml
 from just_agents.base_memory import BaseMemory
+from longevity_forest.core.interim_index import INTERIM_DIR, QUERY_MARKER, RESULT_MARKER, store_result
+
+# Appended to interim filenames, lets concurrent worker processes write results of the same agent
+# within the same second without overwriting each other
+_interim_suffix = ""
+
+
+def set_interim_suffix(suffix: str) -> None:
+    """Set a suffix appended to the timestamp of interim and report filenames written by this process."""
+    global _interim_suffix
+    _interim_suffix = f"_{suffix}" if suffix else ""
+
+
+def interim_stem(agent_name: str) -> str:
+    """Return the '<agent>_<timestamp>' stem shared by the memory dump and the result of an expert call."""
+    return f"{agent_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{_interim_suffix}"
+
 
 def save_result_to_markdown(result: str, gene_name: str) -> Path:
     """Save query result to a markdown file.
@@ -14,10 +33,10 @@ def save_result_to_markdown(result: str, gene_name: str) -> Path:
         Path to the saved markdown file
     """
     output_dir = Path("data/output")
-    output_dir.mkdir(exist_ok=True)
+    output_dir.mkdir(parents=True, exist_ok=True)
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{gene_name}_{timestamp}.md"
+    filename = f"{gene_name}_{timestamp}{_interim_suffix}.md"
     filepath = output_dir / filename
     
     filepath.write_text(result, encoding="utf-8")
@@ -39,11 +58,10 @@ def serialize_memory_to_yaml(agent_name: str, user_query: str, memory: BaseMemor
     Returns:
         Path to the saved YAML file
     """
-    output_dir = Path("data/interim")
+    output_dir = INTERIM_DIR
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{agent_name}_{timestamp}.yaml"
+    filename = f"{interim_stem(agent_name)}.yaml"
     filepath = output_dir / filename
     
     # Serialize memory using Pydantic 2+ method
@@ -63,26 +81,41 @@ def serialize_memory_to_yaml(agent_name: str, user_query: str, memory: BaseMemor
     
     return filepath
 
-def serialize_content(agent_name: str, user_query: str, content: str) -> Path:
-    """Serialize agent memory to a YAML file in results/interim folder.
+def serialize_content(
+    agent_name: str,
+    user_query: str,
+    content: str,
+    cache_key: Optional[str] = None,
+    config_hash: Optional[str] = None,
+) -> Path:
+    """Store agent result compressed in the interim result packs and add it to the cache index.
     
     Args:
         agent_name: Name of the agent
         user_query: The query sent to the agent
         content: The content to serialize
+        cache_key: Content address under which the result can be reused by call_expert_agent
+        config_hash: Hash of the agent configuration, lets near-duplicate queries reuse the result
         
     Returns:
-        Path to the saved YAML file
+        Path the result is addressed by (the filename used by the cache tools); it only exists
+        on disk if storing in a pack failed
     """
-    output_dir = Path("data/interim")
+    output_dir = INTERIM_DIR
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{agent_name}_{timestamp}_result.txt"
+    filename = f"{interim_stem(agent_name)}_result.txt"
     filepath = output_dir / filename
+    text = QUERY_MARKER + "\n" + user_query + "\n" + RESULT_MARKER + "\n" + content
     
-    filepath.write_text("============ Agent query ==============\n"+user_query+"\n============ Result ==============\n"+content, encoding="utf-8")
-    print(f"✓ Content serialized to: {filepath}")
+    try:
+        store_result(filename, agent_name, user_query, content, text,
+                     cache_key=cache_key, config_hash=config_hash, interim_dir=output_dir)
+        print(f"✓ Content serialized to: {filepath} (packed)")
+    except (sqlite3.Error, OSError) as e:
+        # Keep the result as a plain file, `forest cache reindex` or `forest cache migrate` will pick it up later
+        filepath.write_text(text, encoding="utf-8")
+        print(f"⚠ Failed to pack {filename}: {e}, saved as plain file {filepath}")
     
     return filepath
 
@@ -0,0 +1,606 @@
+import re
+import sqlite3
+import time
+import zlib
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from longevity_forest.config.cache import PACK_COMPACT_DEAD_RATIO
+from longevity_forest.core.result_packs import (
+    append_record,
+    current_pack_path,
+    decode_record,
+    encode_record,
+    iter_records,
+    list_packs,
+    new_pack_path,
+    packs_dir,
+    read_records,
+)
+
+
+INTERIM_DIR = Path("data/interim")
+INDEX_FILENAME = "cache_index.sqlite"
+
+QUERY_MARKER = "============ Agent query =============="
+RESULT_MARKER = "============ Result =============="
+
+# Trigram tokenizer gives case-insensitive substring matching (same semantics as the old grep),
+# the index is contentless so result texts are stored only once, in the packs (or legacy per-result files).
+# Packed results point to their record through pack/pack_offset/pack_length, size is the bytes on disk
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    filename TEXT NOT NULL UNIQUE,
+    agent_name TEXT NOT NULL DEFAULT '',
+    query TEXT NOT NULL DEFAULT '',
+    created_at REAL NOT NULL,
+    size INTEGER NOT NULL DEFAULT 0,
+    cache_key TEXT,
+    config_hash TEXT,
+    last_accessed REAL,
+    pack TEXT,
+    pack_offset INTEGER,
+    pack_length INTEGER
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    query, result, content='', tokenize='trigram'
+);
+"""
+
+# Columns added after the first release of the index, created on open for older databases
+ADDED_COLUMNS: dict[str, str] = {
+    "cache_key": "TEXT",
+    "config_hash": "TEXT",
+    "last_accessed": "REAL",
+    "pack": "TEXT",
+    "pack_offset": "INTEGER",
+    "pack_length": "INTEGER",
+}
+
+# Trigram index cannot answer substring queries shorter than this
+MIN_INDEXED_TERM_LENGTH = 3
+
+_FILENAME_PATTERN = re.compile(r"^(?P<agent>.+?)_\d{8}_\d{6}")
+
+
+def index_path(interim_dir: Path = INTERIM_DIR) -> Path:
+    """Return the location of the SQLite index for the given interim directory."""
+    return interim_dir / INDEX_FILENAME
+
+
+@contextmanager
+def connect_index(interim_dir: Path = INTERIM_DIR) -> Iterator[sqlite3.Connection]:
+    """Open the interim index, creating the schema if needed, and commit on exit.
+
+    Args:
+        interim_dir: Directory holding the interim results
+
+    Yields:
+        An open SQLite connection
+    """
+    interim_dir.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(index_path(interim_dir), timeout=30.0)
+    try:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(INDEX_SCHEMA)
+        _migrate_schema(connection)
+        yield connection
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def _migrate_schema(connection: sqlite3.Connection) -> None:
+    existing = {row[1] for row in connection.execute("PRAGMA table_info(entries)")}
+    for column, column_type in ADDED_COLUMNS.items():
+        if column not in existing:
+            connection.execute(f"ALTER TABLE entries ADD COLUMN {column} {column_type}")
+    connection.execute("CREATE INDEX IF NOT EXISTS entries_cache_key ON entries (cache_key, created_at)")
+    connection.execute("CREATE INDEX IF NOT EXISTS entries_agent_config ON entries (agent_name, config_hash)")
+    connection.execute("CREATE INDEX IF NOT EXISTS entries_pack ON entries (pack)")
+
+
+def parse_result_text(content: str) -> tuple[str, str]:
+    """Split a serialized result file into its query and result sections.
+
+    Args:
+        content: Full text of a *_result.txt file
+
+    Returns:
+        Tuple of (query, result); both empty if the file has no query marker
+    """
+    if QUERY_MARKER not in content:
+        return "", ""
+
+    in_query_section = False
+    in_result_section = False
+    query_lines = []
+    result_lines = []
+
+    for line in content.split("\n"):
+        if QUERY_MARKER in line:
+            in_query_section = True
+            in_result_section = False
+            continue
+        elif RESULT_MARKER in line:
+            in_query_section = False
+            in_result_section = True
+            continue
+
+        if in_query_section:
+            query_lines.append(line)
+        elif in_result_section:
+            result_lines.append(line)
+
+    return "\n".join(query_lines).strip(), "\n".join(result_lines).strip()
+
+
+def agent_name_from_filename(filename: str) -> str:
+    """Recover the agent shortname from an interim filename like biomart_agent_20250101_120000_result.txt."""
+    match = _FILENAME_PATTERN.match(filename)
+    return match.group("agent") if match else ""
+
+
+def _insert_entry(
+    connection: sqlite3.Connection,
+    filename: str,
+    agent_name: str,
+    query: str,
+    result: str,
+    created_at: float,
+    size: int,
+    cache_key: Optional[str] = None,
+    config_hash: Optional[str] = None,
+    last_accessed: Optional[float] = None,
+    pack: Optional[str] = None,
+    pack_offset: Optional[int] = None,
+    pack_length: Optional[int] = None,
+) -> int:
+    # Contentless FTS rows cannot be updated without the old text, so an overwritten file gets a new
+    # (never reused) id and its stale FTS row is simply never joined again (dropped on the next rebuild)
+    connection.execute("DELETE FROM entries WHERE filename = ?", (filename,))
+    cursor = connection.execute(
+        "INSERT INTO entries (filename, agent_name, query, created_at, size, cache_key, config_hash, "
+        "last_accessed, pack, pack_offset, pack_length) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (filename, agent_name, query, created_at, size, cache_key, config_hash,
+         last_accessed, pack, pack_offset, pack_length),
+    )
+    entry_id = cursor.lastrowid
+    connection.execute(
+        "INSERT INTO entries_fts (rowid, query, result) VALUES (?, ?, ?)",
+        (entry_id, query, result),
+    )
+    return entry_id
+
+
+def store_result(
+    filename: str,
+    agent_name: str,
+    query: str,
+    result: str,
+    text: str,
+    cache_key: Optional[str] = None,
+    config_hash: Optional[str] = None,
+    interim_dir: Path = INTERIM_DIR,
+    created_at: Optional[float] = None,
+) -> None:
+    """Append a compressed result to the current pack and index it.
+
+    Args:
+        filename: Logical result filename the result is addressed by
+        agent_name: Shortname of the agent that produced the result
+        query: The query sent to the agent
+        result: The agent response
+        text: Full serialized result text (query and result sections)
+        cache_key: Content address for exact-hit reuse (None if the result must not be reused)
+        config_hash: Hash of the agent configuration, used for near-duplicate reuse
+        interim_dir: Directory holding the interim results
+        created_at: Creation time to record, TTLs count from it (defaults to now)
+    """
+    created_at = created_at if created_at is not None else time.time()
+    record = encode_record(
+        {"filename": filename, "agent_name": agent_name, "created_at": created_at,
+         "cache_key": cache_key, "config_hash": config_hash},
+        text,
+    )
+    with connect_index(interim_dir) as connection:
+        # The index write lock also serializes appends to the packs across processes
+        connection.execute("BEGIN IMMEDIATE")
+        pack_path = current_pack_path(interim_dir)
+        offset = append_record(pack_path, record)
+        _insert_entry(
+            connection,
+            filename=filename,
+            agent_name=agent_name,
+            query=query,
+            result=result,
+            created_at=created_at,
+            size=len(record),
+            cache_key=cache_key,
+            config_hash=config_hash,
+            pack=pack_path.name,
+            pack_offset=offset,
+            pack_length=len(record),
+        )
+
+
+def read_result_texts(filenames: list[str], interim_dir: Path = INTERIM_DIR) -> dict[str, str]:
+    """Read full result texts, decompressing only the requested pack records.
+
+    Results not migrated to packs yet are read from their legacy per-result files.
+
+    Args:
+        filenames: Result filenames to read
+        interim_dir: Directory holding the interim results
+
+    Returns:
+        Dictionary of filename to result text, missing or unreadable results are left out
+    """
+    locations: dict[str, tuple[str, int, int]] = {}
+    if filenames and index_path(interim_dir).exists():
+        with connect_index(interim_dir) as connection:
+            for filename in filenames:
+                row = connection.execute(
+                    "SELECT pack, pack_offset, pack_length FROM entries WHERE filename = ? AND pack IS NOT NULL",
+                    (filename,),
+                ).fetchone()
+                if row is not None:
+                    locations[filename] = row
+
+    by_pack: dict[str, list[str]] = defaultdict(list)
+    for filename, (pack, _, _) in locations.items():
+        by_pack[pack].append(filename)
+
+    texts: dict[str, str] = {}
+    for pack, pack_filenames in by_pack.items():
+        try:
+            records = read_records(
+                packs_dir(interim_dir) / pack,
+                [(locations[filename][1], locations[filename][2]) for filename in pack_filenames],
+            )
+        except OSError:
+            # Pack removed by a concurrent compaction
+            continue
+        for filename, record in zip(pack_filenames, records):
+            if record is None:
+                continue
+            try:
+                _, texts[filename] = decode_record(record)
+            except (ValueError, zlib.error, UnicodeDecodeError):
+                continue
+
+    for filename in filenames:
+        if filename in locations or filename in texts:
+            continue
+        filepath = interim_dir / filename
+        try:
+            texts[filename] = filepath.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            # Skip files that can't be read
+            continue
+    return {filename: texts[filename] for filename in filenames if filename in texts}
+
+
+def read_result_text(filename: str, interim_dir: Path = INTERIM_DIR) -> Optional[str]:
+    """Read one full result text, None if it is gone or unreadable."""
+    return read_result_texts([filename], interim_dir).get(filename)
+
+
+def rebuild_index(interim_dir: Path = INTERIM_DIR) -> int:
+    """Drop and rebuild the index from the packs and the legacy *_result.txt files in the interim directory.
+
+    Args:
+        interim_dir: Directory holding the interim results
+
+    Returns:
+        Number of indexed results
+    """
+    db_path = index_path(interim_dir)
+    # Access times can't be recovered from the results, carry them over from the old index. The old
+    # index also tells which pack records are live: evicted ones stay in the packs until compaction
+    carried: dict[str, tuple[Optional[str], Optional[str], Optional[float]]] = {}
+    known_packed: Optional[set[str]] = None
+    if db_path.exists():
+        try:
+            with connect_index(interim_dir) as connection:
+                rows = connection.execute(
+                    "SELECT filename, cache_key, config_hash, last_accessed, pack FROM entries"
+                ).fetchall()
+            carried = {
+                filename: (cache_key, config_hash, last_accessed)
+                for filename, cache_key, config_hash, last_accessed, _ in rows
+            }
+            known_packed = {filename for filename, _, _, _, pack in rows if pack is not None}
+        except sqlite3.Error:
+            carried = {}
+            known_packed = None
+    for path in (db_path, db_path.with_name(db_path.name + "-wal"), db_path.with_name(db_path.name + "-shm")):
+        path.unlink(missing_ok=True)
+
+    indexed: set[str] = set()
+    with connect_index(interim_dir) as connection:
+        for pack_path in list_packs(interim_dir):
+            # Later records of the same filename replace earlier ones
+            for metadata, text, offset, length in iter_records(pack_path):
+                filename = metadata.get("filename", "")
+                if not filename or (known_packed is not None and filename not in known_packed):
+                    continue
+                query, result = parse_result_text(text)
+                _insert_entry(
+                    connection,
+                    filename=filename,
+                    agent_name=metadata.get("agent_name") or agent_name_from_filename(filename),
+                    query=query,
+                    result=result,
+                    created_at=metadata.get("created_at") or pack_path.stat().st_mtime,
+                    size=length,
+                    cache_key=metadata.get("cache_key"),
+                    config_hash=metadata.get("config_hash"),
+                    last_accessed=carried.get(filename, (None, None, None))[2],
+                    pack=pack_path.name,
+                    pack_offset=offset,
+                    pack_length=length,
+                )
+                indexed.add(filename)
+
+        for filepath in sorted(interim_dir.glob("*_result.txt")):
+            if filepath.name in indexed:
+                # Already migrated to a pack, the file is a leftover of an interrupted migration
+                continue
+            try:
+                content = filepath.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                # Skip files that can't be read
+                continue
+            query, result = parse_result_text(content)
+            stat = filepath.stat()
+            cache_key, config_hash, last_accessed = carried.get(filepath.name, (None, None, None))
+            _insert_entry(
+                connection,
+                filename=filepath.name,
+                agent_name=agent_name_from_filename(filepath.name),
+                query=query,
+                result=result,
+                created_at=stat.st_mtime,
+                size=stat.st_size,
+                cache_key=cache_key,
+                config_hash=config_hash,
+                last_accessed=last_accessed,
+            )
+            indexed.add(filepath.name)
+        connection.execute("INSERT INTO entries_fts (entries_fts) VALUES ('optimize')")
+    return len(indexed)
+
+
+def migrate_loose_results(interim_dir: Path = INTERIM_DIR, keep_files: bool = False) -> int:
+    """Move legacy per-result *_result.txt files into compressed packs.
+
+    Args:
+        interim_dir: Directory holding the interim results
+        keep_files: Keep the original files after packing them
+
+    Returns:
+        Number of migrated results
+    """
+    ensure_index(interim_dir)
+    migrated = 0
+    for filepath in sorted(interim_dir.glob("*_result.txt")):
+        try:
+            content = filepath.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            # Skip files that can't be read
+            continue
+        with connect_index(interim_dir) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT id, agent_name, created_at, cache_key, config_hash, pack FROM entries WHERE filename = ?",
+                (filepath.name,),
+            ).fetchone()
+            if row is None:
+                # Copied in after the index was built
+                query, result = parse_result_text(content)
+                agent_name, created_at = agent_name_from_filename(filepath.name), filepath.stat().st_mtime
+                entry_id = _insert_entry(
+                    connection,
+                    filename=filepath.name,
+                    agent_name=agent_name,
+                    query=query,
+                    result=result,
+                    created_at=created_at,
+                    size=0,
+                )
+                row = (entry_id, agent_name, created_at, None, None, None)
+            entry_id, agent_name, created_at, cache_key, config_hash, pack = row
+            if pack is None:
+                record = encode_record(
+                    {"filename": filepath.name, "agent_name": agent_name, "created_at": created_at,
+                     "cache_key": cache_key, "config_hash": config_hash},
+                    content,
+                )
+                pack_path = current_pack_path(interim_dir)
+                offset = append_record(pack_path, record)
+                connection.execute(
+                    "UPDATE entries SET pack = ?, pack_offset = ?, pack_length = ?, size = ? WHERE id = ?",
+                    (pack_path.name, offset, len(record), len(record), entry_id),
+                )
+                migrated += 1
+        if not keep_files:
+            filepath.unlink(missing_ok=True)
+    return migrated
+
+
+def compact_packs(interim_dir: Path = INTERIM_DIR, dead_ratio: float = PACK_COMPACT_DEAD_RATIO) -> int:
+    """Rewrite packs in which at least dead_ratio of the bytes belong to removed results.
+
+    Args:
+        interim_dir: Directory holding the interim results
+        dead_ratio: Fraction of dead bytes that triggers a rewrite
+
+    Returns:
+        Number of bytes reclaimed
+    """
+    packs = list_packs(interim_dir)
+    if not packs or not index_path(interim_dir).exists():
+        return 0
+
+    reclaimed = 0
+    obsolete = []
+    with connect_index(interim_dir) as connection:
+        connection.execute("BEGIN IMMEDIATE")
+        live: dict[str, list[tuple[int, int, int]]] = defaultdict(list)
+        for entry_id, pack, offset, length in connection.execute(
+            "SELECT id, pack, pack_offset, pack_length FROM entries WHERE pack IS NOT NULL ORDER BY pack_offset"
+        ):
+            live[pack].append((entry_id, offset, length))
+
+        for pack_path in packs:
+            size = pack_path.stat().st_size
+            records = live.get(pack_path.name, [])
+            live_bytes = sum(length for _, _, length in records)
+            if size == 0 or (size - live_bytes) / size < dead_ratio:
+                continue
+            if records:
+                target = new_pack_path(interim_dir)
+                raw_records = read_records(pack_path, [(offset, length) for _, offset, length in records])
+                for (entry_id, _, length), raw in zip(records, raw_records):
+                    if raw is None:
+                        connection.execute("DELETE FROM entries WHERE id = ?", (entry_id,))
+                        continue
+                    offset = append_record(target, raw)
+                    connection.execute(
+                        "UPDATE entries SET pack = ?, pack_offset = ? WHERE id = ?",
+                        (target.name, offset, entry_id),
+                    )
+            obsolete.append(pack_path)
+            reclaimed += size - live_bytes
+
+    # Only after the new locations are committed
+    for pack_path in obsolete:
+        try:
+            pack_path.unlink()
+        except OSError as e:
+            print(f"⚠ Failed to remove compacted pack {pack_path}: {e}")
+    return reclaimed
+
+
+def touch_entries(filenames: list[str], interim_dir: Path = INTERIM_DIR) -> None:
+    """Record that cached results were read, for least-recently-used eviction.
+
+    Args:
+        filenames: Result filenames that were read
+        interim_dir: Directory holding the interim results
+    """
+    if not filenames or not index_path(interim_dir).exists():
+        return
+    now = time.time()
+    with connect_index(interim_dir) as connection:
+        connection.executemany(
+            "UPDATE entries SET last_accessed = ? WHERE filename = ?",
+            [(now, filename) for filename in filenames],
+        )
+
+
+def list_entries(interim_dir: Path = INTERIM_DIR) -> dict[str, dict[str, Any]]:
+    """Return bookkeeping data of all indexed results keyed by filename.
+
+    Args:
+        interim_dir: Directory holding the interim results
+
+    Returns:
+        Dictionary of filename to 'agent_name', 'created_at', 'last_accessed' (None if never read),
+        'size', 'packed', 'cache_key' and 'config_hash'
+    """
+    if not index_path(interim_dir).exists():
+        return {}
+    with connect_index(interim_dir) as connection:
+        rows = connection.execute(
+            "SELECT filename, agent_name, created_at, last_accessed, size, pack, cache_key, config_hash FROM entries"
+        ).fetchall()
+    return {
+        filename: {"agent_name": agent_name, "created_at": created_at, "last_accessed": last_accessed,
+                   "size": size, "packed": pack is not None, "cache_key": cache_key, "config_hash": config_hash}
+        for filename, agent_name, created_at, last_accessed, size, pack, cache_key, config_hash in rows
+    }
+
+
+def remove_entries(filenames: list[str], interim_dir: Path = INTERIM_DIR) -> None:
+    """Drop evicted results from the index.
+
+    Their contentless FTS rows are left behind but never joined again (ids are not reused);
+    `forest cache reindex` drops them. Packed records stay on disk until compact_packs.
+
+    Args:
+        filenames: Result filenames to remove
+        interim_dir: Directory holding the interim results
+    """
+    if not filenames or not index_path(interim_dir).exists():
+        return
+    with connect_index(interim_dir) as connection:
+        connection.executemany("DELETE FROM entries WHERE filename = ?", [(filename,) for filename in filenames])
+
+
+def find_cached_entry(cache_key: str, min_created_at: float, interim_dir: Path = INTERIM_DIR) -> Optional[str]:
+    """Return the newest result filename stored under the cache key and created after min_created_at."""
+    if not index_path(interim_dir).exists():
+        return None
+    with connect_index(interim_dir) as connection:
+        row = connection.execute(
+            "SELECT filename FROM entries WHERE cache_key = ? AND created_at >= ? "
+            "ORDER BY created_at DESC LIMIT 1",
+            (cache_key, min_created_at),
+        ).fetchone()
+    return row[0] if row else None
+
+
+def ensure_index(interim_dir: Path = INTERIM_DIR) -> None:
+    """Build the index on first use if the interim directory predates it."""
+    if not index_path(interim_dir).exists() and (any(interim_dir.glob("*_result.txt")) or list_packs(interim_dir)):
+        rebuild_index(interim_dir)
+
+
+def _fts_phrase(search_term: str) -> str:
+    return '"' + search_term.replace('"', '""') + '"'
+
+
+def search_index(search_term: str, interim_dir: Path = INTERIM_DIR) -> list[dict[str, Any]]:
+    """Find indexed results whose query or result contains the search term (case-insensitive).
+
+    Args:
+        search_term: Substring to look for
+        interim_dir: Directory holding the interim results
+
+    Returns:
+        List of dictionaries with 'filename', 'agent_name', 'query' and 'created_at' fields, newest first
+    """
+    if not interim_dir.exists():
+        return []
+    ensure_index(interim_dir)
+
+    with connect_index(interim_dir) as connection:
+        if len(search_term) >= MIN_INDEXED_TERM_LENGTH:
+            rows = connection.execute(
+                "SELECT e.filename, e.agent_name, e.query, e.created_at FROM entries_fts f "
+                "JOIN entries e ON e.id = f.rowid "
+                "WHERE entries_fts MATCH ? ORDER BY e.created_at DESC",
+                (_fts_phrase(search_term),),
+            ).fetchall()
+        else:
+            rows = _scan_short_term(connection, search_term, interim_dir)
+
+    return [
+        {"filename": filename, "agent_name": agent_name, "query": query, "created_at": created_at}
+        for filename, agent_name, query, created_at in rows
+    ]
+
+
+def _scan_short_term(connection: sqlite3.Connection, search_term: str, interim_dir: Path) -> list[tuple[str, str, str, float]]:
+    # Terms too short for trigrams fall back to reading the indexed results
+    needle = search_term.lower()
+    candidates = connection.execute(
+        "SELECT filename, agent_name, query, created_at FROM entries ORDER BY created_at DESC"
+    ).fetchall()
+    texts = read_result_texts([row[0] for row in candidates], interim_dir)
+    return [row for row in candidates if needle in texts.get(row[0], "").lower()]
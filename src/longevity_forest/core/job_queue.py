@@ -0,0 +1,447 @@
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from longevity_forest.config.batch import (
+    BATCH_MAX_ATTEMPTS,
+    BATCH_MAX_RETRY_DELAY_SECONDS,
+    BATCH_RETRY_DELAY_SECONDS,
+    DEFAULT_BATCH_NAME,
+    JOB_HEARTBEAT_INTERVAL_SECONDS,
+    JOB_LEASE_SECONDS,
+    JOB_QUEUE_JOURNAL_MODE,
+    JOB_QUEUE_PATH,
+)
+
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+JOB_QUEUE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch TEXT NOT NULL,
+    gene TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    output_path TEXT,
+    report_status TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    next_attempt_at REAL,
+    worker_id TEXT,
+    lease_expires_at REAL,
+    UNIQUE (batch, gene)
+);
+CREATE INDEX IF NOT EXISTS jobs_batch_state ON jobs (batch, state);
+CREATE TABLE IF NOT EXISTS workers (
+    worker_id TEXT PRIMARY KEY,
+    batch TEXT NOT NULL,
+    hostname TEXT NOT NULL,
+    pid INTEGER NOT NULL,
+    started_at REAL NOT NULL,
+    heartbeat_at REAL NOT NULL,
+    stopped_at REAL,
+    current_gene TEXT,
+    jobs_done INTEGER NOT NULL DEFAULT 0,
+    jobs_failed INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+JOB_COLUMNS = (
+    "id", "batch", "gene", "state", "attempts", "max_attempts", "output_path", "report_status", "error",
+    "created_at", "updated_at", "started_at", "finished_at", "next_attempt_at", "worker_id", "lease_expires_at",
+)
+
+WORKER_COLUMNS = (
+    "worker_id", "batch", "hostname", "pid", "started_at", "heartbeat_at", "stopped_at", "current_gene",
+    "jobs_done", "jobs_failed",
+)
+
+# Columns added after the first release of the queue, added to existing databases on connect
+JOB_COLUMN_MIGRATIONS = {
+    "worker_id": "TEXT",
+    "lease_expires_at": "REAL",
+}
+
+
+@contextmanager
+def connect_queue(queue_path: Path = JOB_QUEUE_PATH) -> Iterator[sqlite3.Connection]:
+    """Open the job queue, creating the schema if needed, and commit on exit."""
+    queue_path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(queue_path, timeout=30.0)
+    try:
+        connection.execute(f"PRAGMA journal_mode={JOB_QUEUE_JOURNAL_MODE}")
+        connection.executescript(JOB_QUEUE_SCHEMA)
+        existing = {row[1] for row in connection.execute("PRAGMA table_info(jobs)")}
+        for column, column_type in JOB_COLUMN_MIGRATIONS.items():
+            if column not in existing:
+                connection.execute(f"ALTER TABLE jobs ADD COLUMN {column} {column_type}")
+        yield connection
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def _job(row: tuple) -> dict[str, Any]:
+    return dict(zip(JOB_COLUMNS, row))
+
+
+def default_worker_id() -> str:
+    """Return a worker id unique across the machines sharing a queue: <hostname>-<pid>."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def submit_jobs(
+    genes: list[str],
+    batch: str = DEFAULT_BATCH_NAME,
+    max_attempts: int = BATCH_MAX_ATTEMPTS,
+    queue_path: Path = JOB_QUEUE_PATH,
+) -> tuple[int, int]:
+    """Add genes to a batch; genes already in the batch keep their state, so submitting twice is harmless.
+
+    Args:
+        genes: Gene symbols to analyze
+        batch: Batch name
+        max_attempts: How often a gene is attempted before it stays failed
+        queue_path: Job queue database
+
+    Returns:
+        Tuple of (added jobs, genes already in the batch)
+    """
+    now = time.time()
+    added = 0
+    unique_genes = list(dict.fromkeys(genes))
+    with connect_queue(queue_path) as connection:
+        for gene in unique_genes:
+            cursor = connection.execute(
+                "INSERT OR IGNORE INTO jobs (batch, gene, state, max_attempts, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (batch, gene, PENDING, max_attempts, now, now),
+            )
+            added += cursor.rowcount
+    return added, len(unique_genes) - added
+
+
+def _reclaim_expired_leases(connection: sqlite3.Connection, batch: str, now: float) -> int:
+    # The attempt of a worker that died still counts; jobs without a lease predate leases
+    connection.execute(
+        "UPDATE jobs SET state = ?, error = ?, finished_at = ?, updated_at = ?, worker_id = NULL, lease_expires_at = NULL "
+        "WHERE batch = ? AND state = ? AND COALESCE(lease_expires_at, 0) <= ? AND attempts >= max_attempts",
+        (FAILED, "Worker stopped responding (lease expired)", now, now, batch, RUNNING, now),
+    )
+    return connection.execute(
+        "UPDATE jobs SET state = ?, updated_at = ?, worker_id = NULL, lease_expires_at = NULL "
+        "WHERE batch = ? AND state = ? AND COALESCE(lease_expires_at, 0) <= ?",
+        (PENDING, now, batch, RUNNING, now),
+    ).rowcount
+
+
+def recover_interrupted_jobs(batch: str = DEFAULT_BATCH_NAME, queue_path: Path = JOB_QUEUE_PATH) -> int:
+    """Put running jobs whose lease expired (their worker crashed or was killed) back to pending.
+
+    Their attempt still counts, jobs without attempts left are marked failed. claim_next_job does this
+    on every claim, so calling it is only needed to report recovered jobs.
+
+    Returns:
+        Number of recovered jobs
+    """
+    with connect_queue(queue_path) as connection:
+        connection.execute("BEGIN IMMEDIATE")
+        return _reclaim_expired_leases(connection, batch, time.time())
+
+
+def claim_next_job(
+    batch: str = DEFAULT_BATCH_NAME,
+    queue_path: Path = JOB_QUEUE_PATH,
+    worker_id: Optional[str] = None,
+    lease_seconds: float = JOB_LEASE_SECONDS,
+) -> Optional[dict[str, Any]]:
+    """Lease the next pending job (or failed job due for a retry) to a worker and return it.
+
+    The worker has to renew the lease with heartbeat() until it completes, fails or releases the job,
+    otherwise the job goes to the next worker.
+
+    Args:
+        batch: Batch name
+        queue_path: Job queue database
+        worker_id: Id of the claiming worker (defaults to default_worker_id())
+        lease_seconds: Time until the job is handed to another worker unless renewed
+
+    Returns:
+        The claimed job, or None if no job is ready now
+    """
+    worker_id = worker_id or default_worker_id()
+    now = time.time()
+    with connect_queue(queue_path) as connection:
+        connection.execute("BEGIN IMMEDIATE")
+        _reclaim_expired_leases(connection, batch, now)
+        row = connection.execute(
+            f"SELECT {', '.join(JOB_COLUMNS)} FROM jobs WHERE batch = ? AND ("
+            "state = ? OR (state = ? AND attempts < max_attempts AND COALESCE(next_attempt_at, 0) <= ?)"
+            ") ORDER BY attempts, id LIMIT 1",
+            (batch, PENDING, FAILED, now),
+        ).fetchone()
+        if row is None:
+            return None
+        job = _job(row)
+        connection.execute(
+            "UPDATE jobs SET state = ?, attempts = attempts + 1, started_at = ?, updated_at = ?, worker_id = ?, "
+            "lease_expires_at = ? WHERE id = ?",
+            (RUNNING, now, now, worker_id, now + lease_seconds, job["id"]),
+        )
+        connection.execute("UPDATE workers SET current_gene = ?, heartbeat_at = ? WHERE worker_id = ?",
+                           (job["gene"], now, worker_id))
+    job.update(state=RUNNING, attempts=job["attempts"] + 1, started_at=now, updated_at=now,
+               worker_id=worker_id, lease_expires_at=now + lease_seconds)
+    return job
+
+
+def heartbeat(
+    worker_id: str,
+    job_id: Optional[int] = None,
+    lease_seconds: float = JOB_LEASE_SECONDS,
+    queue_path: Path = JOB_QUEUE_PATH,
+) -> bool:
+    """Record that a worker is alive and renew the lease of the job it is running.
+
+    Returns:
+        False if the worker lost the job to another worker (its lease had expired), else True
+    """
+    now = time.time()
+    with connect_queue(queue_path) as connection:
+        connection.execute("UPDATE workers SET heartbeat_at = ? WHERE worker_id = ?", (now, worker_id))
+        if job_id is None:
+            return True
+        return connection.execute(
+            "UPDATE jobs SET lease_expires_at = ?, updated_at = ? WHERE id = ? AND worker_id = ? AND state = ?",
+            (now + lease_seconds, now, job_id, worker_id, RUNNING),
+        ).rowcount == 1
+
+
+@contextmanager
+def keep_lease(
+    worker_id: str,
+    job_id: int,
+    lease_seconds: float = JOB_LEASE_SECONDS,
+    interval_seconds: float = JOB_HEARTBEAT_INTERVAL_SECONDS,
+    queue_path: Path = JOB_QUEUE_PATH,
+) -> Iterator[threading.Event]:
+    """Renew the lease of a job from a background thread while the block runs.
+
+    Yields:
+        Event that is set if the lease was lost to another worker
+    """
+    stop = threading.Event()
+    lost = threading.Event()
+
+    def renew() -> None:
+        while not stop.wait(interval_seconds):
+            try:
+                if not heartbeat(worker_id, job_id, lease_seconds, queue_path):
+                    lost.set()
+                    return
+            except sqlite3.Error as e:
+                # The queue may be briefly unreachable on shared storage, the lease has slack for a few misses
+                print(f"⚠ Heartbeat of {worker_id} failed: {e}")
+
+    thread = threading.Thread(target=renew, daemon=True, name=f"Heartbeat-{job_id}")
+    thread.start()
+    try:
+        yield lost
+    finally:
+        stop.set()
+        thread.join()
+
+
+def complete_job(
+    job_id: int,
+    output_path: Path,
+    report_status: str,
+    queue_path: Path = JOB_QUEUE_PATH,
+    worker_id: Optional[str] = None,
+) -> None:
+    """Mark a job done with the path of its report and the report validation status (success or warning).
+
+    The report is kept even if the worker lost its lease meanwhile, a finished report is as good as any.
+    """
+    now = time.time()
+    with connect_queue(queue_path) as connection:
+        connection.execute(
+            "UPDATE jobs SET state = ?, output_path = ?, report_status = ?, error = NULL, finished_at = ?, "
+            "updated_at = ?, next_attempt_at = NULL, worker_id = COALESCE(?, worker_id), lease_expires_at = NULL "
+            "WHERE id = ?",
+            (DONE, str(output_path), report_status, now, now, worker_id, job_id),
+        )
+        if worker_id is not None:
+            connection.execute(
+                "UPDATE workers SET jobs_done = jobs_done + 1, current_gene = NULL, heartbeat_at = ? WHERE worker_id = ?",
+                (now, worker_id),
+            )
+
+
+def fail_job(
+    job_id: int,
+    error: str,
+    queue_path: Path = JOB_QUEUE_PATH,
+    worker_id: Optional[str] = None,
+) -> tuple[bool, Optional[float]]:
+    """Mark a job failed and schedule its retry with exponential backoff.
+
+    If worker_id is given, the job is left alone when the worker no longer holds it, e.g. because its
+    lease expired and the job went back to pending or to another worker.
+
+    Returns:
+        Tuple of (whether the failure was recorded, time of the next attempt or None if the job has
+        no attempts left); (False, None) if the job was left alone
+    """
+    now = time.time()
+    with connect_queue(queue_path) as connection:
+        connection.execute("BEGIN IMMEDIATE")
+        row = connection.execute(
+            "SELECT attempts, max_attempts FROM jobs WHERE id = ? AND (? IS NULL OR worker_id = ?)",
+            (job_id, worker_id, worker_id),
+        ).fetchone()
+        if worker_id is not None:
+            # Only failures recorded on the job count for the worker
+            connection.execute(
+                "UPDATE workers SET jobs_failed = jobs_failed + ?, current_gene = NULL, heartbeat_at = ? WHERE worker_id = ?",
+                (int(row is not None), now, worker_id),
+            )
+        if row is None:
+            return False, None
+        attempts, max_attempts = row
+        next_attempt_at = None
+        if attempts < max_attempts:
+            delay = min(BATCH_RETRY_DELAY_SECONDS * 2 ** (attempts - 1), BATCH_MAX_RETRY_DELAY_SECONDS)
+            next_attempt_at = now + delay
+        connection.execute(
+            "UPDATE jobs SET state = ?, error = ?, finished_at = ?, updated_at = ?, next_attempt_at = ?, "
+            "lease_expires_at = NULL WHERE id = ?",
+            (FAILED, error, now, now, next_attempt_at, job_id),
+        )
+    return True, next_attempt_at
+
+
+def release_job(job_id: int, queue_path: Path = JOB_QUEUE_PATH, worker_id: Optional[str] = None) -> None:
+    """Put a job that was interrupted on purpose (e.g. Ctrl+C) back to pending without counting the attempt."""
+    with connect_queue(queue_path) as connection:
+        connection.execute(
+            "UPDATE jobs SET state = ?, attempts = MAX(attempts - 1, 0), updated_at = ?, worker_id = NULL, "
+            "lease_expires_at = NULL WHERE id = ? AND state = ? AND (? IS NULL OR worker_id = ?)",
+            (PENDING, time.time(), job_id, RUNNING, worker_id, worker_id),
+        )
+
+
+def next_retry_at(batch: str = DEFAULT_BATCH_NAME, queue_path: Path = JOB_QUEUE_PATH) -> Optional[float]:
+    """Return when the next job of the batch may become claimable: a scheduled retry of a failed job, or
+    the lease expiry of a running job in case its worker dies. None if neither is left."""
+    with connect_queue(queue_path) as connection:
+        row = connection.execute(
+            "SELECT MIN(CASE WHEN state = ? THEN next_attempt_at ELSE COALESCE(lease_expires_at, 0) END) FROM jobs "
+            "WHERE batch = ? AND ((state = ? AND attempts < max_attempts AND next_attempt_at IS NOT NULL) OR state = ?)",
+            (FAILED, batch, FAILED, RUNNING),
+        ).fetchone()
+    return row[0]
+
+
+def register_worker(worker_id: str, batch: str = DEFAULT_BATCH_NAME, queue_path: Path = JOB_QUEUE_PATH) -> None:
+    """Add a worker to the status view of the queue, restarting its counters if the id was used before."""
+    now = time.time()
+    with connect_queue(queue_path) as connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO workers (worker_id, batch, hostname, pid, started_at, heartbeat_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (worker_id, batch, socket.gethostname(), os.getpid(), now, now),
+        )
+
+
+def stop_worker(worker_id: str, queue_path: Path = JOB_QUEUE_PATH) -> None:
+    """Mark a worker as stopped on purpose."""
+    now = time.time()
+    with connect_queue(queue_path) as connection:
+        connection.execute(
+            "UPDATE workers SET stopped_at = ?, heartbeat_at = ?, current_gene = NULL WHERE worker_id = ?",
+            (now, now, worker_id),
+        )
+
+
+def list_workers(batch: Optional[str] = None, queue_path: Path = JOB_QUEUE_PATH) -> list[dict[str, Any]]:
+    """Return the workers of a batch (or of all batches) with their throughput.
+
+    Besides the worker columns, every worker has "alive" (heartbeat within the lease and not stopped),
+    "genes_per_hour" over its uptime and "mean_seconds_per_gene" of the jobs it completed.
+    """
+    if not queue_path.exists():
+        return []
+    now = time.time()
+    with connect_queue(queue_path) as connection:
+        query = f"SELECT {', '.join(WORKER_COLUMNS)} FROM workers"
+        if batch is not None:
+            rows = connection.execute(query + " WHERE batch = ? ORDER BY started_at", (batch,)).fetchall()
+        else:
+            rows = connection.execute(query + " ORDER BY batch, started_at").fetchall()
+        durations = dict(connection.execute(
+            "SELECT worker_id, AVG(finished_at - started_at) FROM jobs WHERE state = ? AND worker_id IS NOT NULL "
+            "GROUP BY worker_id", (DONE,)
+        ).fetchall())
+    workers = []
+    for row in rows:
+        worker = dict(zip(WORKER_COLUMNS, row))
+        uptime = (worker["stopped_at"] or now) - worker["started_at"]
+        worker["alive"] = worker["stopped_at"] is None and now - worker["heartbeat_at"] < JOB_LEASE_SECONDS
+        worker["genes_per_hour"] = worker["jobs_done"] / (uptime / 3600) if uptime > 0 else 0.0
+        worker["mean_seconds_per_gene"] = durations.get(worker["worker_id"])
+        workers.append(worker)
+    return workers
+
+
+def reset_failed_jobs(batch: str = DEFAULT_BATCH_NAME, queue_path: Path = JOB_QUEUE_PATH) -> int:
+    """Give failed jobs of a batch a fresh set of attempts.
+
+    Returns:
+        Number of reset jobs
+    """
+    with connect_queue(queue_path) as connection:
+        return connection.execute(
+            "UPDATE jobs SET state = ?, attempts = 0, error = NULL, next_attempt_at = NULL, updated_at = ? "
+            "WHERE batch = ? AND state = ?",
+            (PENDING, time.time(), batch, FAILED),
+        ).rowcount
+
+
+def list_jobs(batch: Optional[str] = None, queue_path: Path = JOB_QUEUE_PATH) -> list[dict[str, Any]]:
+    """Return the jobs of a batch (or of all batches) in submission order."""
+    if not queue_path.exists():
+        return []
+    with connect_queue(queue_path) as connection:
+        query = f"SELECT {', '.join(JOB_COLUMNS)} FROM jobs"
+        if batch is not None:
+            rows = connection.execute(query + " WHERE batch = ? ORDER BY id", (batch,)).fetchall()
+        else:
+            rows = connection.execute(query + " ORDER BY batch, id").fetchall()
+    return [_job(row) for row in rows]
+
+
+def count_jobs(batch: str = DEFAULT_BATCH_NAME, queue_path: Path = JOB_QUEUE_PATH) -> dict[str, int]:
+    """Return the number of jobs of a batch per state."""
+    counts = {PENDING: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+    if not queue_path.exists():
+        return counts
+    with connect_queue(queue_path) as connection:
+        for state, count in connection.execute(
+            "SELECT state, COUNT(*) FROM jobs WHERE batch = ? GROUP BY state", (batch,)
+        ):
+            counts[state] = count
+    return counts
@@ -0,0 +1,430 @@
+import csv
+import hashlib
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+from longevity_forest.config.knockout import (
+    KNOCKOUT_AGE_KEYS,
+    KNOCKOUT_BATCH_PREDICT_TOOL,
+    KNOCKOUT_BATCH_SENTENCES_ARGUMENT,
+    KNOCKOUT_BATCH_SIZE,
+    KNOCKOUT_MCP_CONFIG,
+    KNOCKOUT_METADATA_ARGUMENTS,
+    KNOCKOUT_MODEL_KEY,
+    KNOCKOUT_NEUTRAL_DELTA_YEARS,
+    KNOCKOUT_PREDICT_TOOL,
+    KNOCKOUT_SENTENCE_ARGUMENT,
+    KNOCKOUT_TIMEOUT_SECONDS,
+    KNOCKOUT_WORKERS,
+)
+from longevity_forest.core.mcp_tools import call_mcp_tool, parse_tool_content
+
+
+KNOCKOUT_COLUMNS = (
+    "rank", "gene", "sentence_position", "original_age", "knockout_age", "delta_age", "direction", "error",
+)
+# Knockout scans label gene sets, "gene" holds the label and "genes" the removed genes
+SCAN_COLUMNS = (
+    "rank", "gene", "genes", "sentence_position", "original_age", "knockout_age", "delta_age", "direction", "error",
+)
+SCAN_PREDICTIONS_FILENAME = "predictions.jsonl"
+
+
+def sentence_genes(gene_sentence: str) -> list[str]:
+    """Split a gene expression sentence into its genes, most expressed first."""
+    return gene_sentence.split()
+
+
+def knockout_sentence(gene_sentence: str, genes: list[str]) -> str:
+    """Remove genes from a gene expression sentence (symbols compared case-insensitively)."""
+    removed = {gene.upper() for gene in genes}
+    return " ".join(gene for gene in sentence_genes(gene_sentence) if gene.upper() not in removed)
+
+
+def gene_position(gene_sentence: str, gene: str) -> Optional[int]:
+    """Return the 1-based expression rank of a gene in the sentence, None if it isn't there."""
+    for position, sentence_gene in enumerate(sentence_genes(gene_sentence), start=1):
+        if sentence_gene.upper() == gene.upper():
+            return position
+    return None
+
+
+def extract_predicted_age(value: Any) -> float:
+    """Find the predicted age in a decoded tool result (a number, a dict with one of KNOCKOUT_AGE_KEYS or text).
+
+    Raises:
+        ValueError: If the result contains no age
+    """
+    if isinstance(value, bool):
+        raise ValueError(f"No predicted age in {value!r}")
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, dict):
+        for key in KNOCKOUT_AGE_KEYS:
+            if key in value:
+                return extract_predicted_age(value[key])
+        for nested in value.values():
+            if isinstance(nested, dict):
+                try:
+                    return extract_predicted_age(nested)
+                except ValueError:
+                    continue
+    if isinstance(value, list) and len(value) == 1:
+        return extract_predicted_age(value[0])
+    if isinstance(value, str):
+        match = re.search(r"-?\d+(?:\.\d+)?", value)
+        if match:
+            return float(match.group())
+    raise ValueError(f"No predicted age in {str(value)[:200]!r}")
+
+
+def prediction_arguments(gene_sentence: str, metadata: dict[str, Any]) -> dict[str, Any]:
+    """Build the arguments of the age prediction tool, leaving out metadata that wasn't given."""
+    arguments = {KNOCKOUT_SENTENCE_ARGUMENT: gene_sentence}
+    for name in KNOCKOUT_METADATA_ARGUMENTS:
+        if metadata.get(name) is not None and metadata.get(name) != "":
+            arguments[name] = metadata[name]
+    return arguments
+
+
+def predict(
+    gene_sentence: str,
+    metadata: dict[str, Any],
+    timeout: float = KNOCKOUT_TIMEOUT_SECONDS,
+) -> dict[str, Any]:
+    """Predict the donor age of a gene expression sentence with the cell2sentence4longevity model.
+
+    Returns:
+        Dictionary with 'age' and 'model' (None if the server doesn't name it)
+
+    Raises:
+        RuntimeError: If the MCP tool returns an error
+        ValueError: If the result contains no age
+    """
+    result = call_mcp_tool(KNOCKOUT_MCP_CONFIG, KNOCKOUT_PREDICT_TOOL,
+                           prediction_arguments(gene_sentence, metadata), timeout=timeout)
+    if result.error_code != 0:
+        raise RuntimeError(f"{KNOCKOUT_PREDICT_TOOL} failed: {result.content[:200]}")
+    value = parse_tool_content(result.content)
+    model = value.get(KNOCKOUT_MODEL_KEY) if isinstance(value, dict) else None
+    return {"age": extract_predicted_age(value), "model": model}
+
+
+def predict_age(
+    gene_sentence: str,
+    metadata: dict[str, Any],
+    timeout: float = KNOCKOUT_TIMEOUT_SECONDS,
+) -> float:
+    """Predict the donor age of a gene expression sentence, see predict()."""
+    return predict(gene_sentence, metadata, timeout=timeout)["age"]
+
+
+def direction(delta_age: Optional[float]) -> str:
+    """Describe a delta age the way the knockout reports do."""
+    if delta_age is None:
+        return ""
+    if abs(delta_age) < KNOCKOUT_NEUTRAL_DELTA_YEARS:
+        return "neutral"
+    # Removing the gene makes the cell look older: the gene is protective
+    return "protective" if delta_age > 0 else "pro-aging"
+
+
+def predict_ages_batch(
+    gene_sentences: list[str],
+    metadata: dict[str, Any],
+    timeout: float = KNOCKOUT_TIMEOUT_SECONDS,
+) -> list[float]:
+    """Predict several sentences of the same cell in one call of KNOCKOUT_BATCH_PREDICT_TOOL.
+
+    Raises:
+        RuntimeError: If the MCP tool returns an error or a result of the wrong length
+        ValueError: If a result contains no age
+    """
+    arguments = prediction_arguments("", metadata)
+    del arguments[KNOCKOUT_SENTENCE_ARGUMENT]
+    arguments[KNOCKOUT_BATCH_SENTENCES_ARGUMENT] = gene_sentences
+    result = call_mcp_tool(KNOCKOUT_MCP_CONFIG, KNOCKOUT_BATCH_PREDICT_TOOL, arguments, timeout=timeout)
+    if result.error_code != 0:
+        raise RuntimeError(f"{KNOCKOUT_BATCH_PREDICT_TOOL} failed: {result.content[:200]}")
+    values = parse_tool_content(result.content)
+    if isinstance(values, dict):
+        values = next((value for value in values.values() if isinstance(value, list)), [values])
+    if not isinstance(values, list) or len(values) != len(gene_sentences):
+        raise RuntimeError(f"{KNOCKOUT_BATCH_PREDICT_TOOL} returned {str(values)[:200]!r} for {len(gene_sentences)} sentences")
+    return [extract_predicted_age(value) for value in values]
+
+
+def scan_id(gene_sentence: str, metadata: dict[str, Any]) -> str:
+    """Return a stable id of a knockout scan of a cell, so rerunning the same scan resumes it."""
+    key = json.dumps([KNOCKOUT_PREDICT_TOOL, prediction_arguments(gene_sentence, metadata)], sort_keys=True)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+def load_scan_predictions(scan_dir: Path) -> dict[str, float]:
+    """Return the predictions recorded in a scan directory, keyed by sentence."""
+    predictions: dict[str, float] = {}
+    path = scan_dir / SCAN_PREDICTIONS_FILENAME
+    if not path.exists():
+        return predictions
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # The last line can be cut off by an interruption in the middle of a write
+                continue
+            predictions[record["sentence"]] = record["age"]
+    return predictions
+
+
+_record_lock = threading.Lock()
+
+
+def _record_predictions(scan_dir: Optional[Path], predictions: dict[str, float]) -> None:
+    if scan_dir is None or not predictions:
+        return
+    with _record_lock:
+        scan_dir.mkdir(parents=True, exist_ok=True)
+        with open(scan_dir / SCAN_PREDICTIONS_FILENAME, "a", encoding="utf-8") as f:
+            for sentence, age in predictions.items():
+                f.write(json.dumps({"sentence": sentence, "age": age, "recorded_at": time.time()}) + "\n")
+            f.flush()
+
+
+def _predict_chunk(
+    gene_sentences: list[str],
+    metadata: dict[str, Any],
+    timeout: float,
+    scan_dir: Optional[Path],
+) -> dict[str, Any]:
+    # Returns sentence -> age, or the exception the prediction failed with
+    if KNOCKOUT_BATCH_PREDICT_TOOL and len(gene_sentences) > 1:
+        try:
+            ages = dict(zip(gene_sentences, predict_ages_batch(gene_sentences, metadata, timeout=timeout)))
+        except Exception as e:
+            return {sentence: e for sentence in gene_sentences}
+        _record_predictions(scan_dir, ages)
+        return ages
+    outcomes: dict[str, Any] = {}
+    for sentence in gene_sentences:
+        try:
+            outcomes[sentence] = predict_age(sentence, metadata, timeout=timeout)
+            _record_predictions(scan_dir, {sentence: outcomes[sentence]})
+        except Exception as e:
+            outcomes[sentence] = e
+    return outcomes
+
+
+def scan_knockouts(
+    gene_sentence: str,
+    knockouts: dict[str, list[str]],
+    metadata: dict[str, Any],
+    scan_dir: Optional[Path] = None,
+    max_workers: int = KNOCKOUT_WORKERS,
+    timeout: float = KNOCKOUT_TIMEOUT_SECONDS,
+    original_age: Optional[float] = None,
+) -> tuple[float, list[dict[str, Any]]]:
+    """Remove each gene (or gene set) from the same sentence and predict the age without it.
+
+    The original sentence is predicted once and shared by all knockouts. With a scan directory, every
+    prediction is appended to it as it arrives and predictions already there are reused, so an
+    interrupted scan continues where it stopped. If KNOCKOUT_BATCH_PREDICT_TOOL is configured, the
+    knockout sentences are sent KNOCKOUT_BATCH_SIZE at a time, else one call per sentence.
+
+    Args:
+        gene_sentence: Gene expression sentence (space-separated, descending expression)
+        knockouts: Label -> genes removed together (a single gene for a plain knockout)
+        metadata: Metadata of the cell (sex, tissue, cell_type, smoking_status), None values are left out
+        scan_dir: Directory recording the predictions of this sentence and metadata (None to keep nothing)
+        max_workers: Maximum number of concurrent MCP calls
+        timeout: Maximum time in seconds for a single call
+        original_age: Known prediction of the original sentence, predicted if None
+
+    Returns:
+        Tuple of (original age, ranked rows with the SCAN_COLUMNS)
+    """
+    known = load_scan_predictions(scan_dir) if scan_dir is not None else {}
+    if original_age is None:
+        original_age = known.get(gene_sentence)
+    if original_age is None:
+        original_age = predict_age(gene_sentence, metadata, timeout=timeout)
+        _record_predictions(scan_dir, {gene_sentence: original_age})
+
+    rows = []
+    for label, genes in knockouts.items():
+        positions = {gene: gene_position(gene_sentence, gene) for gene in genes}
+        present = [gene for gene, position in positions.items() if position is not None]
+        absent = [gene for gene, position in positions.items() if position is None]
+        rows.append({
+            "gene": label,
+            "genes": " ".join(genes),
+            "sentence_position": min((positions[gene] for gene in present), default=None),
+            "original_age": original_age,
+            "knockout_age": None,
+            "delta_age": None,
+            "error": "not in the gene sentence" if not present else (f"not in the sentence: {' '.join(absent)}" if absent else None),
+            "sentence": knockout_sentence(gene_sentence, present) if present else None,
+        })
+
+    pending = list(dict.fromkeys(
+        row["sentence"] for row in rows if row["sentence"] is not None and row["sentence"] not in known
+    ))
+    chunk_size = KNOCKOUT_BATCH_SIZE if KNOCKOUT_BATCH_PREDICT_TOOL else 1
+    chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+    outcomes: dict[str, Any] = dict(known)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        for chunk_outcomes in executor.map(lambda chunk: _predict_chunk(chunk, metadata, timeout, scan_dir), chunks):
+            outcomes.update(chunk_outcomes)
+
+    for row in rows:
+        outcome = outcomes.get(row.pop("sentence"))
+        if isinstance(outcome, Exception):
+            row["error"] = f"{type(outcome).__name__}: {outcome}"
+        elif outcome is not None:
+            row["knockout_age"] = outcome
+            row["delta_age"] = outcome - original_age
+    return original_age, rank_knockouts(rows)
+
+
+def run_knockouts(
+    gene_sentence: str,
+    genes: list[str],
+    metadata: dict[str, Any],
+    max_workers: int = KNOCKOUT_WORKERS,
+    timeout: float = KNOCKOUT_TIMEOUT_SECONDS,
+    original_age: Optional[float] = None,
+) -> tuple[float, list[dict[str, Any]]]:
+    """Knock out each gene from the same sentence and predict the age without it, see scan_knockouts().
+
+    Returns:
+        Tuple of (original age, ranked rows with the KNOCKOUT_COLUMNS)
+    """
+    knockouts = {gene: [gene] for gene in dict.fromkeys(genes)}
+    return scan_knockouts(gene_sentence, knockouts, metadata, max_workers=max_workers, timeout=timeout,
+                          original_age=original_age)
+
+
+def rank_knockouts(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Sort knockouts by the size of their effect (|delta age|, failed ones last) and number them."""
+    ranked = sorted(rows, key=lambda row: (row["delta_age"] is None, -abs(row["delta_age"] or 0.0)))
+    for rank, row in enumerate(ranked, start=1):
+        row["rank"] = rank if row["delta_age"] is not None else None
+        row["direction"] = direction(row["delta_age"])
+    return ranked
+
+
+def write_knockout_csv(
+    rows: list[dict[str, Any]],
+    filepath: Path,
+    columns: tuple[str, ...] = KNOCKOUT_COLUMNS,
+) -> Path:
+    """Write ranked knockout rows as CSV."""
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    with open(filepath, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+    return filepath
+
+
+def write_knockout_parquet(rows: list[dict[str, Any]], filepath: Path) -> Path:
+    """Write ranked knockout rows as Parquet (needs pyarrow).
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pylist([{column: row.get(column) for column in KNOCKOUT_COLUMNS} for row in rows])
+    pq.write_table(table, filepath)
+    return filepath
+
+
+def _age(value: Optional[float]) -> str:
+    return f"{value:.2f}" if value is not None else "—"
+
+
+def knockout_table_markdown(rows: list[dict[str, Any]], limit: Optional[int] = None) -> str:
+    """Render ranked knockout rows as a markdown table, optionally only the first limit rows."""
+    lines = [
+        "| Rank | Gene | Position in sentence | Knockout age | Delta age | Direction | Note |",
+        "|---:|---|---:|---:|---:|---|---|",
+    ]
+    for row in rows[:limit] if limit is not None else rows:
+        delta = f"{row['delta_age']:+.2f}" if row["delta_age"] is not None else "—"
+        lines.append(
+            f"| {row['rank'] or ''} | {row['gene']} | {row['sentence_position'] or ''} | {_age(row['knockout_age'])} "
+            f"| {delta} | {row['direction']} | {row['error'] or ''} |"
+        )
+    return "\n".join(lines)
+
+
+def metadata_table_markdown(gene_sentence: str, metadata: dict[str, Any]) -> str:
+    """Render the shared setup of a knockout screen (sentence and metadata) as a markdown table."""
+    lines = ["| Parameter | Value |", "|---|---|", f"| Gene sentence | {gene_sentence} |"]
+    for name in KNOCKOUT_METADATA_ARGUMENTS:
+        if metadata.get(name) is not None and metadata.get(name) != "":
+            lines.append(f"| {name} | {metadata[name]} |")
+    return "\n".join(lines)
+
+
+def render_knockout_report(
+    gene_name: str,
+    gene_sentence: str,
+    metadata: dict[str, Any],
+    original_age: float,
+    knockout_age: float,
+    model: Optional[str] = None,
+) -> str:
+    """Render a single knockout in the report structure of the insilico_knockout agent: delta age first, then the setup.
+
+    The interpretation section is left to the caller (or to the LLM).
+    """
+    delta_age = knockout_age - original_age
+    lines = [
+        f"# In-silico Knockout: {gene_name}",
+        "",
+        "## Results Summary",
+        "",
+        "| Metric | Value |",
+        "|---|---|",
+        f"| **Delta Age** | **{delta_age:+.2f} years - {direction(delta_age)}** |",
+        f"| Original Age | {original_age:.2f} years |",
+        f"| Knockout Age | {knockout_age:.2f} years |",
+        f"| Model | {model or KNOCKOUT_PREDICT_TOOL} |",
+        "",
+        "## Experimental Setup",
+        "",
+        "| Parameter | Value |",
+        "|---|---|",
+        f"| Gene knocked out | {gene_name} (position {gene_position(gene_sentence, gene_name)} of {len(sentence_genes(gene_sentence))}) |",
+        f"| Original sentence | {gene_sentence} |",
+        f"| Knockout sentence | {knockout_sentence(gene_sentence, [gene_name])} |",
+    ]
+    for name in KNOCKOUT_METADATA_ARGUMENTS:
+        if metadata.get(name) is not None and metadata.get(name) != "":
+            lines.append(f"| {name} | {metadata[name]} |")
+    lines.extend([
+        "",
+        "Positive delta: the knockout increases predicted age (gene may be protective/anti-aging); "
+        "negative delta: it decreases predicted age (gene may be pro-aging).",
+    ])
+    return "\n".join(lines) + "\n"
+
+
+def write_rank_plot_data(rows: list[dict[str, Any]], filepath: Path) -> Path:
+    """Write the data of a rank plot (rank vs delta age) of predicted knockouts as TSV."""
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    with open(filepath, "w", encoding="utf-8") as f:
+        f.write("rank\tknockout\tdelta_age\tabs_delta_age\n")
+        for row in rows:
+            if row["delta_age"] is not None:
+                f.write(f"{row['rank']}\t{row['gene']}\t{row['delta_age']:.6f}\t{abs(row['delta_age']):.6f}\n")
+    return filepath
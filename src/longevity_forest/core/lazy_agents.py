@@ -0,0 +1,166 @@
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from just_agents.just_bus import JustLogBus
+from just_agents.web.web_agent import WebAgent
+
+from longevity_forest.core.agent_profiles import build_agent
+
+
+# shortname -> proxy of a sub-agent that call_expert_agent builds on first use
+_lazy_agents: dict[str, "LazyAgent"] = {}
+_lazy_agents_guard = threading.Lock()
+# time.perf_counter() when agent loading started and when the first LLM call was made
+_timings: dict[str, Optional[float]] = {"started": None, "first_llm_call": None}
+
+
+class LazyAgent:
+    """Stand-in for a WebAgent profile of a YAML config that is only built when it is first needed.
+
+    Building a WebAgent resolves its tools and connects to its MCP servers, which is wasted for
+    sub-agents a run never calls. Attribute access goes to the agent, building it if necessary.
+
+    An agent keeps a single conversation memory, so concurrent calls take separate instances with
+    checkout(): up to max_instances of them, the first one being the agent returned by get().
+    """
+
+    def __init__(self, section_name: str, config_file: Path, description: str, max_instances: int = 1):
+        self.shortname = section_name
+        self.config_file = config_file
+        self.label = description
+        self.max_instances = max(1, max_instances)
+        self.construction_seconds: Optional[float] = None
+        self._agent: Optional[WebAgent] = None
+        self._lock = threading.Lock()
+        # Every built instance, and the ones no call is using right now
+        self._instances: list[WebAgent] = []
+        self._idle: list[WebAgent] = []
+        self._slots = threading.BoundedSemaphore(self.max_instances)
+
+    @property
+    def loaded(self) -> bool:
+        return self._agent is not None
+
+    def get(self) -> WebAgent:
+        """Return the agent, building it on the first call (concurrent first calls build it once)."""
+        if self._agent is not None:
+            return self._agent
+        with self._lock:
+            if self._agent is None:
+                start = time.perf_counter()
+                agent = build_agent(self.shortname, self.config_file)
+                self.construction_seconds = time.perf_counter() - start
+                self._agent = agent
+                self._instances.append(agent)
+                self._idle.append(agent)
+                print(f"✓ Loaded {self.shortname} ({self.label}) in {self.construction_seconds:.2f}s")
+                JustLogBus().info(f"Loaded {self.shortname} on first use",
+                                  source="lazy_agents",
+                                  action="lazy_agents.construct",
+                                  agent_name=self.shortname,
+                                  seconds=self.construction_seconds)
+        return self._agent
+
+    @property
+    def instances(self) -> list[WebAgent]:
+        """Every instance built so far, the first one first."""
+        with self._lock:
+            return list(self._instances)
+
+    @contextmanager
+    def checkout(self) -> Iterator[WebAgent]:
+        """Use an instance no other call is using, waiting while max_instances are in use.
+
+        Another instance is only built when every existing one is in use.
+        """
+        with self._slots:
+            self.get()
+            with self._lock:
+                agent = self._idle.pop() if self._idle else None
+            if agent is None:
+                start = time.perf_counter()
+                agent = build_agent(self.shortname, self.config_file)
+                with self._lock:
+                    self._instances.append(agent)
+                    count = len(self._instances)
+                print(f"✓ Loaded {self.shortname} instance {count} of at most {self.max_instances} "
+                      f"for a concurrent call in {time.perf_counter() - start:.2f}s")
+                JustLogBus().info(f"Loaded another {self.shortname} instance for a concurrent call",
+                                  source="lazy_agents",
+                                  action="lazy_agents.construct_instance",
+                                  agent_name=self.shortname,
+                                  instances=count,
+                                  max_instances=self.max_instances,
+                                  seconds=time.perf_counter() - start)
+            try:
+                yield agent
+            finally:
+                with self._lock:
+                    self._idle.append(agent)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the proxy itself doesn't have
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.get(), name)
+
+
+def register_lazy_agent(agent: LazyAgent) -> LazyAgent:
+    """Make a sub-agent available to call_expert_agent without building it yet (replaces one with the same shortname)."""
+    with _lazy_agents_guard:
+        _lazy_agents[agent.shortname] = agent
+    return agent
+
+
+def get_lazy_agent(shortname: str) -> Optional[LazyAgent]:
+    """Return the registered proxy of a sub-agent, None if there is none."""
+    with _lazy_agents_guard:
+        return _lazy_agents.get(shortname)
+
+
+def loaded_agents(agents: list) -> list[WebAgent]:
+    """Return the agents of a list that were actually built, proxies replaced by all their instances."""
+    built = []
+    for agent in agents:
+        if isinstance(agent, LazyAgent):
+            built.extend(agent.instances)
+        else:
+            built.append(agent)
+    return built
+
+
+def start_timing() -> None:
+    """Mark the start of agent loading, the reference point of the time to the first LLM call."""
+    _timings["started"] = time.perf_counter()
+    _timings["first_llm_call"] = None
+
+
+def record_first_llm_call() -> None:
+    """Note that the first LLM call of the run is about to be made (later calls are ignored)."""
+    if _timings["started"] is not None and _timings["first_llm_call"] is None:
+        _timings["first_llm_call"] = time.perf_counter()
+        JustLogBus().info("First LLM call",
+                          source="lazy_agents",
+                          action="lazy_agents.first_llm_call",
+                          seconds=_timings["first_llm_call"] - _timings["started"])
+
+
+def print_agent_timings() -> None:
+    """Print the time from agent loading to the first LLM call and the construction time of every sub-agent."""
+    print("\nAgent startup timings:")
+    print("-" * 60)
+    if _timings["started"] is not None and _timings["first_llm_call"] is not None:
+        print(f"  Time to first LLM call: {_timings['first_llm_call'] - _timings['started']:.2f}s")
+    with _lazy_agents_guard:
+        agents = list(_lazy_agents.values())
+    for agent in agents:
+        if agent.loaded:
+            instances = len(agent.instances)
+            extra = f" ({instances} instances for concurrent calls)" if instances > 1 else ""
+            print(f"  {agent.shortname}: built in {agent.construction_seconds:.2f}s{extra}")
+        else:
+            print(f"  {agent.shortname}: never used, not built")
+    print("-" * 60)
@@ -0,0 +1,204 @@
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Optional, Union
+
+from just_agents.just_bus import JustLogBus
+from just_agents.mcp_client import MCPClient, MCPClientLocator, MCPToolInvocationResult
+
+from longevity_forest.config.mcp import (
+    MCP_POOL_HEALTH_CHECK_AFTER_SECONDS,
+    MCP_POOL_IDLE_SECONDS,
+    MCP_POOL_PING_TIMEOUT_SECONDS,
+    MCP_POOL_SWEEP_INTERVAL_SECONDS,
+)
+
+
+# just_agents reuses a client only for byte-identical configs, the pool maps every config of a
+# server URL to the same client (and so the same session and HTTP connections)
+_pool: dict[str, MCPClient] = {}
+_pool_lock = threading.Lock()
+# client_key -> time.monotonic() of the last finished call, and calls still running
+_last_used: dict[str, float] = {}
+_in_flight: dict[str, int] = {}
+_usage_lock = threading.Lock()
+# client_key -> lock serializing connects on the client loop
+_connect_locks: dict[str, asyncio.Lock] = {}
+
+_original_get_client_by_inputs = None
+_original_connect = None
+_original_invoke_tool = None
+_sweeper: Optional[threading.Thread] = None
+
+
+def pool_key(mcp_client_config: Union[dict[str, Any], str, None]) -> Optional[str]:
+    """Return the server URL a single-server HTTP config connects to, None for stdio or multi-server configs."""
+    config = mcp_client_config
+    if isinstance(config, str):
+        if config.startswith(("http://", "https://")):
+            return config.rstrip("/")
+        try:
+            config = json.loads(config)
+        except json.JSONDecodeError:
+            return None
+    if not isinstance(config, dict):
+        return None
+    servers = config.get("mcpServers", {})
+    if len(servers) != 1:
+        return None
+    server = next(iter(servers.values()))
+    url = server.get("url") if isinstance(server, dict) else None
+    return url.rstrip("/") if url else None
+
+
+def _pooled_get_client_by_inputs(cls, mcp_client_config=None, **kwargs) -> MCPClient:
+    key = pool_key(mcp_client_config)
+    if key is None:
+        return _original_get_client_by_inputs(mcp_client_config=mcp_client_config, **kwargs)
+    with _pool_lock:
+        client = _pool.get(key)
+        if client is None:
+            client = _original_get_client_by_inputs(mcp_client_config=mcp_client_config, **kwargs)
+            _pool[key] = client
+        return client
+
+
+def _idle_since_last_call(client_key: str) -> float:
+    # Caller holds _usage_lock
+    if _in_flight.get(client_key, 0) > 0:
+        return 0.0
+    last_used = _last_used.get(client_key)
+    return time.monotonic() - last_used if last_used is not None else 0.0
+
+
+def _idle_seconds(client: MCPClient) -> float:
+    with _usage_lock:
+        return _idle_since_last_call(client.client_key)
+
+
+def _connect_lock(client: MCPClient) -> asyncio.Lock:
+    # Only used on the client loop, so setdefault can't race
+    return _connect_locks.setdefault(client.client_key, asyncio.Lock())
+
+
+async def _is_healthy(client: MCPClient) -> bool:
+    try:
+        return client._client.is_connected() and await asyncio.wait_for(
+            client._client.ping(), timeout=MCP_POOL_PING_TIMEOUT_SECONDS
+        )
+    except Exception:
+        return False
+
+
+async def _replace_if_unhealthy(client: MCPClient, idle_seconds: float) -> None:
+    # Caller holds the connect lock. A session that sat unused may have been dropped by the server
+    # or a proxy, so ping it before handing it out again
+    if client._client is not None and idle_seconds > MCP_POOL_HEALTH_CHECK_AFTER_SECONDS:
+        if not await _is_healthy(client):
+            JustLogBus().info("Replacing unresponsive MCP session",
+                              source="mcp_pool",
+                              action="mcp_pool.reconnect",
+                              client_key=client.client_key,
+                              idle_seconds=idle_seconds)
+            await client._close()
+
+
+async def _checked_connect(self: MCPClient) -> None:
+    # Runs on the client loop at the start of every call. Concurrent first calls would each see a
+    # session that is still being opened, close it and open their own, so connects take turns.
+    # Tool calls are health-checked in _tracked_invoke_tool, where this check always sees them in flight
+    async with _connect_lock(self):
+        await _replace_if_unhealthy(self, _idle_seconds(self))
+        await _original_connect(self)
+    with _usage_lock:
+        _last_used.setdefault(self.client_key, time.monotonic())
+
+
+async def _tracked_invoke_tool(self: MCPClient, tool_name: str, kwargs: dict[str, Any]) -> MCPToolInvocationResult:
+    # The idle time is taken before this call counts as in flight, and the session is checked
+    # before the connect of the original invoke_tool reuses it
+    with _usage_lock:
+        idle_seconds = _idle_since_last_call(self.client_key)
+        _in_flight[self.client_key] = _in_flight.get(self.client_key, 0) + 1
+    try:
+        if idle_seconds > MCP_POOL_HEALTH_CHECK_AFTER_SECONDS:
+            async with _connect_lock(self):
+                await _replace_if_unhealthy(self, idle_seconds)
+        return await _original_invoke_tool(self, tool_name, kwargs)
+    finally:
+        with _usage_lock:
+            _in_flight[self.client_key] -= 1
+            _last_used[self.client_key] = time.monotonic()
+
+
+async def _close_if_idle(client: MCPClient, max_idle_seconds: float) -> bool:
+    # Runs on the client loop under the connect lock, so a call starting meanwhile waits in its
+    # connect and reconnects instead of having its session closed underneath it
+    async with _connect_lock(client):
+        if client._client is None:
+            return False
+        with _usage_lock:
+            if _in_flight.get(client.client_key, 0) > 0:
+                return False
+            idle_seconds = _idle_since_last_call(client.client_key)
+        try:
+            connected = client._client.is_connected()
+        except Exception:
+            connected = False
+        if connected and idle_seconds <= max_idle_seconds:
+            return False
+        await client._close()
+        return True
+
+
+def close_idle_sessions(max_idle_seconds: float = MCP_POOL_IDLE_SECONDS) -> int:
+    """Close the sessions of MCP clients that are disconnected or unused for longer than max_idle_seconds.
+
+    The clients stay registered and reconnect on their next call. Sessions with calls in flight are
+    never closed.
+
+    Returns:
+        Number of closed sessions
+    """
+    closed = 0
+    for client in MCPClientLocator().get_all_clients():
+        if client._client is None:
+            continue
+        try:
+            if asyncio.run_coroutine_threadsafe(_close_if_idle(client, max_idle_seconds),
+                                                client.get_loop()).result(timeout=30.0):
+                closed += 1
+        except Exception as e:
+            print(f"⚠ Failed to close MCP session {client.client_key}: {e}")
+    return closed
+
+
+def _sweep() -> None:
+    while True:
+        time.sleep(MCP_POOL_SWEEP_INTERVAL_SECONDS)
+        closed = close_idle_sessions()
+        if closed:
+            JustLogBus().debug(f"Closed {closed} idle MCP sessions",
+                               source="mcp_pool",
+                               action="mcp_pool.expire",
+                               closed=closed)
+
+
+def install_mcp_pool() -> None:
+    """Share one MCP client per server URL, health-check reused sessions and expire idle ones, once per process.
+
+    Must run before the rate limiter and the tool cache are installed, so that only real calls to
+    the server count as session use.
+    """
+    global _original_get_client_by_inputs, _original_connect, _original_invoke_tool, _sweeper
+    if _original_get_client_by_inputs is not None:
+        return
+    _original_get_client_by_inputs = MCPClient.get_client_by_inputs
+    MCPClient.get_client_by_inputs = classmethod(_pooled_get_client_by_inputs)
+    _original_connect = MCPClient._connect
+    MCPClient._connect = _checked_connect
+    _original_invoke_tool = MCPClient.invoke_tool
+    MCPClient.invoke_tool = _tracked_invoke_tool
+    _sweeper = threading.Thread(target=_sweep, daemon=True, name="MCPPoolSweeper")
+    _sweeper.start()
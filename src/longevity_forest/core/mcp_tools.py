@@ -0,0 +1,105 @@
+import json
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from just_agents.just_async import run_async_function_synchronously
+
+if TYPE_CHECKING:
+    from just_agents.mcp_client import MCPClient, MCPToolInvocationResult
+
+
+def get_mcp_client(mcp_client_config: Union[dict[str, Any], str]) -> "MCPClient":
+    """Return the process-wide MCP client for a server config, the same one the agents use.
+
+    Args:
+        mcp_client_config: Config dict like the ones in config/mcp.py, or its JSON string
+
+    Returns:
+        The pooled MCPClient
+    """
+    # Imported here: just_agents.mcp_client takes a second to import, which commands that only read
+    # job databases (design status, batch status) shouldn't pay
+    from just_agents.mcp_client import MCPClient
+    if isinstance(mcp_client_config, dict):
+        mcp_client_config = json.dumps(mcp_client_config)
+    return MCPClient.get_client_by_inputs(mcp_client_config=mcp_client_config)
+
+
+def call_mcp_tool(
+    mcp_client_config: Union[dict[str, Any], str],
+    tool_name: str,
+    arguments: dict[str, Any],
+    timeout: Optional[float] = None,
+) -> "MCPToolInvocationResult":
+    """Invoke an MCP tool directly, without an LLM in the loop.
+
+    Goes through MCPClient.invoke_tool, so the shared tool cache applies.
+
+    Args:
+        mcp_client_config: Config dict like the ones in config/mcp.py, or its JSON string
+        tool_name: Name of the MCP tool
+        arguments: Tool arguments
+        timeout: Maximum time in seconds to wait for the result (None waits indefinitely)
+
+    Returns:
+        The raw invocation result (error_code 0 on success)
+
+    Raises:
+        TimeoutError: If the call takes longer than timeout
+    """
+    client = get_mcp_client(mcp_client_config)
+    return run_async_function_synchronously(
+        client.invoke_tool,
+        tool_name,
+        arguments,
+        timeout=timeout,
+        target_loop=client.get_loop(),
+    )
+
+
+def parse_tool_content(content: str) -> Any:
+    """Decode the JSON content items of an MCP tool result the same way agent tools do.
+
+    Args:
+        content: MCPToolInvocationResult.content
+
+    Returns:
+        The decoded value (a list for multiple content items), or the raw content if it isn't JSON
+    """
+    values = []
+    try:
+        for line in content.split("\n"):
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            if isinstance(item, dict) and "text" in item:
+                try:
+                    values.append(json.loads(item["text"]))
+                except (json.JSONDecodeError, TypeError):
+                    values.append(item["text"])
+            else:
+                values.append(item)
+    except json.JSONDecodeError:
+        return content
+    return values[0] if len(values) == 1 else values
+
+
+def list_mcp_tool_names(
+    mcp_client_config: Union[dict[str, Any], str],
+    timeout: Optional[float] = None,
+) -> list[str]:
+    """Return the names of the tools an MCP server offers.
+
+    Args:
+        mcp_client_config: Config dict like the ones in config/mcp.py, or its JSON string
+        timeout: Maximum time in seconds to wait for the server (None waits indefinitely)
+
+    Raises:
+        TimeoutError: If listing takes longer than timeout
+    """
+    client = get_mcp_client(mcp_client_config)
+    tools = run_async_function_synchronously(
+        client._fetch_tool_info,
+        timeout=timeout,
+        target_loop=client.get_loop(),
+    )
+    return [tool.name for tool in tools]
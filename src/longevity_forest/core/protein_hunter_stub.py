@@ -0,0 +1,113 @@
+import asyncio
+import hashlib
+import random
+import threading
+import time
+import uuid
+from typing import Any, Optional
+
+from longevity_forest.config.design import (
+    DESIGN_CONTACTS_ARGUMENT,
+    DESIGN_NAME_ARGUMENT,
+    DESIGN_STATUS_TOOL,
+    DESIGN_SUBMIT_TOOL,
+    DESIGN_TARGET_ARGUMENT,
+    DESIGN_TOOL_DEFAULTS,
+)
+
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+
+
+def fake_design(tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Return a made-up but reproducible design result for a design tool call."""
+    seed = hashlib.sha256(f"{tool_name}:{sorted(arguments.items())}".encode()).hexdigest()
+    rng = random.Random(seed)
+    name = arguments.get(DESIGN_NAME_ARGUMENT) or tool_name
+    return {
+        "design_name": name,
+        "tool": tool_name,
+        "contacts": arguments.get(DESIGN_CONTACTS_ARGUMENT),
+        "binder_sequence": "".join(rng.choice(AMINO_ACIDS) for _ in range(rng.randint(60, 90))),
+        "iptm": round(rng.uniform(0.6, 0.95), 3),
+        "plddt": round(rng.uniform(70.0, 95.0), 1),
+        "structure_path": f"/results/{name}/{name}_best.cif",
+        "stub": True,
+    }
+
+
+def create_stub_server(design_seconds: float = 60.0, job_tools: bool = True):
+    """Build a FastMCP server imitating the protein hunter server, with designs that take design_seconds.
+
+    Offers the Boltz and Chai design tools as blocking calls and, with job_tools, DESIGN_SUBMIT_TOOL and
+    DESIGN_STATUS_TOOL to run them as background jobs. Jobs live in memory, so restarting the stub loses them.
+    """
+    from fastmcp import FastMCP
+
+    server = FastMCP("protein-hunter-stub")
+    jobs: dict[str, dict[str, Any]] = {}
+    jobs_lock = threading.Lock()
+
+    def check_arguments(arguments: dict[str, Any]) -> None:
+        if not arguments.get(DESIGN_TARGET_ARGUMENT):
+            raise ValueError(f"{DESIGN_TARGET_ARGUMENT} is required")
+
+    def design_tool(tool_name: str):
+        # Async, so a running design doesn't block the server's other calls
+        async def tool(
+            target_sequence: str,
+            design_name: Optional[str] = None,
+            contact_residues: Optional[str] = None,
+            num_designs: int = 1,
+            num_cycles: int = 5,
+            n_trials: int = 1,
+            n_cycles: int = 5,
+        ) -> dict[str, Any]:
+            arguments = {DESIGN_TARGET_ARGUMENT: target_sequence, DESIGN_NAME_ARGUMENT: design_name,
+                         DESIGN_CONTACTS_ARGUMENT: contact_residues}
+            check_arguments(arguments)
+            await asyncio.sleep(design_seconds)
+            return fake_design(tool_name, arguments)
+        return tool
+
+    for tool_name in DESIGN_TOOL_DEFAULTS:
+        server.tool(design_tool(tool_name), name=tool_name,
+                    description=f"Stub of {tool_name}, takes {design_seconds:.0f}s")
+
+    if job_tools:
+        def submit_design(tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+            job_id = uuid.uuid4().hex
+            with jobs_lock:
+                jobs[job_id] = {"job_id": job_id, "status": "queued", "result": None, "error": None}
+
+            def work() -> None:
+                with jobs_lock:
+                    jobs[job_id]["status"] = "running"
+                try:
+                    check_arguments(arguments)
+                    time.sleep(design_seconds)
+                    result = fake_design(tool_name, arguments)
+                    outcome = {"status": "completed", "result": result}
+                except Exception as e:
+                    outcome = {"status": "failed", "error": f"{type(e).__name__}: {e}"}
+                with jobs_lock:
+                    jobs[job_id].update(outcome)
+
+            threading.Thread(target=work, daemon=True).start()
+            return {"job_id": job_id}
+
+        def get_design_job(job_id: str) -> dict[str, Any]:
+            with jobs_lock:
+                if job_id not in jobs:
+                    raise ValueError(f"Unknown design job {job_id}")
+                return dict(jobs[job_id])
+
+        server.tool(submit_design, name=DESIGN_SUBMIT_TOOL,
+                    description="Start a design tool call in the background and return its job_id")
+        server.tool(get_design_job, name=DESIGN_STATUS_TOOL,
+                    description="Return status (queued/running/completed/failed), result and error of a design job")
+    return server
+
+
+def serve_stub(port: int = 8770, design_seconds: float = 60.0, job_tools: bool = True) -> None:
+    """Run the stub protein hunter server on http://127.0.0.1:<port>/mcp until interrupted."""
+    create_stub_server(design_seconds, job_tools).run(transport="http", host="127.0.0.1", port=port)
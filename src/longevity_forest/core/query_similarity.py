@@ -0,0 +1,246 @@
+import math
+import re
+import threading
+import zlib
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from longevity_forest.config.cache import SIMILARITY_IGNORED_IDENTIFIERS, SIMILARITY_NGRAM_RANGE
+from longevity_forest.core.interim_index import INTERIM_DIR, connect_index, index_path
+
+
+# Gene/protein-like tokens: anything containing a digit (NFE2L2, rs429358) or written in capitals (APOE, MTOR)
+_IDENTIFIER_PATTERN = re.compile(r"\b(?:[A-Za-z0-9-]*\d[A-Za-z0-9-]*|[A-Z][A-Z0-9-]{2,})\b")
+
+_WORD_PATTERN = re.compile(r"[A-Za-z0-9-]+")
+
+# Request phrasing that carries no meaning for what is being asked
+_STOPWORDS = frozenset({
+    "a", "about", "all", "an", "and", "any", "are", "as", "at", "by", "can", "database", "db", "do", "does",
+    "find", "for", "from", "gene", "genes", "get", "give", "in", "info", "information", "is", "it", "its",
+    "known", "list", "look", "me", "of", "on", "or", "please", "protein", "provide", "query", "retrieve",
+    "return", "search", "show", "that", "the", "their", "this", "to", "up", "use", "using", "via", "what",
+    "which", "with",
+})
+
+# Per (interim dir, agent, config) corpus; new index entries are appended to it, it is only rebuilt
+# when entries were removed. Corpora are never modified, so a thread can keep scoring an older one
+_corpus_cache: dict[tuple[str, str, str], "QueryCorpus"] = {}
+_corpus_lock = threading.Lock()
+
+
+def content_words(text: str) -> str:
+    """Strip identifiers, data source names and request phrasing, keeping what is being asked for.
+
+    Identifiers are compared exactly by identifier_tokens, so only the remaining words are scored.
+    """
+    identifiers = identifier_tokens(text)
+    words = [
+        word.lower() for word in _WORD_PATTERN.findall(text)
+        if word.upper() not in identifiers
+        and word.upper() not in SIMILARITY_IGNORED_IDENTIFIERS
+        and word.lower() not in _STOPWORDS
+    ]
+    return " ".join(words)
+
+
+def normalize_for_ngrams(text: str) -> str:
+    """Lowercase, collapse whitespace and pad the text so word boundaries become part of the n-grams."""
+    return " " + " ".join(text.lower().split()) + " "
+
+
+def hashed_ngrams(text: str, ngram_range: tuple[int, int] = SIMILARITY_NGRAM_RANGE) -> np.ndarray:
+    """Return stable 32-bit hashes of all character n-grams of the text (with repetitions)."""
+    normalized = normalize_for_ngrams(content_words(text))
+    low, high = ngram_range
+    grams = [
+        normalized[start:start + size]
+        for size in range(low, high + 1)
+        for start in range(len(normalized) - size + 1)
+    ]
+    return np.fromiter((zlib.crc32(gram.encode("utf-8")) for gram in grams), dtype=np.uint32, count=len(grams))
+
+
+def identifier_tokens(text: str) -> frozenset[str]:
+    """Extract gene, protein and variant identifiers that must match exactly for two queries to be equivalent."""
+    tokens = {token.upper() for token in _IDENTIFIER_PATTERN.findall(text)}
+    return frozenset(tokens - SIMILARITY_IGNORED_IDENTIFIERS)
+
+
+def _tf(hashes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    unique, counts = np.unique(hashes, return_counts=True)
+    return unique, 1.0 + np.log(counts)
+
+
+class QueryCorpus:
+    """Character n-gram TF-IDF model over the cached queries of one agent configuration."""
+
+    def __init__(
+        self,
+        filenames: list[str],
+        queries: list[str],
+        created_at: list[float],
+        signature: Optional[tuple[int, int]] = None,
+        documents: Optional[list[tuple[np.ndarray, np.ndarray]]] = None,
+        identifiers: Optional[list[frozenset[str]]] = None,
+    ) -> None:
+        self.signature = signature
+        self.filenames = filenames
+        self.queries = queries
+        self.created_at = np.asarray(created_at, dtype=np.float64)
+        self.identifiers = identifiers if identifiers is not None else [identifier_tokens(query) for query in queries]
+
+        # Term frequencies of every query, the expensive part, kept so that extended() can reuse them
+        per_doc = documents if documents is not None else [_tf(hashed_ngrams(query)) for query in queries]
+        self._documents = per_doc
+        doc_count = len(queries)
+        if per_doc:
+            hashes = np.concatenate([unique for unique, _ in per_doc])
+            tfs = np.concatenate([tf for _, tf in per_doc])
+            doc_ids = np.concatenate([np.full(len(unique), i, dtype=np.int64) for i, (unique, _) in enumerate(per_doc)])
+        else:
+            hashes = np.empty(0, dtype=np.uint32)
+            tfs = np.empty(0, dtype=np.float64)
+            doc_ids = np.empty(0, dtype=np.int64)
+
+        self._vocabulary, df = np.unique(hashes, return_counts=True)
+        self._doc_count = doc_count
+        self._idf = np.log((1.0 + doc_count) / (1.0 + df)) + 1.0
+
+        weights = tfs * self._idf[np.searchsorted(self._vocabulary, hashes)] if len(hashes) else tfs
+        norms = np.sqrt(np.bincount(doc_ids, weights=weights ** 2, minlength=doc_count))
+        norms[norms == 0] = 1.0
+        self._hashes = hashes
+        self._doc_ids = doc_ids
+        self._weights = weights / norms[doc_ids] if len(hashes) else weights
+
+    def __len__(self) -> int:
+        return self._doc_count
+
+    def extended(
+        self,
+        filenames: list[str],
+        queries: list[str],
+        created_at: list[float],
+        signature: Optional[tuple[int, int]] = None,
+    ) -> "QueryCorpus":
+        """Return a new corpus with more queries appended; only the new queries are split into n-grams."""
+        return QueryCorpus(
+            filenames=self.filenames + filenames,
+            queries=self.queries + queries,
+            created_at=list(self.created_at) + created_at,
+            signature=signature,
+            documents=self._documents + [_tf(hashed_ngrams(query)) for query in queries],
+            identifiers=self.identifiers + [identifier_tokens(query) for query in queries],
+        )
+
+    def _query_vector(self, text: str) -> tuple[np.ndarray, np.ndarray]:
+        unique, tf = _tf(hashed_ngrams(text))
+        positions = np.searchsorted(self._vocabulary, unique)
+        known = positions < len(self._vocabulary)
+        known[known] = self._vocabulary[positions[known]] == unique[known]
+        unseen_idf = math.log(1.0 + self._doc_count) + 1.0
+        idf = np.full(len(unique), unseen_idf)
+        idf[known] = self._idf[positions[known]]
+        weights = tf * idf
+        norm = float(np.sqrt(np.sum(weights ** 2))) or 1.0
+        return unique, weights / norm
+
+    def scores(self, text: str) -> np.ndarray:
+        """Cosine similarity of the text against every cached query."""
+        if not self._doc_count:
+            return np.empty(0)
+        query_hashes, query_weights = self._query_vector(text)
+        positions = np.searchsorted(query_hashes, self._hashes)
+        shared = positions < len(query_hashes)
+        shared[shared] = query_hashes[positions[shared]] == self._hashes[shared]
+        contributions = self._weights[shared] * query_weights[positions[shared]]
+        return np.bincount(self._doc_ids[shared], weights=contributions, minlength=self._doc_count)
+
+
+def _load_corpus(agent_name: str, config_hash: str, interim_dir: Path) -> QueryCorpus:
+    cache_id = (str(interim_dir.resolve()), agent_name, config_hash)
+    with _corpus_lock, connect_index(interim_dir) as connection:
+        # (entry count, highest entry id): entries are only ever added with a higher id or removed
+        signature = connection.execute(
+            "SELECT COUNT(*), COALESCE(MAX(id), 0) FROM entries WHERE agent_name = ? AND config_hash = ?",
+            (agent_name, config_hash),
+        ).fetchone()
+        corpus = _corpus_cache.get(cache_id)
+        if corpus is not None and corpus.signature == signature:
+            return corpus
+        if corpus is not None and corpus.signature is not None:
+            # Entries stored since the corpus was built are appended, unless some were removed meanwhile
+            count, last_id = corpus.signature
+            rows = connection.execute(
+                "SELECT filename, query, created_at FROM entries "
+                "WHERE agent_name = ? AND config_hash = ? AND id > ? ORDER BY id",
+                (agent_name, config_hash, last_id),
+            ).fetchall()
+            if count + len(rows) == signature[0]:
+                rows = [row for row in rows if row[1] != ""]
+                corpus = corpus.extended(
+                    filenames=[row[0] for row in rows],
+                    queries=[row[1] for row in rows],
+                    created_at=[row[2] for row in rows],
+                    signature=signature,
+                )
+                _corpus_cache[cache_id] = corpus
+                return corpus
+        rows = connection.execute(
+            "SELECT filename, query, created_at FROM entries "
+            "WHERE agent_name = ? AND config_hash = ? AND query != '' ORDER BY id",
+            (agent_name, config_hash),
+        ).fetchall()
+
+        corpus = QueryCorpus(
+            filenames=[row[0] for row in rows],
+            queries=[row[1] for row in rows],
+            created_at=[row[2] for row in rows],
+            signature=signature,
+        )
+        _corpus_cache[cache_id] = corpus
+        return corpus
+
+
+def find_similar_query(
+    agent_name: str,
+    user_query: str,
+    config_hash: str,
+    min_created_at: float = 0.0,
+    interim_dir: Path = INTERIM_DIR,
+) -> Optional[tuple[str, str, float]]:
+    """Find the most similar cached query previously answered by the same agent configuration.
+
+    Candidates must be younger than min_created_at and mention exactly the same gene/protein identifiers,
+    so "orthologs of NFE2L2" never matches "orthologs of NFE2L1" however close the strings are.
+
+    Args:
+        agent_name: Shortname of the expert agent
+        user_query: The new query
+        config_hash: Result of agent_config_hash for the agent
+        min_created_at: Oldest acceptable creation time (unix seconds)
+        interim_dir: Directory holding the interim results
+
+    Returns:
+        Tuple of (filename, cached query, cosine similarity) for the best candidate, None if there is none
+    """
+    if not index_path(interim_dir).exists():
+        return None
+    corpus = _load_corpus(agent_name, config_hash, interim_dir)
+    if not len(corpus):
+        return None
+
+    scores = corpus.scores(user_query)
+    identifiers = identifier_tokens(user_query)
+    eligible = np.array(
+        [candidate == identifiers for candidate in corpus.identifiers], dtype=bool
+    ) & (corpus.created_at >= min_created_at)
+    if not eligible.any():
+        return None
+
+    scores = np.where(eligible, scores, -1.0)
+    best = int(np.argmax(scores))
+    return corpus.filenames[best], corpus.queries[best], float(scores[best])
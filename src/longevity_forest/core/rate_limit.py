@@ -0,0 +1,300 @@
+import asyncio
+import json
+import random
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+import litellm
+import yaml
+from just_agents.just_bus import JustLogBus
+from just_agents.mcp_client import MCPClient, MCPToolInvocationResult
+import just_agents.protocols.litellm_protocol as litellm_protocol
+
+from longevity_forest.config.cache import CHARS_PER_TOKEN
+from longevity_forest.core.interim_index import INTERIM_DIR
+
+
+RATE_LIMITS_FILE = Path(__file__).parent.parent / "config" / "rate_limits.yaml"
+RATE_LIMITS_DB_FILENAME = "rate_limits.sqlite"
+
+RATE_LIMITS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    level REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+# Process-wide settings, the limiter sits below the agents so it can't be configured per call
+_settings: dict[str, Any] = {
+    "enabled": True,
+    "limits_file": RATE_LIMITS_FILE,
+    "limits": None,
+    "state_dir": INTERIM_DIR,
+}
+
+# Bucket databases whose schema and WAL mode were set up by this process
+_prepared: set[Path] = set()
+_prepared_lock = threading.Lock()
+
+_original_completion = None
+_original_invoke_tool = None
+
+
+def load_rate_limits(limits_file: Path = RATE_LIMITS_FILE) -> dict[str, Any]:
+    """Read the rate limits file, see config/rate_limits.yaml for the format."""
+    limits = yaml.safe_load(limits_file.read_text(encoding="utf-8")) or {}
+    return {
+        "llm": limits.get("llm") or {},
+        "mcp": limits.get("mcp") or {},
+        "retry": limits.get("retry") or {},
+    }
+
+
+def configure_rate_limits(
+    enabled: bool = True,
+    limits_file: Optional[Path] = None,
+    state_dir: Optional[Path] = None,
+) -> None:
+    """Enable or disable rate limiting of LLM and MCP calls and install it into just_agents.
+
+    Must run before configure_tool_cache, so that answers from the tool cache are not throttled.
+
+    Args:
+        enabled: Whether LLM and MCP calls wait for their rate limit buckets
+        limits_file: Rate limits file (defaults to config/rate_limits.yaml)
+        state_dir: Directory of the bucket database shared by all processes (defaults to data/interim)
+    """
+    _settings["enabled"] = enabled
+    if limits_file is not None:
+        _settings["limits_file"] = limits_file
+    _settings["limits"] = load_rate_limits(_settings["limits_file"])
+    if state_dir is not None:
+        _settings["state_dir"] = state_dir
+    install_rate_limits()
+
+
+def get_rate_limit_settings() -> dict[str, Any]:
+    """Return the current settings as keyword arguments of configure_rate_limits (e.g. for worker processes)."""
+    return {
+        "enabled": _settings["enabled"],
+        "limits_file": _settings["limits_file"],
+        "state_dir": _settings["state_dir"],
+    }
+
+
+def _limits() -> dict[str, Any]:
+    if _settings["limits"] is None:
+        _settings["limits"] = load_rate_limits(_settings["limits_file"])
+    return _settings["limits"]
+
+
+def _connect() -> sqlite3.Connection:
+    path = _settings["state_dir"] / RATE_LIMITS_DB_FILENAME
+    with _prepared_lock:
+        prepared = path in _prepared and path.exists()
+    if not prepared:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    # Autocommit mode, transactions are opened explicitly with BEGIN IMMEDIATE
+    connection = sqlite3.connect(path, timeout=30.0, isolation_level=None)
+    if not prepared:
+        # WAL mode is stored in the database file, so it and the schema are set up once per process
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(RATE_LIMITS_SCHEMA)
+        with _prepared_lock:
+            _prepared.add(path)
+    return connection
+
+
+def reserve(bucket: str, amount: float, per_minute: float) -> float:
+    """Take amount from a token bucket refilled at per_minute, holding at most one minute worth.
+
+    The bucket may go into debt: every caller reserves its share right away and is told how long to
+    wait until the debt is paid off, so waiting callers are served in order without polling.
+
+    Args:
+        bucket: Bucket name, shared by all processes using the same state directory
+        amount: Requests or tokens to take
+        per_minute: Refill rate
+
+    Returns:
+        Seconds to wait before making the call
+    """
+    rate = per_minute / 60.0
+    now = time.time()
+    connection = _connect()
+    try:
+        connection.execute("BEGIN IMMEDIATE")
+        row = connection.execute("SELECT level, updated_at FROM buckets WHERE name = ?", (bucket,)).fetchone()
+        level = per_minute if row is None else min(per_minute, row[0] + max(0.0, now - row[1]) * rate)
+        level -= amount
+        connection.execute(
+            "INSERT OR REPLACE INTO buckets (name, level, updated_at) VALUES (?, ?, ?)", (bucket, level, now)
+        )
+        connection.execute("COMMIT")
+    finally:
+        connection.close()
+    return max(0.0, -level / rate)
+
+
+def drain(bucket: str) -> None:
+    """Empty a bucket, e.g. after the provider answered 429, so every process backs off."""
+    connection = _connect()
+    try:
+        connection.execute("BEGIN IMMEDIATE")
+        connection.execute("UPDATE buckets SET level = MIN(level, 0), updated_at = ? WHERE name = ?", (time.time(), bucket))
+        connection.execute("COMMIT")
+    finally:
+        connection.close()
+
+
+def _reserve_limits(name: str, limits: dict[str, Any], tokens: float = 0.0) -> float:
+    wait = 0.0
+    if limits.get("requests_per_minute"):
+        wait = max(wait, reserve(f"{name}:requests", 1, limits["requests_per_minute"]))
+    if tokens and limits.get("tokens_per_minute"):
+        wait = max(wait, reserve(f"{name}:tokens", tokens, limits["tokens_per_minute"]))
+    return wait
+
+
+def llm_bucket(model: str) -> tuple[Optional[str], dict[str, Any]]:
+    """Find the limits of an LLM model: its own entry, else the entry of its provider.
+
+    Returns:
+        Tuple of (bucket name, limits), or (None, {}) if the model is not limited
+    """
+    limits = _limits()["llm"]
+    if model in limits:
+        return model, limits[model]
+    try:
+        provider = litellm.get_llm_provider(model)[1]
+    except Exception:
+        provider = model.split("/", 1)[0] if "/" in model else None
+    if provider in limits:
+        return provider, limits[provider]
+    return None, {}
+
+
+def mcp_bucket(mcp_client_config: str) -> tuple[Optional[str], dict[str, Any]]:
+    """Find the limits of the MCP server a client config connects to (one bucket per server).
+
+    Returns:
+        Tuple of (bucket name, limits), or (None, {}) if the server is not limited
+    """
+    limits = _limits()["mcp"]
+    try:
+        servers = json.loads(mcp_client_config).get("mcpServers", {})
+        hosts = sorted(
+            urlparse(server["url"]).hostname or server["url"]
+            for server in servers.values() if isinstance(server, dict) and server.get("url")
+        )
+    except (json.JSONDecodeError, TypeError, AttributeError):
+        hosts = []
+    if not hosts:
+        # Local (stdio) servers are not shared with anyone
+        return None, {}
+    for host in hosts:
+        if host in limits:
+            return f"mcp:{host}", limits[host]
+    return f"mcp:{'|'.join(hosts)}", limits.get("default") or {}
+
+
+def estimate_tokens(kwargs: dict[str, Any]) -> int:
+    """Rough token count of a completion request (messages and tool definitions) without a tokenizer."""
+    text = json.dumps(kwargs.get("messages", []), default=str) + json.dumps(kwargs.get("tools") or [], default=str)
+    return len(text) // CHARS_PER_TOKEN
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or getattr(error, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _rate_limited_completion(*args, **kwargs):
+    if not _settings["enabled"]:
+        return _original_completion(*args, **kwargs)
+
+    log_bus = JustLogBus()
+    model = kwargs.get("model", "")
+    bucket, limits = llm_bucket(model)
+    retry = _limits()["retry"]
+    max_retries = int(retry.get("max_retries", 0))
+    delay = float(retry.get("initial_delay_seconds", 5.0))
+    estimated_tokens = estimate_tokens(kwargs)
+
+    for attempt in range(max_retries + 1):
+        if bucket is not None:
+            wait = _reserve_limits(bucket, limits, estimated_tokens)
+            if wait > 0:
+                log_bus.debug(f"Rate limit: waiting {wait:.1f}s before calling {model}",
+                              source="rate_limit",
+                              action="rate_limit.wait",
+                              bucket=bucket,
+                              model=model,
+                              seconds=wait)
+                time.sleep(wait)
+        try:
+            response = _original_completion(*args, **kwargs)
+        except litellm.RateLimitError as e:
+            if attempt == max_retries:
+                raise
+            if bucket is not None:
+                drain(f"{bucket}:requests")
+                drain(f"{bucket}:tokens")
+            backoff = _retry_after(e) or min(delay * 2 ** attempt, float(retry.get("max_delay_seconds", 60.0)))
+            backoff *= random.uniform(1.0, 1.25)
+            print(f"⚠ Rate limited by {model}, retrying in {backoff:.0f}s ({attempt + 1}/{max_retries})")
+            log_bus.warn(f"Rate limited by {model}",
+                         source="rate_limit",
+                         action="rate_limit.retry",
+                         bucket=bucket,
+                         model=model,
+                         attempt=attempt + 1,
+                         seconds=backoff)
+            time.sleep(backoff)
+            continue
+
+        # Settle the token estimate with the actual usage (not available for streams)
+        usage = getattr(response, "usage", None)
+        total_tokens = getattr(usage, "total_tokens", None)
+        if bucket is not None and limits.get("tokens_per_minute") and total_tokens:
+            reserve(f"{bucket}:tokens", total_tokens - estimated_tokens, limits["tokens_per_minute"])
+        return response
+
+
+async def _rate_limited_invoke_tool(self: MCPClient, tool_name: str, kwargs: dict[str, Any]) -> MCPToolInvocationResult:
+    if _settings["enabled"]:
+        bucket, limits = mcp_bucket(self.mcp_client_config)
+        if bucket is not None:
+            # The bucket database may be locked by other processes for a while, which must not stall
+            # the other calls sharing this client's event loop
+            wait = await asyncio.to_thread(_reserve_limits, bucket, limits)
+            if wait > 0:
+                JustLogBus().debug(f"Rate limit: waiting {wait:.1f}s before calling {tool_name}",
+                                   source="rate_limit",
+                                   action="rate_limit.wait",
+                                   bucket=bucket,
+                                   tool_name=tool_name,
+                                   seconds=wait)
+                await asyncio.sleep(wait)
+    return await _original_invoke_tool(self, tool_name, kwargs)
+
+
+def install_rate_limits() -> None:
+    """Route litellm completions of all agents and MCPClient.invoke_tool through the limiter, once per process."""
+    global _original_completion, _original_invoke_tool
+    if _original_completion is not None:
+        return
+    # The adapter turns rate limit errors into response text, so the limiter wraps the litellm call inside it
+    _original_completion = litellm_protocol.completion
+    litellm_protocol.completion = _rate_limited_completion
+    _original_invoke_tool = MCPClient.invoke_tool
+    MCPClient.invoke_tool = _rate_limited_invoke_tool
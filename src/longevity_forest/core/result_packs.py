@@ -0,0 +1,133 @@
+import json
+import mmap
+import re
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from longevity_forest.config.cache import PACK_COMPRESSION_LEVEL, PACK_MAX_BYTES
+
+
+PACKS_DIRNAME = "packs"
+PACK_SUFFIX = ".pack"
+
+# Record layout: magic, metadata length, payload length, JSON metadata, zlib-compressed result text.
+# The metadata makes packs self-describing, so the index can be rebuilt from them.
+RECORD_MAGIC = b"LFR1"
+_RECORD_HEADER = struct.Struct(">4sII")
+
+_PACK_PATTERN = re.compile(r"^pack_(?P<number>\d+)\.pack$")
+
+
+def packs_dir(interim_dir: Path) -> Path:
+    """Return the directory holding the pack files of an interim directory."""
+    return interim_dir / PACKS_DIRNAME
+
+
+def list_packs(interim_dir: Path) -> list[Path]:
+    """Return the pack files of an interim directory, oldest first."""
+    directory = packs_dir(interim_dir)
+    if not directory.exists():
+        return []
+    packs = [path for path in directory.iterdir() if _PACK_PATTERN.match(path.name)]
+    return sorted(packs, key=lambda path: int(_PACK_PATTERN.match(path.name).group("number")))
+
+
+def new_pack_path(interim_dir: Path) -> Path:
+    """Return the path of a pack file numbered after all existing ones."""
+    packs = list_packs(interim_dir)
+    number = int(_PACK_PATTERN.match(packs[-1].name).group("number")) + 1 if packs else 1
+    return packs_dir(interim_dir) / f"pack_{number:05d}{PACK_SUFFIX}"
+
+
+def current_pack_path(interim_dir: Path) -> Path:
+    """Return the pack file new records are appended to, starting a new one when the last is full."""
+    packs = list_packs(interim_dir)
+    if packs and packs[-1].stat().st_size < PACK_MAX_BYTES:
+        return packs[-1]
+    return new_pack_path(interim_dir)
+
+
+def encode_record(metadata: dict[str, Any], text: str) -> bytes:
+    """Serialize metadata and compress the text into one pack record."""
+    header = json.dumps(metadata, ensure_ascii=False).encode("utf-8")
+    payload = zlib.compress(text.encode("utf-8"), PACK_COMPRESSION_LEVEL)
+    return _RECORD_HEADER.pack(RECORD_MAGIC, len(header), len(payload)) + header + payload
+
+
+def decode_record(record: bytes) -> tuple[dict[str, Any], str]:
+    """Inverse of encode_record.
+
+    Raises:
+        ValueError: If the bytes are not a valid record
+    """
+    magic, header_length, payload_length = _RECORD_HEADER.unpack_from(record)
+    if magic != RECORD_MAGIC:
+        raise ValueError("Not a result pack record")
+    start = _RECORD_HEADER.size
+    metadata = json.loads(record[start:start + header_length].decode("utf-8"))
+    payload = record[start + header_length:start + header_length + payload_length]
+    return metadata, zlib.decompress(payload).decode("utf-8")
+
+
+def append_record(pack_path: Path, record: bytes) -> int:
+    """Append an encoded record to a pack file.
+
+    Callers must hold the index write lock, packs have no locking of their own.
+
+    Returns:
+        Offset of the record in the pack
+    """
+    pack_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(pack_path, "ab") as handle:
+        offset = handle.tell()
+        handle.write(record)
+        handle.flush()
+    return offset
+
+
+def read_records(pack_path: Path, spans: list[tuple[int, int]]) -> list[Optional[bytes]]:
+    """Read raw records from a pack through a read-only memory map.
+
+    Args:
+        pack_path: Pack file to read
+        spans: List of (offset, length) of the wanted records
+
+    Returns:
+        Raw record bytes per span, None for spans outside the file
+    """
+    with open(pack_path, "rb") as handle:
+        size = handle.seek(0, 2)
+        if size == 0:
+            return [None] * len(spans)
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return [
+                mapped[offset:offset + length] if offset + length <= size else None
+                for offset, length in spans
+            ]
+
+
+def iter_records(pack_path: Path) -> Iterator[tuple[dict[str, Any], str, int, int]]:
+    """Scan all records of a pack, stopping at a truncated or corrupt tail.
+
+    Yields:
+        Tuples of (metadata, text, offset, length)
+    """
+    with open(pack_path, "rb") as handle:
+        size = handle.seek(0, 2)
+        if size == 0:
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            offset = 0
+            while offset + _RECORD_HEADER.size <= size:
+                magic, header_length, payload_length = _RECORD_HEADER.unpack_from(mapped, offset)
+                length = _RECORD_HEADER.size + header_length + payload_length
+                if magic != RECORD_MAGIC or offset + length > size:
+                    break
+                try:
+                    metadata, text = decode_record(mapped[offset:offset + length])
+                except (ValueError, zlib.error, UnicodeDecodeError):
+                    break
+                yield metadata, text, offset, length
+                offset += length
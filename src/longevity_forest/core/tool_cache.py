@@ -0,0 +1,232 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from just_agents.just_bus import JustLogBus
+from just_agents.mcp_client import MCPClient, MCPToolInvocationResult
+
+from longevity_forest.config.mcp import MCP_TOOL_CACHE_MEMORY_ENTRIES, MCP_TOOL_CACHE_TTL_SECONDS
+from longevity_forest.core.interim_index import INTERIM_DIR
+
+
+TOOL_CACHE_FILENAME = "tool_cache.sqlite"
+
+TOOL_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tool_calls (
+    key TEXT PRIMARY KEY,
+    server TEXT NOT NULL,
+    tool TEXT NOT NULL,
+    arguments TEXT NOT NULL,
+    content BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tool_calls_expires ON tool_calls (expires_at);
+"""
+
+# Process-wide settings, the cache sits below the agents so it can't be configured per call
+_settings: dict[str, Any] = {
+    "enabled": True,
+    "cache_dir": INTERIM_DIR,
+}
+
+_memory: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+_memory_lock = threading.Lock()
+# On-disk tiers whose schema and WAL mode were set up by this process
+_prepared: set[Path] = set()
+_prepared_lock = threading.Lock()
+_original_invoke_tool = None
+
+
+def configure_tool_cache(enabled: bool = True, cache_dir: Optional[Path] = None) -> None:
+    """Enable or disable the MCP tool call cache and install it into MCPClient.
+
+    Args:
+        enabled: Whether cacheable tool calls are answered from and stored in the cache
+        cache_dir: Directory of the on-disk tier (defaults to data/interim)
+    """
+    _settings["enabled"] = enabled
+    if cache_dir is not None:
+        _settings["cache_dir"] = cache_dir
+    install_tool_cache()
+
+
+def is_tool_cache_enabled() -> bool:
+    """Return whether the tool cache is currently enabled."""
+    return _settings["enabled"]
+
+
+def tool_cache_path(cache_dir: Optional[Path] = None) -> Path:
+    """Return the location of the on-disk tier."""
+    return (cache_dir if cache_dir is not None else _settings["cache_dir"]) / TOOL_CACHE_FILENAME
+
+
+@contextmanager
+def connect_tool_cache(cache_dir: Optional[Path] = None) -> Iterator[sqlite3.Connection]:
+    """Open the on-disk tier, creating the schema if needed, and commit on exit."""
+    path = tool_cache_path(cache_dir)
+    with _prepared_lock:
+        prepared = path in _prepared and path.exists()
+    if not prepared:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=30.0)
+    try:
+        if not prepared:
+            # WAL mode is stored in the database file, so it and the schema are set up once per process
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(TOOL_CACHE_SCHEMA)
+            with _prepared_lock:
+                _prepared.add(path)
+        yield connection
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def server_identity(mcp_client_config: str) -> str:
+    """Reduce an MCP client config to the server URL(s) (or command) it connects to."""
+    try:
+        config = json.loads(mcp_client_config)
+    except (json.JSONDecodeError, TypeError):
+        return str(mcp_client_config)
+    if not isinstance(config, dict):
+        return str(mcp_client_config)
+    servers = config.get("mcpServers", {})
+    endpoints = [
+        server.get("url") or " ".join([server.get("command", "")] + list(server.get("args", [])))
+        for server in servers.values() if isinstance(server, dict)
+    ]
+    return "|".join(sorted(endpoints)) or str(mcp_client_config)
+
+
+def tool_call_key(server: str, tool_name: str, arguments: dict[str, Any]) -> str:
+    """Build the cache key of a tool call from the server, the tool and the canonicalized arguments."""
+    canonical = json.dumps(arguments, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256("\n".join([server, tool_name, canonical]).encode("utf-8")).hexdigest()
+
+
+def _memory_get(key: str, now: float) -> Optional[str]:
+    with _memory_lock:
+        cached = _memory.get(key)
+        if cached is None:
+            return None
+        expires_at, content = cached
+        if expires_at < now:
+            del _memory[key]
+            return None
+        _memory.move_to_end(key)
+        return content
+
+
+def _memory_put(key: str, expires_at: float, content: str) -> None:
+    with _memory_lock:
+        _memory[key] = (expires_at, content)
+        _memory.move_to_end(key)
+        while len(_memory) > MCP_TOOL_CACHE_MEMORY_ENTRIES:
+            _memory.popitem(last=False)
+
+
+def lookup_tool_call(key: str) -> Optional[str]:
+    """Return the cached content of a tool call, checking the in-process tier first."""
+    now = time.time()
+    content = _memory_get(key, now)
+    if content is not None:
+        return content
+    if not tool_cache_path().exists():
+        return None
+    with connect_tool_cache() as connection:
+        row = connection.execute(
+            "SELECT content, expires_at FROM tool_calls WHERE key = ? AND expires_at >= ?", (key, now)
+        ).fetchone()
+    if row is None:
+        return None
+    content = zlib.decompress(row[0]).decode("utf-8")
+    _memory_put(key, row[1], content)
+    return content
+
+
+def is_tool_call_cached(mcp_client_config: str, tool_name: str, arguments: dict[str, Any]) -> bool:
+    """Tell whether a tool call would currently be answered from the cache."""
+    if not _settings["enabled"] or tool_name not in MCP_TOOL_CACHE_TTL_SECONDS:
+        return False
+    return lookup_tool_call(tool_call_key(server_identity(mcp_client_config), tool_name, arguments)) is not None
+
+
+def store_tool_call(key: str, server: str, tool_name: str, arguments: dict[str, Any], content: str, ttl_seconds: float) -> None:
+    """Store a successful tool call in both tiers."""
+    now = time.time()
+    _memory_put(key, now + ttl_seconds, content)
+    with connect_tool_cache() as connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO tool_calls (key, server, tool, arguments, content, created_at, expires_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, server, tool_name, json.dumps(arguments, sort_keys=True, default=str),
+             zlib.compress(content.encode("utf-8")), now, now + ttl_seconds),
+        )
+
+
+def prune_tool_cache(cache_dir: Optional[Path] = None) -> int:
+    """Delete expired tool calls from the on-disk tier.
+
+    Returns:
+        Number of deleted entries
+    """
+    if not tool_cache_path(cache_dir).exists():
+        return 0
+    with connect_tool_cache(cache_dir) as connection:
+        return connection.execute("DELETE FROM tool_calls WHERE expires_at < ?", (time.time(),)).rowcount
+
+
+async def _cached_invoke_tool(self: MCPClient, tool_name: str, kwargs: dict[str, Any]) -> MCPToolInvocationResult:
+    ttl_seconds = MCP_TOOL_CACHE_TTL_SECONDS.get(tool_name)
+    if not _settings["enabled"] or ttl_seconds is None:
+        return await _original_invoke_tool(self, tool_name, kwargs)
+
+    server = server_identity(self.mcp_client_config)
+    key = tool_call_key(server, tool_name, kwargs)
+    try:
+        # The on-disk tier is read and written in a worker thread, so a busy database doesn't stall
+        # the other calls sharing this client's event loop
+        content = _memory_get(key, time.time())
+        if content is None:
+            content = await asyncio.to_thread(lookup_tool_call, key)
+    except (sqlite3.Error, zlib.error) as e:
+        print(f"⚠ Tool cache lookup failed for {tool_name}: {e}")
+        content = None
+    if content is not None:
+        JustLogBus().debug(f"Tool cache hit for {tool_name}",
+                           source="tool_cache",
+                           action="tool_cache.hit",
+                           server=server,
+                           tool_name=tool_name,
+                           arguments=kwargs)
+        return MCPToolInvocationResult(content=content, error_code=0)
+
+    result = await _original_invoke_tool(self, tool_name, kwargs)
+    # Errors (including connection errors) are never cached
+    if result.error_code == 0:
+        try:
+            await asyncio.to_thread(store_tool_call, key, server, tool_name, kwargs, result.content, ttl_seconds)
+        except sqlite3.Error as e:
+            print(f"⚠ Failed to cache {tool_name} result: {e}")
+    return result
+
+
+def install_tool_cache() -> None:
+    """Route MCPClient.invoke_tool through the cache, once per process.
+
+    All agents share MCP clients through just_agents, so this covers every MCP tool call.
+    """
+    global _original_invoke_tool
+    if _original_invoke_tool is not None:
+        return
+    _original_invoke_tool = MCPClient.invoke_tool
+    MCPClient.invoke_tool = _cached_invoke_tool
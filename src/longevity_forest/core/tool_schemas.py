@@ -0,0 +1,191 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from just_agents.just_async import run_async_function_synchronously
+from just_agents.just_bus import JustLogBus
+from just_agents.just_schema import ModelHelper
+from just_agents.just_tool import JustMCPTool
+
+import longevity_forest.config.mcp as mcp_config
+from longevity_forest.config.mcp import MCP_SCHEMA_CACHE_DIR, MCP_SCHEMA_FETCH_TIMEOUT_SECONDS, MCP_SCHEMA_TTL_SECONDS
+from longevity_forest.core.mcp_pool import pool_key
+from longevity_forest.core.mcp_tools import get_mcp_client
+
+
+# server URL -> {"url", "mcp_client_config", "fetched_at", "tools": {name: schema}}
+_entries: dict[str, dict[str, Any]] = {}
+_entries_lock = threading.Lock()
+# One fetch per server at a time, and one background refresh per server and process
+_fetch_locks: dict[str, threading.Lock] = {}
+_refreshing: set[str] = set()
+
+_original_get_raw_function_info = None
+
+
+def _entry_path(url: str) -> Path:
+    return MCP_SCHEMA_CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()[:16]}.json"
+
+
+def _write_entry(entry: dict[str, Any]) -> None:
+    # Written to a temporary file first, so a concurrent reader never sees a truncated file
+    path = _entry_path(entry["url"])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def cached_entry(url: str) -> Optional[dict[str, Any]]:
+    """Return the stored tool schemas of a server, None if it was never fetched."""
+    with _entries_lock:
+        entry = _entries.get(url)
+        if entry is None:
+            try:
+                entry = json.loads(_entry_path(url).read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                return None
+            _entries[url] = entry
+        return entry
+
+
+def list_cached_servers() -> list[dict[str, Any]]:
+    """Return the stored entries of all servers, oldest fetch first."""
+    if not MCP_SCHEMA_CACHE_DIR.exists():
+        return []
+    entries = []
+    for path in MCP_SCHEMA_CACHE_DIR.glob("*.json"):
+        try:
+            entries.append(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, json.JSONDecodeError):
+            continue
+    return sorted(entries, key=lambda entry: entry.get("fetched_at", 0))
+
+
+def fetch_tool_schemas(
+    mcp_client_config: Union[dict[str, Any], str],
+    timeout: float = MCP_SCHEMA_FETCH_TIMEOUT_SECONDS,
+) -> dict[str, Any]:
+    """Ask a server for all its tool schemas in one call and store them.
+
+    Args:
+        mcp_client_config: Config dict like the ones in config/mcp.py, or its JSON string
+        timeout: Maximum time in seconds to wait for the tool list
+
+    Returns:
+        The stored entry
+
+    Raises:
+        ValueError: If the config isn't a single HTTP server
+        TimeoutError: If the server takes longer than timeout
+    """
+    url = pool_key(mcp_client_config)
+    if url is None:
+        raise ValueError("Tool schemas are only cached for single-server HTTP configs")
+    if isinstance(mcp_client_config, dict):
+        mcp_client_config = json.dumps(mcp_client_config)
+    client = get_mcp_client(mcp_client_config)
+    with _entries_lock:
+        lock = _fetch_locks.setdefault(url, threading.Lock())
+    with lock:
+        definitions = run_async_function_synchronously(
+            client.list_tools_openai, timeout=timeout, target_loop=client.get_loop()
+        )
+        entry = {
+            "url": url,
+            "mcp_client_config": mcp_client_config,
+            "fetched_at": time.time(),
+            "tools": {definition.name: definition.model_dump() for definition in definitions},
+        }
+        _write_entry(entry)
+        with _entries_lock:
+            _entries[url] = entry
+    JustLogBus().info(f"Fetched {len(entry['tools'])} tool schemas from {url}",
+                      source="tool_schemas",
+                      action="tool_schemas.fetch",
+                      url=url,
+                      tools=len(entry["tools"]))
+    return entry
+
+
+def _refresh_in_background(url: str, mcp_client_config: str) -> None:
+    with _entries_lock:
+        if url in _refreshing:
+            return
+        _refreshing.add(url)
+
+    def refresh() -> None:
+        try:
+            fetch_tool_schemas(mcp_client_config)
+        except Exception as e:
+            # The stored schemas stay in use, the next process tries again
+            JustLogBus().warn(f"Refreshing tool schemas of {url} failed: {e}",
+                              source="tool_schemas",
+                              action="tool_schemas.refresh_failed",
+                              url=url)
+
+    threading.Thread(target=refresh, daemon=True, name="ToolSchemaRefresh").start()
+
+
+def _schema_for(tool: JustMCPTool) -> Optional[dict[str, Any]]:
+    url = pool_key(tool.mcp_client_config)
+    if url is None:
+        return None
+    entry = cached_entry(url)
+    if entry is not None and tool.name in entry["tools"]:
+        if time.time() - entry["fetched_at"] > MCP_SCHEMA_TTL_SECONDS:
+            _refresh_in_background(url, tool.mcp_client_config)
+        return entry["tools"][tool.name]
+    # Never fetched, or the tool is new on the server: fetch the whole list once for all its tools
+    entry = fetch_tool_schemas(tool.mcp_client_config)
+    return entry["tools"].get(tool.name)
+
+
+def _cached_raw_function_info(self: JustMCPTool):
+    # Same result as JustMCPTool._get_raw_function_info, which lists all tools of the server for
+    # every single tool, from the stored schemas of the server
+    try:
+        schema = _schema_for(self)
+    except Exception as e:
+        JustLogBus().warn(f"No stored schema for {self.name}, asking the server directly: {e}",
+                          source="tool_schemas",
+                          action="tool_schemas.miss",
+                          tool_name=self.name)
+        schema = None
+    if schema is None:
+        return _original_get_raw_function_info(self)
+    parameters_schema = schema.get("parameters") or {}
+    pydantic_model = None
+    if parameters_schema.get("properties"):
+        pydantic_model = ModelHelper.json_schema_to_base_model(parameters_schema, self.name)
+    return self._async_invoke_tool, {
+        "name": self.name,
+        "description": schema.get("description"),
+        "parameters": parameters_schema,
+    }, pydantic_model
+
+
+def install_tool_schemas() -> None:
+    """Route the schema lookup of every JustMCPTool through the stored schemas, once per process."""
+    global _original_get_raw_function_info
+    if _original_get_raw_function_info is not None:
+        return
+    _original_get_raw_function_info = JustMCPTool._get_raw_function_info
+    JustMCPTool._get_raw_function_info = _cached_raw_function_info
+
+
+def known_servers() -> dict[str, str]:
+    """Return the servers of config/mcp.py and of the stored schemas as server URL -> client config."""
+    servers = {}
+    for name, value in vars(mcp_config).items():
+        if name.endswith("_MCP_CONFIG") and isinstance(value, dict):
+            url = pool_key(value)
+            if url is not None:
+                servers.setdefault(url, json.dumps(value))
+    for entry in list_cached_servers():
+        servers.setdefault(entry["url"], entry["mcp_client_config"])
+    return servers
@@ -0,0 +1,87 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Optional
+
+from longevity_forest.config.mcp import WARM_CACHE_LOOKUPS, WARM_CACHE_TIMEOUT_SECONDS, WARM_CACHE_WORKERS
+from longevity_forest.core.mcp_tools import call_mcp_tool
+from longevity_forest.core.tool_cache import is_tool_call_cached
+
+
+def read_gene_list(filepath: Path) -> list[str]:
+    """Read gene symbols from a file, one per line (or comma/whitespace separated); '#' starts a comment."""
+    genes = []
+    for line in filepath.read_text(encoding="utf-8").splitlines():
+        line = line.split("#", 1)[0]
+        genes.extend(gene for gene in line.replace(",", " ").split() if gene)
+    return genes
+
+
+def _fill_arguments(arguments: dict[str, Any], gene: str) -> dict[str, Any]:
+    return {
+        name: value.replace("{gene}", gene) if isinstance(value, str) else value
+        for name, value in arguments.items()
+    }
+
+
+def _run_lookup(gene: str, lookup: dict[str, Any], timeout: float) -> dict[str, Any]:
+    arguments = _fill_arguments(lookup["arguments"], gene)
+    outcome: dict[str, Any] = {"gene": gene, "tool": lookup["tool"], "cached": False, "error": None}
+    started = time.perf_counter()
+    try:
+        outcome["cached"] = is_tool_call_cached(json.dumps(lookup["server"]), lookup["tool"], arguments)
+        result = call_mcp_tool(lookup["server"], lookup["tool"], arguments, timeout=timeout)
+        if result.error_code != 0:
+            outcome["error"] = result.content[:200]
+    except Exception as e:
+        outcome["error"] = f"{type(e).__name__}: {e}"
+    outcome["seconds"] = time.perf_counter() - started
+    return outcome
+
+
+def warm_tool_cache(
+    genes: list[str],
+    max_workers: int = WARM_CACHE_WORKERS,
+    timeout: float = WARM_CACHE_TIMEOUT_SECONDS,
+    lookups: Optional[list[dict[str, Any]]] = None,
+) -> list[dict[str, Any]]:
+    """Prefetch the deterministic per-gene MCP lookups into the tool cache with a bounded thread pool.
+
+    Args:
+        genes: Gene symbols to prefetch
+        max_workers: Maximum number of concurrent MCP calls
+        timeout: Maximum time in seconds for a single call
+        lookups: Lookups to run per gene (defaults to WARM_CACHE_LOOKUPS in config/mcp.py)
+
+    Returns:
+        One dictionary per call with 'gene', 'tool', 'cached' (already in the cache), 'seconds'
+        and 'error' (None on success)
+    """
+    lookups = lookups if lookups is not None else WARM_CACHE_LOOKUPS
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [
+            executor.submit(_run_lookup, gene, lookup, timeout)
+            for gene in genes
+            for lookup in lookups
+        ]
+        return [future.result() for future in as_completed(futures)]
+
+
+def summarize_by_tool(outcomes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Aggregate prefetch outcomes per tool.
+
+    Returns:
+        One dictionary per tool with 'tool', 'calls', 'cached', 'failed', 'total_seconds' and 'max_seconds'
+    """
+    summary: dict[str, dict[str, Any]] = {}
+    for outcome in outcomes:
+        row = summary.setdefault(outcome["tool"], {
+            "tool": outcome["tool"], "calls": 0, "cached": 0, "failed": 0, "total_seconds": 0.0, "max_seconds": 0.0,
+        })
+        row["calls"] += 1
+        row["cached"] += int(outcome["cached"])
+        row["failed"] += int(outcome["error"] is not None)
+        row["total_seconds"] += outcome["seconds"]
+        row["max_seconds"] = max(row["max_seconds"], outcome["seconds"])
+    return sorted(summary.values(), key=lambda row: row["tool"])
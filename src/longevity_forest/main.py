@@ -1,22 +1,74 @@
-from dotenv import load_dotenv
 from pathlib import Path
+import json
+import multiprocessing
+import os
+import re
+import shutil
 import sys
+import time
 import warnings
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 
 import typer
 from typer import Option, Argument
-from eliot import start_action
-from pycomfort.logging import to_nice_file, to_nice_stdout
-from rich.console import Console
 
-from just_agents.llm_options import LLMOptions
-from just_agents.web.web_agent import WebAgent
+# Commands import the LLM stack (just_agents, litellm), logging and rich inside their bodies,
+# so `forest --help` and the bookkeeping commands start without paying for it
+if TYPE_CHECKING:
+    from just_agents.web.web_agent import WebAgent
+    from longevity_forest.core.checkpoints import RunCheckpoint
 
-from longevity_forest.core.helpers import save_result_to_markdown, validate_markdown_file, serialize_memory_to_yaml
-from longevity_forest.config.llm import ANTHROPIC_CLAUDE_4_5_HAIKU
-from longevity_forest.config.prompts import get_gene_analysis_prompt, get_insilico_knockout_prompt
+from longevity_forest.core.interim_index import INTERIM_DIR, migrate_loose_results, rebuild_index
+from longevity_forest.core.cache_gc import collect_garbage
+from longevity_forest.config.mcp import WARM_CACHE_TIMEOUT_SECONDS, WARM_CACHE_WORKERS
+from longevity_forest.core.expert_cache import CacheMode, collect_cached_context, configure_expert_cache, get_expert_cache_settings
+from longevity_forest.config.cache import CACHE_MAX_BYTES, CACHED_CONTEXT_TOKEN_BUDGET
+from longevity_forest.config.batch import (
+    BATCH_MAX_ATTEMPTS,
+    DEFAULT_BATCH_NAME,
+    JOB_HEARTBEAT_INTERVAL_SECONDS,
+    JOB_LEASE_SECONDS,
+    JOB_QUEUE_PATH,
+)
+from longevity_forest.core.job_queue import (
+    claim_next_job,
+    complete_job,
+    count_jobs,
+    default_worker_id,
+    fail_job,
+    heartbeat,
+    keep_lease,
+    list_jobs,
+    list_workers,
+    next_retry_at,
+    recover_interrupted_jobs,
+    register_worker,
+    release_job,
+    reset_failed_jobs,
+    stop_worker,
+    submit_jobs,
+)
+from longevity_forest.config.prompts import (
+    CONTINUE_REPORT_PROMPT,
+    RESUME_INTERRUPTED_QUERY_PROMPT,
+    get_cached_context_prompt,
+    get_design_report_prompt,
+    get_gene_analysis_prompt,
+    get_insilico_knockout_prompt,
+    get_knockout_interpretation_prompt,
+)
+from longevity_forest.config.knockout import KNOCKOUT_SCAN_DIR, KNOCKOUT_TIMEOUT_SECONDS, KNOCKOUT_WORKERS
+from longevity_forest.config.mcp import MCP_SCHEMA_CACHE_DIR, MCP_SCHEMA_TTL_SECONDS
+from longevity_forest.config.design import (
+    DESIGN_CONTACTS_TOOL,
+    DESIGN_DEFAULT_TOOL,
+    DESIGN_JOBS_PATH,
+    DESIGN_MAX_CONCURRENT,
+    DESIGN_TARGET_ARGUMENT,
+)
 
 # Fix encoding for Windows
 if sys.platform == 'win32':
@@ -34,6 +86,69 @@ app = typer.Typer(
     no_args_is_help=True
 )
 
+cache_app = typer.Typer(
+    help="Manage the interim results cache in data/interim/",
+    no_args_is_help=True
+)
+app.add_typer(cache_app, name="cache")
+
+batch_app = typer.Typer(
+    help="Durable, resumable batch gene analysis backed by a job queue in data/batch/",
+    no_args_is_help=True
+)
+app.add_typer(batch_app, name="batch")
+
+design_app = typer.Typer(
+    help="Protein hunter design jobs submitted by `forest hunt-protein`, tracked in data/designs/",
+    no_args_is_help=True
+)
+app.add_typer(design_app, name="design")
+
+tools_app = typer.Typer(
+    help="MCP tool schemas stored per server in data/tool_schemas/, used to build agents without asking the servers",
+    no_args_is_help=True
+)
+app.add_typer(tools_app, name="tools")
+
+
+# Settings of the configure callback, applied by configure_mcp() in the commands that call MCP servers or LLMs
+_mcp_settings: dict = {"tool_cache": True, "rate_limits": True, "rate_limits_file": None}
+
+
+@app.callback()
+def configure(
+    tool_cache: bool = Option(
+        True,
+        "--tool-cache/--no-tool-cache",
+        help="Answer repeated deterministic MCP tool calls (ID lookups, UniProt info, BioMART, ...) from the shared tool cache"
+    ),
+    rate_limits: bool = Option(
+        True,
+        "--rate-limits/--no-rate-limits",
+        help="Throttle LLM and MCP calls to the per-provider and per-server rates shared by all processes on this host"
+    ),
+    rate_limits_file: Optional[Path] = Option(
+        None,
+        "--rate-limits-file",
+        help="Rate limits file (defaults to config/rate_limits.yaml)"
+    ),
+) -> None:
+    """
+    Multi-agent bioinformatics research system for sequence-to-function analysis focusing on longevity
+    """
+    _mcp_settings.update(tool_cache=tool_cache, rate_limits=rate_limits, rate_limits_file=rate_limits_file)
+
+
+def configure_mcp() -> None:
+    """Install the MCP session pool, rate limits and tool cache with the command line settings."""
+    from longevity_forest.core.tool_cache import configure_tool_cache
+    from longevity_forest.core.rate_limit import configure_rate_limits
+    from longevity_forest.core.mcp_pool import install_mcp_pool
+    # Innermost first: the session pool only sees real calls, tool cache hits are not throttled
+    install_mcp_pool()
+    configure_rate_limits(enabled=_mcp_settings["rate_limits"], limits_file=_mcp_settings["rate_limits_file"])
+    configure_tool_cache(enabled=_mcp_settings["tool_cache"])
+
 
 def setup_warnings() -> None:
     """Suppress deprecation warnings from eliottree library."""
@@ -51,6 +166,7 @@ def setup_logging(log_dir: Path = Path("logs")) -> tuple[Path, Path]:
     Returns:
         Tuple of (json_log_path, rendered_log_path)
     """
+    from pycomfort.logging import to_nice_file, to_nice_stdout
     log_dir.mkdir(parents=True, exist_ok=True)
     
     # Generate unique log file names with timestamp and random suffix
@@ -69,124 +185,107 @@ def setup_logging(log_dir: Path = Path("logs")) -> tuple[Path, Path]:
     return json_path, log_path
 
 
-def load_agents(config_file: Path, debug: bool = False, enable_cache: bool = True) -> tuple[List[WebAgent], WebAgent]:
+SUB_AGENTS = {
+    "google_agent": "web search",
+    "literature_agent": "articles, papers, clinical trials",
+    "structure_agent": "structures, domains, interactions",
+    "biomart_agent": "BioMART - genes, orthologs, sequences",
+    "opengenes_agent": "OpenGenes - longevity, aging",
+    "omnipath_agent": "OmniPath - pathways, interactions",
+}
+
+
+# Tools of the query agent that read the interim results cache, removed with --no-cache
+RESULT_CACHE_TOOLS = ("grep_cache_only_queries", "grep_cache_full", "read_results_by_filenames")
+# Block of the query agent's system prompt with the cache instructions, removed with --no-cache
+RESULT_CACHE_PROMPT_BLOCK = re.compile(r"^[ \t]*<result_cache>\n.*?^[ \t]*</result_cache>\n(?:[ \t]*\n)?", re.M | re.S)
+
+
+def disable_result_cache(query_agent: "WebAgent") -> list[str]:
+    """
+    Keep the query agent away from cached results: drop the <result_cache> block from its system
+    prompt and unregister its cache tools.
+    
+    Returns:
+        Names of the removed tools
+    """
+    query_agent.system_prompt = RESULT_CACHE_PROMPT_BLOCK.sub("", query_agent.system_prompt)
+    removed = [name for name in RESULT_CACHE_TOOLS if query_agent.tools and name in query_agent.tools]
+    for name in removed:
+        del query_agent.tools[name]
+    return removed
+
+
+def effective_cache_mode(cache: bool, cache_mode: CacheMode) -> CacheMode:
+    """--no-cache means no cached result of any kind is used, so it turns off a --cache-mode that reads."""
+    if not cache and cache_mode.can_read:
+        return CacheMode.off
+    return cache_mode
+
+
+def load_agents(
+    config_file: Path,
+    debug: bool = False,
+    enable_cache: bool = True,
+) -> tuple[List["WebAgent"], "WebAgent"]:
     """
-    Load all agents from configuration file.
+    Load the query agent and register the sub-agents of a configuration file.
+    
+    The sub-agents are lazy proxies that call_expert_agent builds on first use; use loaded_agents()
+    to get the ones a run actually built.
     
     Args:
         config_file: Path to the configuration YAML file
         debug: Whether to print debug information
-        enable_cache: Whether to enable LLM prompt caching (default: True)
+        enable_cache: Whether the query agent may use cached results (False strips the cache
+            instructions from its prompt and removes its cache tools)
     
     Returns:
-        Tuple of (list of all agents, main query agent)
+        Tuple of (sub-agent proxies followed by the query agent, main query agent)
     """
+    from eliot import start_action
+    from longevity_forest.core.agent_profiles import build_agent
+    from longevity_forest.core.experts import agent_concurrency_limit
+    from longevity_forest.core.lazy_agents import LazyAgent, register_lazy_agent, start_timing
     with start_action(action_type="load_agents", config_file=str(config_file), debug=debug, enable_cache=enable_cache) as action:
         print("Loading agents...")
+        start_timing()
         
-        # Original agents
-        google_agent: WebAgent = WebAgent.from_yaml(
-            section_name="google_agent",
-            parent_section="agent_profiles",
-            file_path=config_file
-        )
-        print("✓ Loaded google_agent (web search)")
-        action.log(message_type="agent_loaded", agent="google_agent")
-        
-        # Literature search agent
-        literature_agent: WebAgent = WebAgent.from_yaml(
-            section_name="literature_agent",
-            parent_section="agent_profiles",
-            file_path=config_file
-        )
-        print("✓ Loaded literature_agent (articles, papers, clinical trials)")
-        action.log(message_type="agent_loaded", agent="literature_agent")
-        
-        # Protein structure agent
-        structure_agent: WebAgent = WebAgent.from_yaml(
-            section_name="structure_agent",
-            parent_section="agent_profiles",
-            file_path=config_file
-        )
-        print("✓ Loaded structure_agent (structures, domains, interactions)")
-        action.log(message_type="agent_loaded", agent="structure_agent")
-        
-        # BioMART query agent
-        biomart_agent: WebAgent = WebAgent.from_yaml(
-            section_name="biomart_agent",
-            parent_section="agent_profiles",
-            file_path=config_file
-        )
-        print("✓ Loaded biomart_agent (BioMART - genes, orthologs, sequences)")
-        action.log(message_type="agent_loaded", agent="biomart_agent")
-        
-        # OpenGenes query agent
-        opengenes_agent: WebAgent = WebAgent.from_yaml(
-            section_name="opengenes_agent",
-            parent_section="agent_profiles",
-            file_path=config_file
-        )
-        print("✓ Loaded opengenes_agent (OpenGenes - longevity, aging)")
-        action.log(message_type="agent_loaded", agent="opengenes_agent")
-        
-        # OmniPath query agent
-        omnipath_agent: WebAgent = WebAgent.from_yaml(
-            section_name="omnipath_agent",
-            parent_section="agent_profiles",
-            file_path=config_file
-        )
-        print("✓ Loaded omnipath_agent (OmniPath - pathways, interactions)")
-        action.log(message_type="agent_loaded", agent="omnipath_agent")
-        
-        # Main query agent
-        query_agent: WebAgent = WebAgent.from_yaml(
-            section_name="query_agent",
-            parent_section="agent_profiles",
-            file_path=config_file
-        )
-        print("✓ Loaded query_agent (main orchestrator)")
-        action.log(message_type="agent_loaded", agent="query_agent")
-        
-        agents = [
-            google_agent,
-            literature_agent,
-            structure_agent,
-            biomart_agent,
-            opengenes_agent,
-            omnipath_agent,
-            query_agent
+        # Sub-agents are built on their first call_expert_agent call, so unused ones cost nothing,
+        # and concurrent calls to one of them get more instances up to its cap in EXPERT_MAX_CONCURRENT
+        sub_agents = [
+            register_lazy_agent(LazyAgent(section_name, config_file, description,
+                                          max_instances=agent_concurrency_limit(section_name)))
+            for section_name, description in SUB_AGENTS.items()
         ]
+        print(f"✓ Registered {len(sub_agents)} sub-agents, built on first use: "
+              + ", ".join(agent.shortname for agent in sub_agents))
+        action.log(message_type="agents_registered", agents=list(SUB_AGENTS))
         
-        # Configure result caching for query agent
-        if not enable_cache and hasattr(query_agent, 'system_prompt'):
-            # Remove caching instructions from system prompt if caching is disabled
-            original_prompt = query_agent.system_prompt
-            # Remove the caching-related instructions
-            cache_instructions = """You always start your work by calling `grep_cache_only_queries` using search term, eg protein or gene name. 
-      Note it works like grep, so it returns list of filenames that contain the exact search term.
-      If you see relevant queries in the cache, form the list of respective filenames.
-      YOU MUST ALWAYS CALL `read_results_by_filenames` tool to enrich your input from the cache before calling any other tools.
-      YOU ARE EFFICIENT AND ONLY QUERY THE MISSING INFORMATION NEEDED TO FULFILL THE REQUEST, NOT THE INFORMATION THAT IS ALREADY IN THE CACHE.
-
-      """
-            if cache_instructions in original_prompt:
-                query_agent.system_prompt = original_prompt.replace(cache_instructions, "")
-                action.log(message_type="caching_disabled_prompt_modified")
+        # Main query agent
+        start = time.perf_counter()
+        query_agent: WebAgent = build_agent("query_agent", config_file)
+        print(f"✓ Loaded query_agent (main orchestrator) in {time.perf_counter() - start:.2f}s")
+        action.log(message_type="agent_loaded", agent="query_agent", seconds=time.perf_counter() - start)
         
+        if not enable_cache:
+            removed_tools = disable_result_cache(query_agent)
+            action.log(message_type="caching_disabled_prompt_modified", removed_tools=removed_tools)
         action.log(message_type="result_caching_configured", enable_cache=enable_cache)
         
-        # Display tool distribution for debugging
+        agents = sub_agents + [query_agent]
+        
+        # Display tool distribution for debugging (sub-agents are not built yet)
         if debug:
             print("\nTool distribution across agents:")
             print("-" * 60)
-            for agent in agents:
-                tools = agent.list_tools() if hasattr(agent, 'list_tools') else []
-                tool_count = len(tools) if isinstance(tools, list) else 0
-                print(f"\n{agent.description if hasattr(agent, 'description') else 'Agent'}:")
-                print(f"  Tools: {tool_count}")
-                if isinstance(tools, list) and tools:
-                    for tool in tools:
-                        print(f"    - {tool}")
+            tools = query_agent.list_tools() if hasattr(query_agent, 'list_tools') else []
+            tool_count = len(tools) if isinstance(tools, list) else 0
+            print(f"\n{query_agent.description if hasattr(query_agent, 'description') else 'Agent'}:")
+            print(f"  Tools: {tool_count}")
+            if isinstance(tools, list) and tools:
+                for tool in tools:
+                    print(f"    - {tool}")
             print("-" * 60)
         
         action.log(message_type="agents_loaded", total_agents=len(agents))
@@ -194,8 +293,11 @@ def load_agents(config_file: Path, debug: bool = False, enable_cache: bool = Tru
 
 
 def run_gene_analysis(
-    query_agent: WebAgent,
-    gene_name: str
+    query_agent: "WebAgent",
+    gene_name: str,
+    use_cache: bool = True,
+    cache_token_budget: int = CACHED_CONTEXT_TOKEN_BUDGET,
+    checkpoint: Optional["RunCheckpoint"] = None
 ) -> Optional[str]:
     """
     Run gene analysis for a given gene.
@@ -203,45 +305,198 @@ def run_gene_analysis(
     Args:
         query_agent: The main query agent
         gene_name: Name of the gene to analyze
+        use_cache: Whether to prepend cached interim results for the gene to the prompt
+        cache_token_budget: Approximate token budget of the prepended cached results
+        checkpoint: Checkpoint that receives the conversation and the partial report after every turn;
+            if it already holds progress, the run continues from there instead of starting over
     
     Returns:
         The analysis result as a string, or None if failed
     """
-    with start_action(action_type="run_gene_analysis", gene_name=gene_name) as action:
+    from eliot import start_action
+    from rich.console import Console
+    from longevity_forest.core.lazy_agents import record_first_llm_call
+    from longevity_forest.core.checkpoints import COMPLETE, CONTINUING, STARTED
+    with start_action(action_type="run_gene_analysis", gene_name=gene_name,
+                      run_id=checkpoint.run_id if checkpoint is not None else None) as action:
         console = Console()
         console.print("\n[bold cyan]Starting gene analysis for:[/bold cyan] [bold yellow]{gene_name}[/bold yellow]".format(gene_name=gene_name))
         console.print("[dim]" + "-" * 60 + "[/dim]")
         
-        result = query_agent.query(
-            query_input=get_gene_analysis_prompt(gene_name)
-        )
-        action.log(message_type="initial_query_complete", gene_name=gene_name)
-        
-        # Handle continuation if report is incomplete
-        continuation_count = 0
-        while "REPORT_END" not in result:
-            continuation_count += 1
-            print(f"REPORT_END marker not found, continuing the report generation from the last response")
-            action.log(message_type="continuation_needed", continuation_number=continuation_count)
-            
-            continuation_result = query_agent.query(
-                query_input="REPORT_END marker not found, continue the report generation from the last response"
-            )
-            
-            if not continuation_result:
-                action.log(message_type="continuation_failed", continuation_number=continuation_count)
-                raise Exception("Continuation result is empty")
+        resumed = checkpoint is not None and (checkpoint.stage != STARTED or bool(checkpoint.restore_messages()))
+        if resumed:
+            result = checkpoint.state["partial_result"]
+            continuation_count = checkpoint.state["continuation_count"]
+            if checkpoint.stage == COMPLETE:
+                print(f"✓ Run {checkpoint.run_id} already completed, using the checkpointed report")
+                return result
+            messages = checkpoint.restore_messages()
+            query_agent.memory.messages = messages
+            print(f"✓ Resuming run {checkpoint.run_id} from its checkpoint ({len(messages)} messages, "
+                  f"{continuation_count} continuations)")
+            action.log(message_type="resumed_from_checkpoint", stage=checkpoint.stage,
+                       messages=len(messages), continuation_count=continuation_count)
+        else:
+            # Retrieve cached results on the host instead of letting the LLM grep and read them in extra round trips
+            prompt = get_gene_analysis_prompt(gene_name)
+            if use_cache:
+                cached_context, cached_files = collect_cached_context(gene_name, token_budget=cache_token_budget)
+                if cached_context:
+                    prompt = get_cached_context_prompt(gene_name, cached_context) + prompt
+                    print(f"✓ Prepended {len(cached_files)} cached results for {gene_name} ({len(cached_context)} characters)")
+                action.log(message_type="cached_context_prepended", gene_name=gene_name,
+                           cached_files=cached_files, characters=len(cached_context))
+        
+        if checkpoint is not None:
+            if not resumed:
+                # The query agent continues its conversation, earlier turns are part of the run
+                checkpoint.record_messages(query_agent.memory.messages)
+            checkpoint.attach(query_agent.memory)
+            print(f"Checkpointing run {checkpoint.run_id} to {checkpoint.path}")
+        
+        try:
+            if not resumed or checkpoint.stage == STARTED:
+                record_first_llm_call()
+                result = query_agent.query(
+                    query_input=RESUME_INTERRUPTED_QUERY_PROMPT if resumed else prompt
+                )
+                continuation_count = 0
+                if checkpoint is not None:
+                    checkpoint.save_progress(CONTINUING, result, continuation_count)
+                action.log(message_type="initial_query_complete", gene_name=gene_name)
             
-            result += continuation_result
-            print(f"Continuation result added to the final result")
-            action.log(message_type="continuation_added", continuation_number=continuation_count)
+            # Handle continuation if report is incomplete
+            while "REPORT_END" not in result:
+                continuation_count += 1
+                print(f"REPORT_END marker not found, continuing the report generation from the last response")
+                action.log(message_type="continuation_needed", continuation_number=continuation_count)
+                
+                record_first_llm_call()
+                continuation_result = query_agent.query(
+                    query_input=CONTINUE_REPORT_PROMPT
+                )
+                
+                if not continuation_result:
+                    action.log(message_type="continuation_failed", continuation_number=continuation_count)
+                    raise Exception("Continuation result is empty")
+                
+                result += continuation_result
+                if checkpoint is not None:
+                    checkpoint.save_progress(CONTINUING, result, continuation_count)
+                print(f"Continuation result added to the final result")
+                action.log(message_type="continuation_added", continuation_number=continuation_count)
+        except BaseException:
+            if checkpoint is not None:
+                typer.echo(f"✗ Analysis of {gene_name} interrupted, progress is kept in checkpoint {checkpoint.run_id}", err=True)
+            raise
+        finally:
+            if checkpoint is not None:
+                checkpoint.detach()
 
+        if checkpoint is not None:
+            checkpoint.save_progress(COMPLETE, result, continuation_count)
         print(f"REPORT_END marker found")
         action.log(message_type="analysis_complete", gene_name=gene_name, continuation_count=continuation_count)
         
         return result
 
 
+def analyze_and_save_gene(
+    query_agent: "WebAgent",
+    gene_name: str,
+    use_cache: bool = True,
+    cache_token_budget: int = CACHED_CONTEXT_TOKEN_BUDGET,
+    checkpoint: Optional["RunCheckpoint"] = None
+) -> tuple[str, Optional[Path]]:
+    """
+    Run gene analysis for one gene of a batch, then save and validate the report.
+    
+    Args:
+        query_agent: The main query agent
+        gene_name: Name of the gene to analyze
+        use_cache: Whether to prepend cached interim results for the gene to the prompt
+        cache_token_budget: Approximate token budget of the prepended cached results
+        checkpoint: Checkpoint of the run, discarded once the report is saved
+    
+    Returns:
+        Tuple of (status of the gene: "success", "warning" or "failed", path of the saved report)
+    """
+    from eliot import start_action
+    from longevity_forest.core.helpers import save_result_to_markdown, validate_markdown_file
+    with start_action(action_type="analyze_single_gene", gene_name=gene_name) as gene_action:
+        result = run_gene_analysis(query_agent, gene_name, use_cache=use_cache, cache_token_budget=cache_token_budget,
+                                   checkpoint=checkpoint)
+        
+        if result:
+            result_str = str(result) if not isinstance(result, str) else result
+            filepath = save_result_to_markdown(result_str, gene_name)
+            gene_action.log(message_type="result_saved", filepath=str(filepath))
+            if checkpoint is not None:
+                checkpoint.discard()
+            
+            is_valid = validate_markdown_file(filepath)
+            file_uri = filepath.resolve().as_uri()
+            if is_valid:
+                gene_action.log(message_type="validation_success", filepath=str(filepath))
+                typer.echo(f"\n✓ {gene_name}: Query result successfully saved and validated: {filepath}")
+                typer.echo(f"  Open report: {file_uri}")
+                return "success", filepath
+            gene_action.log(message_type="validation_warning", filepath=str(filepath))
+            typer.echo(f"\n⚠ {gene_name}: Query result saved but validation had issues: {filepath}")
+            typer.echo(f"  Open report: {file_uri}")
+            return "warning", filepath
+        
+        gene_action.log(message_type="no_result", gene_name=gene_name)
+        typer.echo(f"✗ {gene_name}: No result returned from query agent", err=True)
+        return "failed", None
+
+
+# Query agent of a gene worker process, loaded once per process by init_gene_worker
+_worker_agents: dict[str, "WebAgent"] = {}
+
+
+def init_gene_worker(
+    config: Path,
+    debug: bool,
+    expert_cache_settings: dict,
+    tool_cache_enabled: bool,
+    rate_limit_settings: dict,
+    use_cache: bool = True,
+) -> None:
+    """
+    Prepare a worker process of `analyze-genes --workers`: settings, logging and its own agents.
+    
+    Worker processes are spawned, so the CLI settings of the parent are passed in explicitly.
+    """
+    from dotenv import load_dotenv
+    from longevity_forest.core.helpers import set_interim_suffix
+    from longevity_forest.core.tool_cache import configure_tool_cache
+    from longevity_forest.core.rate_limit import configure_rate_limits
+    from longevity_forest.core.mcp_pool import install_mcp_pool
+    setup_warnings()
+    load_dotenv()
+    # Results of the same agent written by two workers within one second must not share a filename
+    set_interim_suffix(f"p{os.getpid()}")
+    install_mcp_pool()
+    configure_rate_limits(**rate_limit_settings)
+    configure_tool_cache(enabled=tool_cache_enabled)
+    configure_expert_cache(**expert_cache_settings)
+    setup_logging()
+    _, query_agent = load_agents(config, debug=debug, enable_cache=use_cache)
+    _worker_agents["query_agent"] = query_agent
+
+
+def analyze_gene_in_worker(gene_name: str, use_cache: bool, cache_token_budget: int) -> str:
+    """Analyze one gene in a worker process; a failing gene doesn't stop the rest of the batch."""
+    try:
+        status, _ = analyze_and_save_gene(_worker_agents["query_agent"], gene_name,
+                                          use_cache=use_cache, cache_token_budget=cache_token_budget)
+        return status
+    except Exception as e:
+        typer.echo(f"✗ {gene_name}: Analysis failed: {type(e).__name__}: {e}", err=True)
+        return "failed"
+
+
 @app.command()
 def analyze_gene(
     gene_name: str = Argument("NRF2", help="Name of the gene to analyze (e.g., NRF2, TP53)"),
@@ -254,7 +509,32 @@ def analyze_gene(
     cache: bool = Option(
         True,
         "--cache/--no-cache",
-        help="Enable or disable loading of cached interim results from data/interim/ (default: enabled)"
+        help="Enable or disable loading of cached interim results from data/interim/; --no-cache also turns off reading cached expert answers (default: enabled)"
+    ),
+    cache_mode: CacheMode = Option(
+        CacheMode.readwrite,
+        "--cache-mode",
+        help="Exact-hit cache of expert agent answers: off, read, write or readwrite"
+    ),
+    cache_ttl_hours: Optional[float] = Option(
+        None,
+        "--cache-ttl-hours",
+        help="Maximum age of reusable cached expert answers (defaults to per-agent TTLs from config/cache.py)"
+    ),
+    similarity_threshold: Optional[float] = Option(
+        None,
+        "--similarity-threshold",
+        help="Minimum similarity (0-1) for reusing the cached answer to a near-duplicate expert query; above 1 disables it (defaults to config/cache.py)"
+    ),
+    cache_token_budget: int = Option(
+        CACHED_CONTEXT_TOKEN_BUDGET,
+        "--cache-token-budget",
+        help="Approximate token budget of cached results prepended to the analysis prompt"
+    ),
+    auto_gc: bool = Option(
+        False,
+        "--auto-gc/--no-auto-gc",
+        help="Evict expired and least recently used interim results at the end of the run (see `forest cache gc`)"
     ),
     debug: bool = Option(
         False,
@@ -267,6 +547,11 @@ def analyze_gene(
         "--show-history/--no-history",
         help="Display conversation history after analysis"
     ),
+    resume: Optional[str] = Option(
+        None,
+        "--resume",
+        help="Continue an interrupted run from its checkpoint in data/checkpoints/ (the gene is taken from the checkpoint)"
+    ),
 ) -> None:
     """
     Analyze a gene using the multi-agent bioinformatics research system (default: NRF2).
@@ -278,23 +563,47 @@ def analyze_gene(
     - Literature and clinical trials
     - Longevity and aging associations
     """
+    from dotenv import load_dotenv
+    from eliot import start_action
+    from longevity_forest.core.helpers import save_result_to_markdown, validate_markdown_file
+    from longevity_forest.core.lazy_agents import loaded_agents, print_agent_timings
+    from longevity_forest.core.checkpoints import new_run_id, RunCheckpoint
+    configure_mcp()
     setup_warnings()
     load_dotenv()
     
+    if resume is not None:
+        try:
+            checkpoint = RunCheckpoint.load(resume)
+        except FileNotFoundError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(1)
+        gene_name = checkpoint.gene_name
+    else:
+        checkpoint = RunCheckpoint.create(new_run_id(gene_name), gene_name)
+    
     # Setup Eliot logging
     json_path, log_path = setup_logging()
     print(f"Logging initialized: {log_path}")
+    print(f"Run id: {checkpoint.run_id} (continue it after an interruption with `forest analyze-gene --resume {checkpoint.run_id}`)")
     
     # Display caching status in bold
     cache_status = "ENABLED" if cache else "DISABLED"
     print(f"\n\033[1mInterim Results Caching: {cache_status}\033[0m")
     if cache:
-        print("  → Will load cached results from data/interim/ to avoid redundant queries")
+        print("  → Will prepend cached results from data/interim/ to the prompt to avoid redundant queries")
     else:
         print("  → Will make fresh queries without loading cached results")
+    cache_mode = effective_cache_mode(cache, cache_mode)
+    print(f"\033[1mExpert Answer Cache: {cache_mode.value}\033[0m")
     print()
+    configure_expert_cache(
+        cache_mode,
+        ttl_seconds=cache_ttl_hours * 3600 if cache_ttl_hours is not None else None,
+        similarity_threshold=similarity_threshold,
+    )
     
-    with start_action(action_type="analyze_gene_command", gene_name=gene_name, cache_enabled=cache) as action:
+    with start_action(action_type="analyze_gene_command", gene_name=gene_name, cache_enabled=cache, cache_mode=cache_mode.value) as action:
         # Determine config file path
         if config is None:
             config = Path(__file__).parent / "config/agents/web_search_delegated.yaml"
@@ -310,13 +619,17 @@ def analyze_gene(
         agents, query_agent = load_agents(config, debug=debug, enable_cache=cache)
         
         # Run analysis
-        result = run_gene_analysis(query_agent, gene_name)
+        result = run_gene_analysis(query_agent, gene_name, use_cache=cache, cache_token_budget=cache_token_budget,
+                                   checkpoint=checkpoint)
+        if debug:
+            print_agent_timings()
         
         # Save and validate results
         if result:
             result_str = str(result) if not isinstance(result, str) else result
             filepath = save_result_to_markdown(result_str, gene_name)
             action.log(message_type="result_saved", filepath=str(filepath))
+            checkpoint.discard()
             
             is_valid = validate_markdown_file(filepath)
             file_uri = filepath.resolve().as_uri()
@@ -338,12 +651,15 @@ def analyze_gene(
             print("\n" + "="*60)
             print("CONVERSATION HISTORY")
             print("="*60)
-            for agent in agents:
+            for agent in loaded_agents(agents):
                 if hasattr(agent, 'memory'):
                     print(f"\n{agent.description if hasattr(agent, 'description') else 'Agent'}:")
                     agent.memory.pretty_print_all_messages()
             # Repeat report link after history for convenience
             print(f"\nOpen report: {file_uri}")
+        
+        if auto_gc:
+            run_cache_gc(INTERIM_DIR, max_bytes=CACHE_MAX_BYTES)
 
 
 @app.command()
@@ -358,7 +674,32 @@ def analyze_genes(
     cache: bool = Option(
         True,
         "--cache/--no-cache",
-        help="Enable or disable interim results caching (default: enabled)"
+        help="Enable or disable interim results caching; --no-cache also turns off reading cached expert answers (default: enabled)"
+    ),
+    cache_mode: CacheMode = Option(
+        CacheMode.readwrite,
+        "--cache-mode",
+        help="Exact-hit cache of expert agent answers: off, read, write or readwrite"
+    ),
+    cache_ttl_hours: Optional[float] = Option(
+        None,
+        "--cache-ttl-hours",
+        help="Maximum age of reusable cached expert answers (defaults to per-agent TTLs from config/cache.py)"
+    ),
+    similarity_threshold: Optional[float] = Option(
+        None,
+        "--similarity-threshold",
+        help="Minimum similarity (0-1) for reusing the cached answer to a near-duplicate expert query; above 1 disables it (defaults to config/cache.py)"
+    ),
+    cache_token_budget: int = Option(
+        CACHED_CONTEXT_TOKEN_BUDGET,
+        "--cache-token-budget",
+        help="Approximate token budget of cached results prepended to the analysis prompt"
+    ),
+    auto_gc: bool = Option(
+        False,
+        "--auto-gc/--no-auto-gc",
+        help="Evict expired and least recently used interim results at the end of the run (see `forest cache gc`)"
     ),
     debug: bool = Option(
         False,
@@ -371,10 +712,23 @@ def analyze_genes(
         "--show-history/--no-history",
         help="Display conversation history after each analysis"
     ),
+    workers: int = Option(
+        1,
+        "--workers",
+        "-w",
+        help="Number of genes analyzed concurrently, each worker process loads its own set of agents"
+    ),
 ) -> None:
     """
-    Analyze multiple genes sequentially using the multi-agent bioinformatics research system.
+    Analyze multiple genes using the multi-agent bioinformatics research system,
+    sequentially or with --workers N genes at a time.
     """
+    from dotenv import load_dotenv
+    from eliot import start_action
+    from longevity_forest.core.tool_cache import is_tool_cache_enabled
+    from longevity_forest.core.rate_limit import get_rate_limit_settings
+    from longevity_forest.core.lazy_agents import print_agent_timings
+    configure_mcp()
     setup_warnings()
     load_dotenv()
     
@@ -386,12 +740,19 @@ def analyze_genes(
     cache_status = "ENABLED" if cache else "DISABLED"
     print(f"\n\033[1mInterim Results Caching: {cache_status}\033[0m")
     if cache:
-        print("  → Will load cached results from data/interim/ to avoid redundant queries")
+        print("  → Will prepend cached results from data/interim/ to the prompt to avoid redundant queries")
     else:
         print("  → Will make fresh queries without loading cached results")
+    cache_mode = effective_cache_mode(cache, cache_mode)
+    print(f"\033[1mExpert Answer Cache: {cache_mode.value}\033[0m")
     print()
+    configure_expert_cache(
+        cache_mode,
+        ttl_seconds=cache_ttl_hours * 3600 if cache_ttl_hours is not None else None,
+        similarity_threshold=similarity_threshold,
+    )
     
-    with start_action(action_type="analyze_genes_command", gene_count=len(genes), genes=genes, cache_enabled=cache) as action:
+    with start_action(action_type="analyze_genes_command", gene_count=len(genes), genes=genes, cache_enabled=cache, cache_mode=cache_mode.value, workers=workers) as action:
         # Determine config file path
         if config is None:
             config = Path(__file__).parent / "config/agents/web_search_delegated.yaml"
@@ -403,36 +764,46 @@ def analyze_genes(
         
         action.log(message_type="config_loaded", config_path=str(config))
         
-        # Load agents once for all genes
-        agents, query_agent = load_agents(config, debug=debug, enable_cache=cache)
-        
-        # Analyze each gene
         results = {}
-        for gene_name in genes:
-            with start_action(action_type="analyze_single_gene", gene_name=gene_name) as gene_action:
-                result = run_gene_analysis(query_agent, gene_name)
-                
-                if result:
-                    result_str = str(result) if not isinstance(result, str) else result
-                    filepath = save_result_to_markdown(result_str, gene_name)
-                    gene_action.log(message_type="result_saved", filepath=str(filepath))
-                    
-                    is_valid = validate_markdown_file(filepath)
-                    file_uri = filepath.resolve().as_uri()
-                    if is_valid:
-                        gene_action.log(message_type="validation_success", filepath=str(filepath))
-                        typer.echo(f"\n✓ {gene_name}: Query result successfully saved and validated: {filepath}")
-                        typer.echo(f"  Open report: {file_uri}")
-                        results[gene_name] = "success"
-                    else:
-                        gene_action.log(message_type="validation_warning", filepath=str(filepath))
-                        typer.echo(f"\n⚠ {gene_name}: Query result saved but validation had issues: {filepath}")
-                        typer.echo(f"  Open report: {file_uri}")
-                        results[gene_name] = "warning"
-                else:
-                    gene_action.log(message_type="no_result", gene_name=gene_name)
-                    typer.echo(f"✗ {gene_name}: No result returned from query agent", err=True)
-                    results[gene_name] = "failed"
+        if workers > 1 and len(genes) > 1:
+            # Every worker process loads its own agents, so each has its own JustAgentsLocator registry
+            worker_count = min(workers, len(genes))
+            print(f"Analyzing {len(genes)} genes with {worker_count} worker processes...")
+            statuses = {}
+            with ProcessPoolExecutor(
+                max_workers=worker_count,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_gene_worker,
+                initargs=(config, debug, get_expert_cache_settings(), is_tool_cache_enabled(), get_rate_limit_settings(),
+                          cache),
+            ) as executor:
+                futures = {
+                    executor.submit(analyze_gene_in_worker, gene_name, cache, cache_token_budget): gene_name
+                    for gene_name in dict.fromkeys(genes)
+                }
+                for future in as_completed(futures):
+                    gene_name = futures[future]
+                    try:
+                        statuses[gene_name] = future.result()
+                    except Exception as e:
+                        # A worker that crashed or ran out of memory breaks the pool and fails every gene
+                        # still pending; genes that finished keep their status and report
+                        reason = "worker process died" if isinstance(e, BrokenProcessPool) else f"{type(e).__name__}: {e}"
+                        action.log(message_type="gene_worker_failed", gene_name=gene_name, error=f"{type(e).__name__}: {e}")
+                        typer.echo(f"✗ {gene_name}: {reason}", err=True)
+                        statuses[gene_name] = "error"
+            # Summary in input order, as in the sequential mode
+            for gene_name in genes:
+                results[gene_name] = statuses[gene_name]
+        else:
+            # Load agents once for all genes
+            agents, query_agent = load_agents(config, debug=debug, enable_cache=cache)
+            
+            # Analyze each gene
+            for gene_name in genes:
+                results[gene_name], _ = analyze_and_save_gene(query_agent, gene_name, use_cache=cache, cache_token_budget=cache_token_budget)
+            if debug:
+                print_agent_timings()
         
         # Display summary
         print("\n" + "="*60)
@@ -443,6 +814,489 @@ def analyze_genes(
             print(f"{symbol} {gene_name}: {status}")
         
         action.log(message_type="batch_analysis_complete", results=results)
+        
+        if auto_gc:
+            run_cache_gc(INTERIM_DIR, max_bytes=CACHE_MAX_BYTES)
+        
+        if "error" in results.values():
+            typer.echo("Error: Worker processes failed, see the genes marked 'error' above", err=True)
+            raise typer.Exit(1)
+
+
+@batch_app.command("submit")
+def batch_submit(
+    genes: Optional[List[str]] = Argument(None, help="Gene names to add to the batch (e.g., NRF2 TP53 FOXO3)"),
+    genes_file: Optional[Path] = Option(
+        None,
+        "--genes-file",
+        "-f",
+        help="File with gene names, one per line ('#' starts a comment)"
+    ),
+    batch: str = Option(DEFAULT_BATCH_NAME, "--batch", "-b", help="Batch name"),
+    max_attempts: int = Option(
+        BATCH_MAX_ATTEMPTS,
+        "--max-attempts",
+        help="How often a gene is attempted before it stays failed"
+    ),
+    queue: Path = Option(JOB_QUEUE_PATH, "--queue", help="Job queue database"),
+) -> None:
+    """
+    Add genes to a batch. Genes already in the batch keep their state, so resubmitting is harmless.
+    """
+    from eliot import start_action
+    from longevity_forest.core.warm_cache import read_gene_list
+    gene_names = list(genes or [])
+    if genes_file is not None:
+        if not genes_file.exists():
+            typer.echo(f"Error: Genes file not found: {genes_file}", err=True)
+            raise typer.Exit(1)
+        gene_names.extend(read_gene_list(genes_file))
+    if not gene_names:
+        typer.echo("Error: No genes given, pass gene names or --genes-file", err=True)
+        raise typer.Exit(1)
+    
+    with start_action(action_type="batch_submit", batch=batch, genes=gene_names) as action:
+        added, existing = submit_jobs(gene_names, batch=batch, max_attempts=max_attempts, queue_path=queue)
+        print(f"✓ Added {added} genes to batch '{batch}' ({existing} already submitted)")
+        print(f"  Run it with: forest batch run --batch {batch}")
+        action.log(message_type="batch_submitted", added=added, existing=existing)
+
+
+def process_batch_jobs(
+    query_agent: "WebAgent",
+    batch: str,
+    queue: Path,
+    worker_id: str,
+    use_cache: bool = True,
+    cache_token_budget: int = CACHED_CONTEXT_TOKEN_BUDGET,
+    wait_for_retries: bool = True,
+    lease_seconds: float = JOB_LEASE_SECONDS
+) -> None:
+    """
+    Claim and analyze genes of a batch until none is left, keeping the lease of the running gene alive.
+    
+    Args:
+        query_agent: The main query agent
+        batch: Batch name
+        queue: Job queue database
+        worker_id: Id the jobs are leased to
+        use_cache: Whether to prepend cached interim results for the gene to the prompt
+        cache_token_budget: Approximate token budget of the prepended cached results
+        wait_for_retries: Wait for scheduled retries and for leases of other workers to expire instead of
+            stopping when no gene is ready
+        lease_seconds: Time until a gene of a worker that stopped responding is handed to another worker
+    """
+    from eliot import start_action
+    from longevity_forest.core.checkpoints import RunCheckpoint
+    with start_action(action_type="process_batch_jobs", batch=batch, worker_id=worker_id) as action:
+        waiting = False
+        while True:
+            job = claim_next_job(batch, queue_path=queue, worker_id=worker_id, lease_seconds=lease_seconds)
+            if job is None:
+                retry_at = next_retry_at(batch, queue_path=queue)
+                if retry_at is None or not wait_for_retries:
+                    break
+                wait = max(1.0, retry_at - time.time())
+                if not waiting:
+                    print(f"Waiting {wait:.0f}s for the next retry or for genes of other workers...")
+                    waiting = True
+                # Sleep in heartbeat steps, so an idle worker doesn't look dead in `batch status`
+                time.sleep(min(wait, JOB_HEARTBEAT_INTERVAL_SECONDS))
+                heartbeat(worker_id, queue_path=queue)
+                continue
+            waiting = False
+            
+            gene_name = job["gene"]
+            print(f"\n[{gene_name}] attempt {job['attempts']}/{job['max_attempts']} ({worker_id})")
+            # One checkpoint per job, so a retry or a rerun after a crash continues where the attempt stopped
+            run_id = f"batch_{batch}_{gene_name}"
+            if RunCheckpoint.exists(run_id):
+                checkpoint = RunCheckpoint.load(run_id)
+            else:
+                checkpoint = RunCheckpoint.create(run_id, gene_name)
+            try:
+                with keep_lease(worker_id, job["id"], lease_seconds=lease_seconds, queue_path=queue) as lease_lost:
+                    status, filepath = analyze_and_save_gene(query_agent, gene_name, use_cache=use_cache,
+                                                             cache_token_budget=cache_token_budget, checkpoint=checkpoint)
+                error = None if filepath is not None else "No result returned from query agent"
+                if lease_lost.is_set():
+                    print(f"⚠ {gene_name}: lease expired during the analysis, another worker may have analyzed it too")
+                    action.log(message_type="lease_lost", gene_name=gene_name)
+            except KeyboardInterrupt:
+                release_job(job["id"], queue_path=queue, worker_id=worker_id)
+                typer.echo(f"\n✗ Interrupted, {gene_name} is pending again", err=True)
+                raise
+            except Exception as e:
+                status, filepath, error = "failed", None, f"{type(e).__name__}: {e}"
+            
+            if error is None:
+                complete_job(job["id"], filepath, status, queue_path=queue, worker_id=worker_id)
+                action.log(message_type="job_done", gene_name=gene_name, status=status, filepath=str(filepath))
+            else:
+                recorded, retry_at = fail_job(job["id"], error, queue_path=queue, worker_id=worker_id)
+                if not recorded:
+                    retry_note = ", not recorded: the lease was lost and the job is handled elsewhere"
+                elif retry_at is not None:
+                    retry_note = f", retry in {retry_at - time.time():.0f}s"
+                else:
+                    retry_note = ", no attempts left"
+                typer.echo(f"✗ {gene_name}: {error}{retry_note}", err=True)
+                action.log(message_type="job_failed", gene_name=gene_name, error=error, retry_at=retry_at, recorded=recorded)
+
+
+@batch_app.command("run")
+def batch_run(
+    batch: str = Option(DEFAULT_BATCH_NAME, "--batch", "-b", help="Batch name"),
+    config: Optional[Path] = Option(
+        None,
+        "--config",
+        "-c",
+        help="Path to configuration YAML file (defaults to config/agents/web_search_delegated.yaml)"
+    ),
+    cache: bool = Option(
+        True,
+        "--cache/--no-cache",
+        help="Enable or disable interim results caching; --no-cache also turns off reading cached expert answers (default: enabled)"
+    ),
+    cache_mode: CacheMode = Option(
+        CacheMode.readwrite,
+        "--cache-mode",
+        help="Exact-hit cache of expert agent answers: off, read, write or readwrite"
+    ),
+    cache_ttl_hours: Optional[float] = Option(
+        None,
+        "--cache-ttl-hours",
+        help="Maximum age of reusable cached expert answers (defaults to per-agent TTLs from config/cache.py)"
+    ),
+    similarity_threshold: Optional[float] = Option(
+        None,
+        "--similarity-threshold",
+        help="Minimum similarity (0-1) for reusing the cached answer to a near-duplicate expert query; above 1 disables it (defaults to config/cache.py)"
+    ),
+    cache_token_budget: int = Option(
+        CACHED_CONTEXT_TOKEN_BUDGET,
+        "--cache-token-budget",
+        help="Approximate token budget of cached results prepended to the analysis prompt"
+    ),
+    retry_failed: bool = Option(
+        False,
+        "--retry-failed",
+        help="Give genes that used up their attempts a fresh set of attempts"
+    ),
+    wait_for_retries: bool = Option(
+        True,
+        "--wait-for-retries/--no-wait-for-retries",
+        help="Wait for scheduled retries of failed genes instead of stopping when no gene is ready"
+    ),
+    debug: bool = Option(
+        False,
+        "--debug",
+        "-d",
+        help="Show debug information including tool distribution"
+    ),
+    queue: Path = Option(JOB_QUEUE_PATH, "--queue", help="Job queue database"),
+) -> None:
+    """
+    Analyze the pending genes of a batch. Completed genes are skipped, so an interrupted run
+    is resumed by running the same command again.
+    """
+    from dotenv import load_dotenv
+    from eliot import start_action
+    from longevity_forest.core.lazy_agents import print_agent_timings
+    configure_mcp()
+    setup_warnings()
+    load_dotenv()
+    
+    json_path, log_path = setup_logging()
+    print(f"Logging initialized: {log_path}")
+    cache_mode = effective_cache_mode(cache, cache_mode)
+    configure_expert_cache(
+        cache_mode,
+        ttl_seconds=cache_ttl_hours * 3600 if cache_ttl_hours is not None else None,
+        similarity_threshold=similarity_threshold,
+    )
+    
+    with start_action(action_type="batch_run", batch=batch, cache_enabled=cache, cache_mode=cache_mode.value) as action:
+        if config is None:
+            config = Path(__file__).parent / "config/agents/web_search_delegated.yaml"
+        if not config.exists():
+            action.log(message_type="config_not_found", config_path=str(config))
+            typer.echo(f"Error: Configuration file not found: {config}", err=True)
+            raise typer.Exit(1)
+        
+        # Jobs still marked running past their lease were cut off by a crash or preemption of an earlier run
+        recovered = recover_interrupted_jobs(batch, queue_path=queue)
+        if recovered:
+            print(f"⚠ Resuming {recovered} genes interrupted in an earlier run")
+        if retry_failed:
+            print(f"✓ Reset {reset_failed_jobs(batch, queue_path=queue)} failed genes")
+        
+        counts = count_jobs(batch, queue_path=queue)
+        print(f"Batch '{batch}': {counts['pending']} pending, {counts['running']} running, {counts['done']} done, {counts['failed']} failed")
+        action.log(message_type="batch_counts", recovered=recovered, **counts)
+        if counts["pending"] == 0 and next_retry_at(batch, queue_path=queue) is None:
+            print("✓ Nothing to do")
+            return
+        
+        agents, query_agent = load_agents(config, debug=debug, enable_cache=cache)
+        try:
+            process_batch_jobs(query_agent, batch, queue, default_worker_id(), use_cache=cache,
+                               cache_token_budget=cache_token_budget, wait_for_retries=wait_for_retries)
+        except KeyboardInterrupt:
+            typer.echo(f"Rerun `forest batch run --batch {batch}` to resume", err=True)
+            raise typer.Exit(130)
+        if debug:
+            print_agent_timings()
+        
+        print_batch_status(batch, queue)
+
+
+def print_batch_status(batch: Optional[str], queue: Path) -> None:
+    """Print the jobs of a batch (or of all batches) as a table."""
+    from rich.console import Console
+    from rich.table import Table
+    jobs = list_jobs(batch, queue_path=queue)
+    if not jobs:
+        print(f"No jobs in {'batch ' + repr(batch) if batch else queue}")
+        return
+    table = Table(title=f"Batch '{batch}'" if batch else "All batches")
+    if batch is None:
+        table.add_column("Batch")
+    for column, justify in [("Gene", "left"), ("State", "left"), ("Attempts", "right"), ("Report", "left"), ("Error", "left")]:
+        table.add_column(column, justify=justify)
+    symbols = {"done": "✓", "failed": "✗", "running": "…", "pending": " "}
+    for job in jobs:
+        state = f"{symbols[job['state']]} {job['state']}"
+        if job["state"] == "done" and job["report_status"] == "warning":
+            state += " (validation warning)"
+        row = [job["gene"], state, f"{job['attempts']}/{job['max_attempts']}", job["output_path"] or "", (job["error"] or "")[:80]]
+        table.add_row(*([job["batch"]] + row if batch is None else row))
+    Console().print(table)
+
+
+@batch_app.command("status")
+def batch_status(
+    batch: Optional[str] = Option(None, "--batch", "-b", help="Batch name (defaults to all batches)"),
+    queue: Path = Option(JOB_QUEUE_PATH, "--queue", help="Job queue database"),
+) -> None:
+    """
+    Show the state, attempts and report path of every gene in the job queue, and the workers with their throughput.
+    """
+    print_batch_status(batch, queue)
+    print_worker_status(batch, queue)
+
+
+def print_worker_status(batch: Optional[str], queue: Path) -> None:
+    """Print the workers of a batch (or of all batches) with liveness and throughput as a table."""
+    from rich.console import Console
+    from rich.table import Table
+    workers = list_workers(batch, queue_path=queue)
+    if not workers:
+        return
+    table = Table(title="Workers")
+    if batch is None:
+        table.add_column("Batch")
+    for column, justify in [("Worker", "left"), ("State", "left"), ("Current gene", "left"),
+                            ("Done", "right"), ("Failed", "right"), ("Genes/hour", "right"), ("Min/gene", "right"),
+                            ("Last heartbeat", "right")]:
+        table.add_column(column, justify=justify)
+    now = time.time()
+    for worker in workers:
+        if worker["stopped_at"] is not None:
+            state = "stopped"
+        elif worker["alive"]:
+            state = "✓ alive"
+        else:
+            # Its running gene goes to another worker once the lease expires
+            state = "✗ unresponsive"
+        mean_seconds = worker["mean_seconds_per_gene"]
+        row = [
+            worker["worker_id"],
+            state,
+            worker["current_gene"] or "",
+            str(worker["jobs_done"]),
+            str(worker["jobs_failed"]),
+            f"{worker['genes_per_hour']:.1f}",
+            f"{mean_seconds / 60:.1f}" if mean_seconds is not None else "",
+            f"{now - worker['heartbeat_at']:.0f}s ago",
+        ]
+        table.add_row(*([worker["batch"]] + row if batch is None else row))
+    Console().print(table)
+
+
+@app.command()
+def worker(
+    batch: str = Option(DEFAULT_BATCH_NAME, "--batch", "-b", help="Batch name"),
+    queue: Path = Option(JOB_QUEUE_PATH, "--queue", help="Job queue database, on storage shared by all machines running workers"),
+    worker_id: Optional[str] = Option(
+        None,
+        "--worker-id",
+        help="Id of this worker in the queue and in its output filenames (defaults to <hostname>-<pid>)"
+    ),
+    config: Optional[Path] = Option(
+        None,
+        "--config",
+        "-c",
+        help="Path to configuration YAML file (defaults to config/agents/web_search_delegated.yaml)"
+    ),
+    cache: bool = Option(
+        True,
+        "--cache/--no-cache",
+        help="Enable or disable interim results caching; --no-cache also turns off reading cached expert answers (default: enabled)"
+    ),
+    cache_mode: CacheMode = Option(
+        CacheMode.readwrite,
+        "--cache-mode",
+        help="Exact-hit cache of expert agent answers: off, read, write or readwrite"
+    ),
+    cache_ttl_hours: Optional[float] = Option(
+        None,
+        "--cache-ttl-hours",
+        help="Maximum age of reusable cached expert answers (defaults to per-agent TTLs from config/cache.py)"
+    ),
+    similarity_threshold: Optional[float] = Option(
+        None,
+        "--similarity-threshold",
+        help="Minimum similarity (0-1) for reusing the cached answer to a near-duplicate expert query; above 1 disables it (defaults to config/cache.py)"
+    ),
+    cache_token_budget: int = Option(
+        CACHED_CONTEXT_TOKEN_BUDGET,
+        "--cache-token-budget",
+        help="Approximate token budget of cached results prepended to the analysis prompt"
+    ),
+    lease_seconds: float = Option(
+        JOB_LEASE_SECONDS,
+        "--lease-seconds",
+        help="Time after which the gene of a worker that stopped sending heartbeats goes to another worker"
+    ),
+    wait_for_retries: bool = Option(
+        True,
+        "--wait-for-retries/--exit-when-idle",
+        help="Wait for scheduled retries and for genes of unresponsive workers instead of exiting when no gene is ready"
+    ),
+    debug: bool = Option(
+        False,
+        "--debug",
+        "-d",
+        help="Show debug information including tool distribution"
+    ),
+) -> None:
+    """
+    Pull genes of a batch from a shared job queue and analyze them until the batch is finished.
+    
+    Start any number of workers on any number of machines against the same queue (submit the genes
+    with `forest batch submit` first). Each running gene is leased to its worker and kept alive by
+    heartbeats; if a worker dies, its gene is picked up by another worker once the lease expires.
+    Reports and interim files carry the worker id, and `forest batch status` shows the throughput
+    of every worker.
+    """
+    from dotenv import load_dotenv
+    from eliot import start_action
+    from longevity_forest.core.helpers import set_interim_suffix
+    from longevity_forest.core.lazy_agents import print_agent_timings
+    configure_mcp()
+    setup_warnings()
+    load_dotenv()
+    
+    worker_id = worker_id or default_worker_id()
+    # Keep filenames of workers writing to the same shared directories apart
+    set_interim_suffix(re.sub(r"[^A-Za-z0-9_.-]", "-", worker_id))
+    
+    json_path, log_path = setup_logging()
+    print(f"Logging initialized: {log_path}")
+    print(f"Worker {worker_id} on batch '{batch}' ({queue})")
+    cache_mode = effective_cache_mode(cache, cache_mode)
+    configure_expert_cache(
+        cache_mode,
+        ttl_seconds=cache_ttl_hours * 3600 if cache_ttl_hours is not None else None,
+        similarity_threshold=similarity_threshold,
+    )
+    
+    with start_action(action_type="worker", batch=batch, worker_id=worker_id, queue=str(queue)) as action:
+        if config is None:
+            config = Path(__file__).parent / "config/agents/web_search_delegated.yaml"
+        if not config.exists():
+            action.log(message_type="config_not_found", config_path=str(config))
+            typer.echo(f"Error: Configuration file not found: {config}", err=True)
+            raise typer.Exit(1)
+        
+        agents, query_agent = load_agents(config, debug=debug, enable_cache=cache)
+        register_worker(worker_id, batch, queue_path=queue)
+        try:
+            process_batch_jobs(query_agent, batch, queue, worker_id, use_cache=cache, cache_token_budget=cache_token_budget,
+                               wait_for_retries=wait_for_retries, lease_seconds=lease_seconds)
+        except KeyboardInterrupt:
+            raise typer.Exit(130)
+        finally:
+            stop_worker(worker_id, queue_path=queue)
+        
+        counts = count_jobs(batch, queue_path=queue)
+        print(f"✓ Worker {worker_id} finished: batch '{batch}' has {counts['done']} done, "
+              f"{counts['failed']} failed, {counts['pending'] + counts['running']} left")
+        if debug:
+            print_agent_timings()
+
+
+def run_design_jobs(
+    target: str,
+    design_tools: List[str],
+    contact_sets: List[str],
+    run_id: Optional[str],
+    max_concurrent: int,
+) -> tuple[str, str, str]:
+    """Submit binder designs for a target (or pick up an earlier run) and wait for all of them.
+
+    Returns:
+        Tuple of (design run id, target of the run, report prompt with the design results)
+    """
+    from longevity_forest.core.design_jobs import (
+        add_designs,
+        design_results_markdown,
+        design_specs,
+        DONE as DESIGN_DONE,
+        FAILED as DESIGN_FAILED,
+        list_designs,
+        new_design_run_id,
+        PENDING as DESIGN_PENDING,
+        resolve_target_sequence,
+        run_designs,
+        RUNNING as DESIGN_RUNNING,
+    )
+    if run_id is not None:
+        designs = list_designs(run_id, DESIGN_JOBS_PATH)
+        if not designs:
+            typer.echo(f"✗ No designs for run {run_id} in {DESIGN_JOBS_PATH}", err=True)
+            raise typer.Exit(1)
+        target = designs[0]["target"]
+        print(f"Resuming design run {run_id} for {target}")
+    else:
+        print(f"Resolving the protein sequence of {target}...")
+        sequence = resolve_target_sequence(target)
+        print(f"✓ Target sequence: {len(sequence)} residues")
+        tools = design_tools or ([] if contact_sets else [DESIGN_DEFAULT_TOOL])
+        run_id = new_design_run_id(target)
+        add_designs(run_id, target, design_specs(target, sequence, tools, contact_sets), DESIGN_JOBS_PATH)
+        print(f"Design run: {run_id} (resume with --resume-designs {run_id})")
+
+    def report(designs: list[dict]) -> None:
+        counts = {state: sum(design["state"] == state for design in designs)
+                  for state in (DESIGN_PENDING, DESIGN_RUNNING, DESIGN_DONE, DESIGN_FAILED)}
+        print(f"  {datetime.now().strftime('%H:%M:%S')} designs: " + ", ".join(f"{count} {state}" for state, count in counts.items()))
+
+    try:
+        designs = run_designs(run_id, max_concurrent=max_concurrent, jobs_path=DESIGN_JOBS_PATH, on_update=report)
+    except KeyboardInterrupt:
+        print(f"\n⚠ Interrupted; submitted designs keep running on the server. Resume with: --resume-designs {run_id}")
+        raise typer.Exit(130)
+
+    for design in designs:
+        if design["state"] == DESIGN_FAILED:
+            print(f"⚠ Design {design['id']} ({design['tool']}) failed: {design['error']}")
+    if not any(design["state"] == DESIGN_DONE for design in designs):
+        typer.echo(f"✗ All designs of run {run_id} failed", err=True)
+        raise typer.Exit(1)
+    sequence = designs[0]["arguments"].get(DESIGN_TARGET_ARGUMENT, "")
+    return run_id, target, get_design_report_prompt(target, sequence, design_results_markdown(designs))
 
 
 @app.command()
@@ -465,6 +1319,37 @@ def hunt_protein(
         "--show-history/--no-history",
         help="Display conversation history after design"
     ),
+    auto_gc: bool = Option(
+        False,
+        "--auto-gc/--no-auto-gc",
+        help="Evict expired and least recently used interim results at the end of the run (see `forest cache gc`)"
+    ),
+    async_designs: bool = Option(
+        False,
+        "--async-designs",
+        help=f"Run the designs as jobs on the server instead of inside the agent conversation (defaults to one {DESIGN_DEFAULT_TOOL} design)"
+    ),
+    design_tools: Optional[List[str]] = Option(
+        None,
+        "--design-tool",
+        "-T",
+        help="Design tool to run as a job, repeat for several concurrent designs (e.g. ph_design_protein_binder, ph_chai_design_protein_binder); implies --async-designs"
+    ),
+    contacts: Optional[List[str]] = Option(
+        None,
+        "--contacts",
+        help=f"Contact residues of a {DESIGN_CONTACTS_TOOL} design job, repeat for several contact sets (e.g. 'A10,A25,A31'); implies --async-designs"
+    ),
+    resume_designs: Optional[str] = Option(
+        None,
+        "--resume-designs",
+        help="Design run id to pick up: keep polling its submitted designs and write the report once they are done"
+    ),
+    max_concurrent: int = Option(
+        DESIGN_MAX_CONCURRENT,
+        "--max-concurrent",
+        help="Design jobs running on the server at the same time"
+    ),
 ) -> None:
     """
     Design a degradation peptide for a target protein using protein hunter agent.
@@ -475,7 +1360,17 @@ def hunt_protein(
     3. Generate a degradation adaptor by fusing ubiquitin to the binder
     
     The resulting peptide will target the protein for degradation via the ubiquitin-proteasome system.
+    
+    With --async-designs (or --design-tool/--contacts), the designs are submitted as jobs recorded in
+    data/designs/jobs.sqlite and run concurrently on the server; the agent only compares the finished
+    designs and writes the report. An interrupted run is picked up with --resume-designs RUN_ID.
     """
+    from dotenv import load_dotenv
+    from eliot import start_action
+    from rich.console import Console
+    from longevity_forest.core.helpers import save_result_to_markdown, validate_markdown_file
+    from longevity_forest.core.agent_profiles import build_agent
+    configure_mcp()
     setup_warnings()
     load_dotenv()
     
@@ -501,16 +1396,18 @@ def hunt_protein(
         
         # Load protein hunter agent
         print("Loading protein hunter agent...")
-        protein_hunter_agent: WebAgent = WebAgent.from_yaml(
-            section_name="protein_hunter",
-            parent_section="agent_profiles",
-            file_path=config
-        )
+        protein_hunter_agent: WebAgent = build_agent("protein_hunter", config)
         print("✓ Loaded protein_hunter agent")
         action.log(message_type="agent_loaded", agent="protein_hunter")
         
-        # Construct the prompt for protein degradation design
-        prompt = f"""Design a degradation peptide for the target: {target}
+        if async_designs or design_tools or contacts or resume_designs:
+            design_run_id, target, prompt = run_design_jobs(target, design_tools or [], contacts or [],
+                                                    resume_designs, max_concurrent)
+            action.log(message_type="designs_collected", design_run_id=design_run_id)
+            console.print("\n[bold]Sending design results to protein hunter agent...[/bold]\n")
+        else:
+            # Construct the prompt for protein degradation design
+            prompt = f"""Design a degradation peptide for the target: {target}
 
 Your task:
 1. If {target} is a gene name, first resolve it to a protein sequence using appropriate tools
@@ -529,8 +1426,8 @@ Please provide:
 
 Generate a comprehensive report in markdown format."""
 
-        console.print("\n[bold]Sending design request to protein hunter agent...[/bold]")
-        console.print("[yellow]Note: Protein design is a long-running task (5-10 minutes per design)[/yellow]\n")
+            console.print("\n[bold]Sending design request to protein hunter agent...[/bold]")
+            console.print("[yellow]Note: Protein design is a long-running task (5-10 minutes per design)[/yellow]\n")
         
         result = protein_hunter_agent.query(query_input=prompt)
         action.log(message_type="design_complete", target=target)
@@ -568,6 +1465,139 @@ Generate a comprehensive report in markdown format."""
                 protein_hunter_agent.memory.pretty_print_all_messages()
             # Repeat report link after history for convenience
             print(f"\nOpen report: {file_uri}")
+        
+        if auto_gc:
+            run_cache_gc(INTERIM_DIR, max_bytes=CACHE_MAX_BYTES)
+
+
+@design_app.command("status")
+def design_status(
+    run_id: Optional[str] = Argument(None, help="Design run to show in detail (defaults to a summary of all runs)"),
+    jobs: Path = Option(DESIGN_JOBS_PATH, "--jobs", help="Design jobs database"),
+) -> None:
+    """Show design runs, or the designs of one run with their server jobs and outcomes."""
+    from rich.console import Console
+    from rich.table import Table
+    from longevity_forest.core.design_jobs import (
+        DONE as DESIGN_DONE,
+        FAILED as DESIGN_FAILED,
+        list_design_runs,
+        list_designs,
+        PENDING as DESIGN_PENDING,
+        RUNNING as DESIGN_RUNNING,
+    )
+    console = Console()
+    if run_id is None:
+        runs = list_design_runs(jobs)
+        if not runs:
+            print(f"No design runs in {jobs}")
+            return
+        table = Table(title="Design runs")
+        table.add_column("Run")
+        table.add_column("Target")
+        for state in (DESIGN_PENDING, DESIGN_RUNNING, DESIGN_DONE, DESIGN_FAILED):
+            table.add_column(state.capitalize(), justify="right")
+        table.add_column("Updated", justify="right")
+        for run in runs:
+            table.add_row(run["run_id"], run["target"][:20],
+                          *(str(run[state]) for state in (DESIGN_PENDING, DESIGN_RUNNING, DESIGN_DONE, DESIGN_FAILED)),
+                          datetime.fromtimestamp(run["updated_at"]).strftime("%Y-%m-%d %H:%M"))
+        console.print(table)
+        return
+
+    designs = list_designs(run_id, jobs)
+    if not designs:
+        typer.echo(f"✗ No designs for run {run_id} in {jobs}", err=True)
+        raise typer.Exit(1)
+    table = Table(title=f"Designs of {run_id}")
+    for column in ("Id", "Tool", "State", "Server job", "Polls", "Running for", "Outcome"):
+        table.add_column(column)
+    now = time.time()
+    for design in designs:
+        started = design["submitted_at"]
+        elapsed = (design["finished_at"] or now) - started if started else None
+        if design["state"] == DESIGN_DONE:
+            outcome = json.dumps(design["result"], default=str)[:80]
+        else:
+            outcome = (design["error"] or "")[:80]
+        table.add_row(str(design["id"]), design["tool"], design["state"], design["server_job_id"] or "",
+                      str(design["polls"]), f"{elapsed / 60:.1f} min" if elapsed is not None else "", outcome)
+    console.print(table)
+
+
+@design_app.command("stub-server")
+def design_stub_server(
+    port: int = Option(8770, "--port", help="Port of the stub, reachable at http://127.0.0.1:PORT/mcp"),
+    design_seconds: float = Option(60.0, "--design-seconds", help="How long every simulated design takes"),
+    job_tools: bool = Option(True, "--job-tools/--no-job-tools", help="Offer the submit/status job tools (without them designs are blocking calls only)"),
+) -> None:
+    """
+    Run a local stand-in for the protein hunter server whose designs take --design-seconds.
+    
+    Point DESIGN_MCP_CONFIG (config/design.py) at it to try --async-designs without a GPU server.
+    """
+    from longevity_forest.core.protein_hunter_stub import serve_stub
+    print(f"Protein hunter stub on http://127.0.0.1:{port}/mcp, designs take {design_seconds:.0f}s")
+    serve_stub(port, design_seconds, job_tools)
+
+
+@tools_app.command("refresh")
+def tools_refresh(
+    servers: Optional[List[str]] = Option(None, "--server", help="Server URL to refresh (repeatable, defaults to all known servers)"),
+    clear_profiles: bool = Option(False, "--clear-profiles", help="Also recompile the agent configs cached in data/profiles/"),
+) -> None:
+    """
+    Fetch the tool lists of the MCP servers now and store them, e.g. after a server changed its tools.
+    
+    Known servers are the ones in config/mcp.py and the ones already stored. Agents otherwise use the
+    stored schemas and only refresh them in the background once they are older than a day.
+    """
+    from longevity_forest.core.agent_profiles import clear_compiled_profiles
+    from longevity_forest.core.tool_schemas import fetch_tool_schemas, known_servers
+    configure_mcp()
+    known = known_servers()
+    if servers:
+        unknown = [url for url in servers if url not in known]
+        if unknown:
+            typer.echo(f"✗ Unknown server(s): {', '.join(unknown)}", err=True)
+            raise typer.Exit(1)
+        known = {url: known[url] for url in servers}
+    failed = 0
+    for url, mcp_client_config in known.items():
+        try:
+            entry = fetch_tool_schemas(mcp_client_config)
+            print(f"✓ {url}: {len(entry['tools'])} tools")
+        except Exception as e:
+            failed += 1
+            print(f"✗ {url}: {type(e).__name__}: {e}")
+    if clear_profiles:
+        print(f"✓ Removed {clear_compiled_profiles()} compiled agent configs")
+    if failed:
+        print(f"⚠ {failed} of {len(known)} servers could not be reached, their stored schemas are kept")
+        raise typer.Exit(1)
+
+
+@tools_app.command("list")
+def tools_list() -> None:
+    """Show the stored tool schemas of every server and how old they are."""
+    from rich.console import Console
+    from rich.table import Table
+    from longevity_forest.core.tool_schemas import list_cached_servers
+    entries = list_cached_servers()
+    if not entries:
+        print(f"No stored tool schemas in {MCP_SCHEMA_CACHE_DIR}, they are fetched when agents are first built")
+        return
+    table = Table(title=f"Stored tool schemas ({MCP_SCHEMA_CACHE_DIR})")
+    table.add_column("Server")
+    table.add_column("Tools", justify="right")
+    table.add_column("Fetched", justify="right")
+    table.add_column("Stale", justify="center")
+    now = time.time()
+    for entry in entries:
+        table.add_row(entry["url"], str(len(entry["tools"])),
+                      datetime.fromtimestamp(entry["fetched_at"]).strftime("%Y-%m-%d %H:%M"),
+                      "yes" if now - entry["fetched_at"] > MCP_SCHEMA_TTL_SECONDS else "")
+    Console().print(table)
 
 
 @app.command()
@@ -620,6 +1650,21 @@ def insilico_knockout(
         "--show-history/--no-history",
         help="Display conversation history after analysis"
     ),
+    direct: bool = Option(
+        False,
+        "--direct",
+        help="Requires --gene-sentence: call the cell2sentence4longevity MCP server directly and render the report from a template instead of running the agent"
+    ),
+    interpret: bool = Option(
+        False,
+        "--interpret/--no-interpret",
+        help="With --direct, append an LLM interpretation to the report once it is ready"
+    ),
+    auto_gc: bool = Option(
+        False,
+        "--auto-gc/--no-auto-gc",
+        help="Evict expired and least recently used interim results at the end of the run (see `forest cache gc`)"
+    ),
 ) -> None:
     """
     Perform in-silico knockout analysis using cell2sentence4longevity model.
@@ -630,11 +1675,24 @@ def insilico_knockout(
     3. Compare biological age predictions before and after knockout
     4. Analyze the impact of the gene on aging
     
+    With --direct and --gene-sentence, no LLM decides anything: the predictions are made directly
+    and the report is rendered from a template, optionally with an LLM interpretation added later.
+    
     ⚠️ WARNING: GPU-intensive workflow - requires H100 GPU and cell2sentence4longevity MCP server running.
     """
+    from dotenv import load_dotenv
+    from eliot import start_action
+    from rich.console import Console
+    from longevity_forest.core.helpers import save_result_to_markdown, validate_markdown_file
+    from longevity_forest.core.agent_profiles import build_agent
+    configure_mcp()
     setup_warnings()
     load_dotenv()
     
+    if direct and not gene_sentence:
+        typer.echo("Error: --direct needs --gene-sentence (without it the agent has to construct the sentence)", err=True)
+        raise typer.Exit(1)
+    
     # Setup Eliot logging
     json_path, log_path = setup_logging()
     print(f"Logging initialized: {log_path}")
@@ -660,17 +1718,26 @@ def insilico_knockout(
         console.print(f"\n[bold cyan]In-silico Knockout Analysis for:[/bold cyan] [bold yellow]{gene_name}[/bold yellow]")
         console.print("[dim]" + "-" * 60 + "[/dim]")
         
+        if direct:
+            filepath = run_direct_knockout(
+                gene_name,
+                gene_sentence,
+                {"sex": sex, "tissue": tissue, "cell_type": cell_type, "smoking_status": smoking_status},
+                config,
+                interpret=interpret
+            )
+            action.log(message_type="result_saved", filepath=str(filepath), direct=True)
+            if auto_gc:
+                run_cache_gc(INTERIM_DIR, max_bytes=CACHE_MAX_BYTES)
+            return
+        
         # Load insilico knockout agent
         print("Loading in-silico knockout agent...")
         
         # Import BaseAgentWithLogging from just_agents
         from just_agents.base_agent import BaseAgentWithLogging
         
-        knockout_agent: BaseAgentWithLogging = BaseAgentWithLogging.from_yaml(
-            section_name="insilico_knockout_agent",
-            parent_section="agent_profiles",
-            file_path=config
-        )
+        knockout_agent: BaseAgentWithLogging = build_agent("insilico_knockout_agent", config, BaseAgentWithLogging)
         print("✓ Loaded insilico_knockout_agent")
         action.log(message_type="agent_loaded", agent="insilico_knockout_agent")
         
@@ -742,6 +1809,675 @@ def insilico_knockout(
                 knockout_agent.memory.pretty_print_all_messages()
             # Repeat report link after history for convenience
             print(f"\nOpen report: {file_uri}")
+        
+        if auto_gc:
+            run_cache_gc(INTERIM_DIR, max_bytes=CACHE_MAX_BYTES)
+
+
+def run_direct_knockout(
+    gene_name: str,
+    gene_sentence: str,
+    metadata: dict,
+    config: Path,
+    interpret: bool = False
+) -> Path:
+    """
+    Knock out one gene by calling the cell2sentence4longevity MCP server directly and save the templated report.
+    
+    The original and knockout sentences are predicted concurrently. The report is saved as soon as the
+    numbers are in; the LLM interpretation, if requested, is appended to it once ready.
+    
+    Args:
+        gene_name: Gene to knock out
+        gene_sentence: Gene expression sentence (space-separated, descending expression)
+        metadata: Metadata of the cell (sex, tissue, cell_type, smoking_status), None values are left out
+        config: Configuration YAML file with the insilico_knockout_agent profile, used for the interpretation
+        interpret: Whether to append an LLM interpretation
+    
+    Returns:
+        Path of the saved report
+    """
+    from eliot import start_action
+    from longevity_forest.core.helpers import save_result_to_markdown
+    from longevity_forest.core.knockout import (
+        gene_position,
+        knockout_sentence,
+        metadata_table_markdown,
+        predict,
+        rank_knockouts,
+        render_knockout_report,
+    )
+    if gene_position(gene_sentence, gene_name) is None:
+        typer.echo(f"Error: {gene_name} is not in the gene sentence", err=True)
+        raise typer.Exit(1)
+    
+    with start_action(action_type="direct_knockout", gene_name=gene_name) as action:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            original_future = executor.submit(predict, gene_sentence, metadata)
+            knockout_future = executor.submit(predict, knockout_sentence(gene_sentence, [gene_name]), metadata)
+            try:
+                original, knockout = original_future.result(), knockout_future.result()
+            except Exception as e:
+                action.log(message_type="prediction_failed", error=str(e))
+                typer.echo(f"✗ Age prediction failed: {e}", err=True)
+                raise typer.Exit(1)
+        print(f"✓ Predictions done in {time.perf_counter() - started:.1f}s")
+        action.log(message_type="predictions_complete", original_age=original["age"], knockout_age=knockout["age"])
+        
+        report = render_knockout_report(gene_name, gene_sentence, metadata, original["age"], knockout["age"],
+                                        model=original["model"])
+        safe_gene = gene_name.replace("/", "_").replace("\\", "_")
+        
+        # Interpret in the background while the numbers are saved and shown
+        interpretation_future = None
+        interpretation_executor = None
+        if interpret:
+            rows = rank_knockouts([{
+                "gene": gene_name,
+                "sentence_position": gene_position(gene_sentence, gene_name),
+                "original_age": original["age"],
+                "knockout_age": knockout["age"],
+                "delta_age": knockout["age"] - original["age"],
+                "error": None,
+            }])
+            interpretation_executor = ThreadPoolExecutor(max_workers=1)
+            interpretation_future = interpretation_executor.submit(
+                interpret_knockouts, config, metadata_table_markdown(gene_sentence, metadata), original["age"], rows, 1
+            )
+        
+        filepath = save_result_to_markdown(report, f"insilico_knockout_{safe_gene}")
+        delta_age = knockout["age"] - original["age"]
+        typer.echo(f"\n✓ Delta age {delta_age:+.2f} years (original {original['age']:.2f}, knockout {knockout['age']:.2f})")
+        
+        if interpretation_future is not None:
+            print("Waiting for the interpretation (the report above is already complete)...")
+            try:
+                interpretation = interpretation_future.result()
+            except Exception as e:
+                interpretation = None
+                typer.echo(f"⚠ Interpretation failed: {e}", err=True)
+            finally:
+                interpretation_executor.shutdown()
+            if interpretation:
+                with open(filepath, "a", encoding="utf-8") as f:
+                    f.write(f"\n## Interpretation\n\n{interpretation}\n")
+                print(f"✓ Interpretation appended to: {filepath}")
+        return filepath
+
+
+def interpret_knockouts(
+    config: Path,
+    setup_table: str,
+    original_age: float,
+    rows: list[dict],
+    top_n: int
+) -> Optional[str]:
+    """
+    Ask the in-silico knockout agent to interpret the top knockouts of a screen.
+    
+    Args:
+        config: Configuration YAML file with the insilico_knockout_agent profile
+        setup_table: Markdown table of the shared gene sentence and metadata
+        original_age: Predicted age of the original sentence
+        rows: Ranked knockout rows
+        top_n: Number of top knockouts to interpret
+    
+    Returns:
+        The interpretation, or None if there is nothing to interpret
+    """
+    from longevity_forest.core.knockout import knockout_table_markdown
+    from longevity_forest.core.agent_profiles import build_agent
+    top_rows = [row for row in rows if row["delta_age"] is not None][:top_n]
+    if not top_rows:
+        return None
+    from just_agents.base_agent import BaseAgentWithLogging
+    
+    knockout_agent: BaseAgentWithLogging = build_agent("insilico_knockout_agent", config, BaseAgentWithLogging)
+    prompt = get_knockout_interpretation_prompt(setup_table, original_age, knockout_table_markdown(top_rows), len(top_rows))
+    result = knockout_agent.query(query_input=prompt)
+    return str(result) if result else None
+
+
+@app.command()
+def insilico_knockout_batch(
+    genes: Optional[List[str]] = Argument(None, help="Genes to knock out one at a time (e.g., KLF6 S100A4 FTL)"),
+    genes_file: Optional[Path] = Option(
+        None,
+        "--genes-file",
+        "-f",
+        help="File with genes to knock out, one per line (or comma/whitespace separated)"
+    ),
+    gene_sentence: str = Option(
+        ...,
+        "--gene-sentence",
+        "-g",
+        help="Gene expression sentence shared by all knockouts (space-separated gene names ordered by descending expression)"
+    ),
+    sex: Optional[str] = Option(None, "--sex", "-s", help="Optional sex metadata (male/female)"),
+    tissue: Optional[str] = Option(None, "--tissue", "-t", help="Optional tissue type (e.g., blood, brain, liver)"),
+    cell_type: Optional[str] = Option(None, "--cell-type", "-ct", help="Optional cell type (e.g., 'CD14-low, CD16-positive monocyte')"),
+    smoking_status: Optional[int] = Option(None, "--smoking-status", "-sm", help="Optional smoking status: 0 = non-smoker, 1 = smoker"),
+    workers: int = Option(
+        KNOCKOUT_WORKERS,
+        "--workers",
+        "-w",
+        help="Maximum number of concurrent predictions on the MCP server"
+    ),
+    timeout: float = Option(
+        KNOCKOUT_TIMEOUT_SECONDS,
+        "--timeout",
+        help="Maximum time in seconds for a single prediction"
+    ),
+    parquet: bool = Option(
+        False,
+        "--parquet",
+        help="Also write the ranked table as Parquet (requires pyarrow)"
+    ),
+    interpret_top: int = Option(
+        0,
+        "--interpret-top",
+        help="Ask the in-silico knockout agent to interpret the N knockouts with the largest effect (0 = no LLM call)"
+    ),
+    config: Optional[Path] = Option(
+        None,
+        "--config",
+        "-c",
+        help="Path to in-silico knockout configuration YAML file, used by --interpret-top (defaults to config/agents/insilico_knockout.yaml)"
+    ),
+) -> None:
+    """
+    Screen many gene knockouts on one gene expression sentence without an LLM per gene.
+    
+    Calls the cell2sentence4longevity MCP server directly: the original sentence is predicted once,
+    then every gene is removed and the sentence predicted again with bounded concurrency. Writes a
+    single table ranked by |delta age| as CSV (and optionally Parquet) plus a markdown report.
+    
+    ⚠️ WARNING: GPU-intensive workflow - requires the cell2sentence4longevity MCP server.
+    """
+    from dotenv import load_dotenv
+    from eliot import start_action
+    from rich.console import Console
+    from rich.table import Table
+    from longevity_forest.core.helpers import save_result_to_markdown
+    from longevity_forest.core.warm_cache import read_gene_list
+    from longevity_forest.core.knockout import (
+        knockout_table_markdown,
+        metadata_table_markdown,
+        run_knockouts,
+        write_knockout_csv,
+        write_knockout_parquet,
+    )
+    configure_mcp()
+    setup_warnings()
+    load_dotenv()
+    
+    json_path, log_path = setup_logging()
+    print(f"Logging initialized: {log_path}")
+    
+    all_genes = list(genes or [])
+    if genes_file is not None:
+        all_genes.extend(read_gene_list(genes_file))
+    all_genes = list(dict.fromkeys(all_genes))
+    if not all_genes:
+        typer.echo("Error: No genes given (pass genes as arguments or with --genes-file)", err=True)
+        raise typer.Exit(1)
+    if config is None:
+        config = Path(__file__).parent / "config/agents/insilico_knockout.yaml"
+    if interpret_top > 0 and not config.exists():
+        typer.echo(f"Error: Configuration file not found: {config}", err=True)
+        raise typer.Exit(1)
+    
+    metadata = {"sex": sex, "tissue": tissue, "cell_type": cell_type, "smoking_status": smoking_status}
+    console = Console()
+    console.print("\n[bold red]⚠️  WARNING: GPU-INTENSIVE WORKFLOW[/bold red]")
+    console.print(f"[bold cyan]Knockout screen:[/bold cyan] {len(all_genes)} genes, {workers} concurrent predictions\n")
+    
+    with start_action(action_type="insilico_knockout_batch", genes=len(all_genes), workers=workers) as action:
+        started = time.perf_counter()
+        try:
+            original_age, rows = run_knockouts(gene_sentence, all_genes, metadata, max_workers=workers, timeout=timeout)
+        except Exception as e:
+            action.log(message_type="baseline_prediction_failed", error=str(e))
+            typer.echo(f"✗ Prediction of the original sentence failed: {e}", err=True)
+            raise typer.Exit(1)
+        elapsed = time.perf_counter() - started
+        predicted = [row for row in rows if row["delta_age"] is not None]
+        failed = [row for row in rows if row["delta_age"] is None]
+        print(f"✓ Original age {original_age:.2f}; {len(predicted)} knockouts predicted, {len(failed)} skipped or failed in {elapsed:.1f}s")
+        action.log(message_type="knockouts_complete", original_age=original_age, predicted=len(predicted),
+                   failed=len(failed), seconds=elapsed)
+        
+        setup_table = metadata_table_markdown(gene_sentence, metadata)
+        report_parts = [
+            "# In-silico Knockout Screen",
+            "",
+            "## Results Summary",
+            "",
+            f"- **Original age:** {original_age:.2f} years",
+            f"- **Knockouts:** {len(predicted)} predicted, {len(failed)} skipped or failed",
+        ]
+        if predicted:
+            top = predicted[0]
+            report_parts.append(f"- **Largest effect:** {top['gene']}, delta age {top['delta_age']:+.2f} years ({top['direction']})")
+        report_parts.extend([
+            "",
+            "## Experimental Setup",
+            "",
+            setup_table,
+            "",
+            "## Knockouts Ranked by |Delta Age|",
+            "",
+            "Delta age = knockout age - original age; positive means the gene may be protective, negative pro-aging.",
+            "",
+            knockout_table_markdown(rows),
+        ])
+        if interpret_top > 0:
+            print(f"Interpreting the top {interpret_top} knockouts...")
+            interpretation = interpret_knockouts(config, setup_table, original_age, rows, interpret_top)
+            if interpretation:
+                report_parts.extend(["", f"## Interpretation of the Top {min(interpret_top, len(predicted))} Knockouts", "", interpretation])
+        
+        filepath = save_result_to_markdown("\n".join(report_parts) + "\n", "insilico_knockout_batch")
+        csv_path = write_knockout_csv(rows, filepath.with_suffix(".csv"))
+        print(f"✓ Ranked table saved to: {csv_path}")
+        if parquet:
+            try:
+                print(f"✓ Ranked table saved to: {write_knockout_parquet(rows, filepath.with_suffix('.parquet'))}")
+            except ImportError:
+                typer.echo("⚠ pyarrow is not installed, skipped the Parquet table", err=True)
+        action.log(message_type="result_saved", filepath=str(filepath), csv_path=str(csv_path))
+        
+        table = Table(title=f"Top knockouts (original age {original_age:.2f})")
+        for column, justify in [("Rank", "right"), ("Gene", "left"), ("Knockout age", "right"), ("Delta age", "right"), ("Direction", "left")]:
+            table.add_column(column, justify=justify)
+        for row in predicted[:20]:
+            table.add_row(str(row["rank"]), row["gene"], f"{row['knockout_age']:.2f}", f"{row['delta_age']:+.2f}", row["direction"])
+        console.print(table)
+
+
+def parse_gene_sets(gene_sets: List[str]) -> dict[str, list[str]]:
+    """Parse --gene-set values like "NAME=G1,G2" (or "G1,G2", named after its genes) into label -> genes."""
+    parsed = {}
+    for gene_set in gene_sets:
+        name, _, genes = gene_set.rpartition("=")
+        members = [gene for gene in genes.replace(",", " ").split() if gene]
+        if not members:
+            raise typer.BadParameter(f"Gene set without genes: {gene_set!r}")
+        parsed[name or "+".join(members)] = members
+    return parsed
+
+
+@app.command()
+def knockout_scan(
+    gene_sentence: str = Option(
+        ...,
+        "--gene-sentence",
+        "-g",
+        help="Gene expression sentence of the cell (space-separated gene names ordered by descending expression)"
+    ),
+    sex: Optional[str] = Option(None, "--sex", "-s", help="Optional sex metadata (male/female)"),
+    tissue: Optional[str] = Option(None, "--tissue", "-t", help="Optional tissue type (e.g., blood, brain, liver)"),
+    cell_type: Optional[str] = Option(None, "--cell-type", "-ct", help="Optional cell type (e.g., 'CD14-low, CD16-positive monocyte')"),
+    smoking_status: Optional[int] = Option(None, "--smoking-status", "-sm", help="Optional smoking status: 0 = non-smoker, 1 = smoker"),
+    top_k: Optional[int] = Option(
+        None,
+        "--top-k",
+        "-k",
+        help="Knock out only the K most expressed genes of the sentence (default: every gene, unless gene sets are given)"
+    ),
+    gene_set: Optional[List[str]] = Option(
+        None,
+        "--gene-set",
+        help="Genes knocked out together, as NAME=G1,G2 or G1,G2 (repeatable)"
+    ),
+    workers: int = Option(
+        KNOCKOUT_WORKERS,
+        "--workers",
+        "-w",
+        help="Maximum number of concurrent MCP calls"
+    ),
+    timeout: float = Option(
+        KNOCKOUT_TIMEOUT_SECONDS,
+        "--timeout",
+        help="Maximum time in seconds for a single MCP call"
+    ),
+    fresh: bool = Option(
+        False,
+        "--fresh",
+        help="Discard the predictions of an earlier run of the same scan instead of resuming it"
+    ),
+) -> None:
+    """
+    Knock out every gene (or the top K genes, or gene sets) of one cell's sentence and rank them by delta age.
+    
+    The original sentence is predicted once, every prediction is recorded in
+    data/knockout_scans/<scan id>/ as it arrives, and rerunning the same command resumes an
+    interrupted scan. Writes the knockouts sorted by |delta age| (delta_age.csv) and rank plot data
+    (rank_plot.tsv) to the same directory.
+    
+    ⚠️ WARNING: GPU-intensive workflow - requires the cell2sentence4longevity MCP server.
+    """
+    from dotenv import load_dotenv
+    from eliot import start_action
+    from rich.console import Console
+    from rich.table import Table
+    from longevity_forest.core.knockout import (
+        SCAN_COLUMNS,
+        scan_id,
+        scan_knockouts,
+        sentence_genes,
+        write_knockout_csv,
+        write_rank_plot_data,
+    )
+    configure_mcp()
+    setup_warnings()
+    load_dotenv()
+    
+    json_path, log_path = setup_logging()
+    print(f"Logging initialized: {log_path}")
+    
+    genes = sentence_genes(gene_sentence)
+    knockouts = {}
+    if top_k is not None or not gene_set:
+        knockouts.update({gene: [gene] for gene in (genes[:top_k] if top_k is not None else genes)})
+    knockouts.update(parse_gene_sets(gene_set or []))
+    
+    metadata = {"sex": sex, "tissue": tissue, "cell_type": cell_type, "smoking_status": smoking_status}
+    scan_dir = KNOCKOUT_SCAN_DIR / scan_id(gene_sentence, metadata)
+    if fresh and scan_dir.exists():
+        shutil.rmtree(scan_dir)
+    scan_dir.mkdir(parents=True, exist_ok=True)
+    (scan_dir / "scan.json").write_text(
+        json.dumps({"gene_sentence": gene_sentence, "metadata": metadata, "knockouts": knockouts}, indent=2),
+        encoding="utf-8"
+    )
+    
+    console = Console()
+    console.print("\n[bold red]⚠️  WARNING: GPU-INTENSIVE WORKFLOW[/bold red]")
+    console.print(f"[bold cyan]Knockout scan:[/bold cyan] {len(knockouts)} knockouts of a {len(genes)}-gene sentence → {scan_dir}\n")
+    
+    with start_action(action_type="knockout_scan", scan_dir=str(scan_dir), knockouts=len(knockouts)) as action:
+        started = time.perf_counter()
+        try:
+            original_age, rows = scan_knockouts(gene_sentence, knockouts, metadata, scan_dir=scan_dir,
+                                                max_workers=workers, timeout=timeout)
+        except Exception as e:
+            action.log(message_type="baseline_prediction_failed", error=str(e))
+            typer.echo(f"✗ Prediction of the original sentence failed: {e}", err=True)
+            raise typer.Exit(1)
+        predicted = [row for row in rows if row["delta_age"] is not None]
+        failed = [row for row in rows if row["delta_age"] is None]
+        print(f"✓ Original age {original_age:.2f}; {len(predicted)} knockouts predicted, "
+              f"{len(failed)} skipped or failed in {time.perf_counter() - started:.1f}s")
+        action.log(message_type="scan_complete", original_age=original_age, predicted=len(predicted), failed=len(failed))
+        
+        csv_path = write_knockout_csv(rows, scan_dir / "delta_age.csv", columns=SCAN_COLUMNS)
+        plot_path = write_rank_plot_data(rows, scan_dir / "rank_plot.tsv")
+        print(f"✓ Sorted delta ages saved to: {csv_path}")
+        print(f"✓ Rank plot data saved to: {plot_path}")
+        if failed:
+            typer.echo(f"⚠ {len(failed)} knockouts have no prediction, rerun the same command to retry them", err=True)
+        
+        table = Table(title=f"Largest effects (original age {original_age:.2f})")
+        for column, justify in [("Rank", "right"), ("Knockout", "left"), ("Position", "right"), ("Delta age", "right"), ("Direction", "left")]:
+            table.add_column(column, justify=justify)
+        for row in predicted[:20]:
+            table.add_row(str(row["rank"]), row["gene"], str(row["sentence_position"]), f"{row['delta_age']:+.2f}", row["direction"])
+        console.print(table)
+
+
+@app.command()
+def warm_cache(
+    genes: Optional[List[str]] = Argument(None, help="Gene symbols to prefetch (e.g., NRF2 TP53 FOXO3)"),
+    genes_file: Optional[Path] = Option(
+        None,
+        "--genes-file",
+        "-f",
+        help="File with gene symbols, one per line"
+    ),
+    workers: int = Option(
+        WARM_CACHE_WORKERS,
+        "--workers",
+        "-w",
+        help="Maximum number of concurrent MCP calls"
+    ),
+    timeout: float = Option(
+        WARM_CACHE_TIMEOUT_SECONDS,
+        "--timeout",
+        help="Maximum time in seconds for a single MCP call"
+    ),
+) -> None:
+    """
+    Prefetch deterministic per-gene MCP lookups (ID resolution, UniProt, AlphaFold, InterPro) into the tool cache.
+    
+    Run before analyze-genes so the agents start with a warm cache. The lookups are listed in
+    WARM_CACHE_LOOKUPS in config/mcp.py.
+    """
+    from dotenv import load_dotenv
+    from eliot import start_action
+    from rich.console import Console
+    from rich.table import Table
+    from longevity_forest.core.warm_cache import read_gene_list, summarize_by_tool, warm_tool_cache
+    configure_mcp()
+    setup_warnings()
+    load_dotenv()
+    json_path, log_path = setup_logging()
+    print(f"Logging initialized: {log_path}")
+    
+    all_genes = list(genes or [])
+    if genes_file is not None:
+        if not genes_file.exists():
+            typer.echo(f"Error: Genes file not found: {genes_file}", err=True)
+            raise typer.Exit(1)
+        all_genes.extend(read_gene_list(genes_file))
+    # Keep order, drop duplicates
+    all_genes = list(dict.fromkeys(all_genes))
+    if not all_genes:
+        typer.echo("Error: No genes given, pass gene symbols or --genes-file", err=True)
+        raise typer.Exit(1)
+    
+    with start_action(action_type="warm_cache_command", genes=all_genes, workers=workers) as action:
+        print(f"Prefetching lookups for {len(all_genes)} genes with {workers} workers...")
+        started = datetime.now()
+        outcomes = warm_tool_cache(all_genes, max_workers=workers, timeout=timeout)
+        elapsed = (datetime.now() - started).total_seconds()
+        
+        table = Table(title=f"Tool cache warm-up ({elapsed:.1f}s wall time)")
+        for column in ("Tool", "Calls", "Already cached", "Failed", "Mean s", "Max s"):
+            table.add_column(column, justify="left" if column == "Tool" else "right")
+        for row in summarize_by_tool(outcomes):
+            table.add_row(
+                row["tool"],
+                str(row["calls"]),
+                str(row["cached"]),
+                f"[red]{row['failed']}[/red]" if row["failed"] else "0",
+                f"{row['total_seconds'] / row['calls']:.2f}",
+                f"{row['max_seconds']:.2f}",
+            )
+        Console().print(table)
+        
+        failures = [outcome for outcome in outcomes if outcome["error"] is not None]
+        for outcome in failures:
+            print(f"✗ {outcome['gene']} {outcome['tool']}: {outcome['error']}")
+        action.log(message_type="warm_cache_complete", calls=len(outcomes), failed=len(failures), seconds=elapsed)
+        print(f"{'⚠' if failures else '✓'} {len(outcomes) - len(failures)}/{len(outcomes)} lookups cached")
+
+
+@cache_app.command("reindex")
+def cache_reindex(
+    interim_dir: Path = Option(
+        INTERIM_DIR,
+        "--interim-dir",
+        help="Directory with cached interim results"
+    ),
+) -> None:
+    """
+    Rebuild the full-text search index over existing cached interim results.
+    
+    Needed once for interim directories created before the index existed, or after
+    result files were copied in or removed by hand.
+    """
+    if not interim_dir.exists():
+        typer.echo(f"Error: Interim directory not found: {interim_dir}", err=True)
+        raise typer.Exit(1)
+    
+    print(f"Rebuilding cache index in {interim_dir}...")
+    indexed = rebuild_index(interim_dir)
+    print(f"✓ Indexed {indexed} result files")
+
+
+@cache_app.command("migrate")
+def cache_migrate(
+    interim_dir: Path = Option(
+        INTERIM_DIR,
+        "--interim-dir",
+        help="Directory with cached interim results"
+    ),
+    keep_files: bool = Option(
+        False,
+        "--keep-files",
+        help="Keep the original *_result.txt files after packing them"
+    ),
+) -> None:
+    """
+    Move plain *_result.txt files from older caches into the compressed result packs.
+    
+    Results keep their filenames, so cache tools and cache keys keep working.
+    """
+    if not interim_dir.exists():
+        typer.echo(f"Error: Interim directory not found: {interim_dir}", err=True)
+        raise typer.Exit(1)
+    
+    print(f"Packing plain result files in {interim_dir}...")
+    migrated = migrate_loose_results(interim_dir, keep_files=keep_files)
+    print(f"✓ Packed {migrated} result files")
+
+
+@cache_app.command("export")
+def cache_export(
+    bundle: Path = Argument(..., help="Bundle file to write (e.g. forest_cache.sqlite)"),
+    interim_dir: Path = Option(
+        INTERIM_DIR,
+        "--interim-dir",
+        help="Directory with cached interim results"
+    ),
+    tool_calls: bool = Option(
+        True,
+        "--tool-calls/--no-tool-calls",
+        help="Include the unexpired MCP tool cache"
+    ),
+) -> None:
+    """
+    Export cached expert results and MCP tool calls into a single portable bundle file.
+    
+    The bundle is an SQLite file with a manifest, per-record content hashes and the creation
+    times and cache keys needed to keep TTLs and exact-hit reuse working after import.
+    """
+    from eliot import start_action
+    from longevity_forest.core.cache_bundle import export_bundle
+    if bundle.exists():
+        typer.echo(f"Error: Bundle already exists: {bundle}", err=True)
+        raise typer.Exit(1)
+    
+    with start_action(action_type="cache_export", bundle=str(bundle), interim_dir=str(interim_dir)) as action:
+        counts = export_bundle(bundle, interim_dir, include_tool_calls=tool_calls)
+        print(f"✓ Exported {counts['results']} results and {counts['tool_calls']} tool calls to {bundle} "
+              f"({bundle.stat().st_size / 1024 ** 2:.1f} MB)")
+        action.log(message_type="cache_export_complete", **counts)
+
+
+@cache_app.command("import")
+def cache_import(
+    bundle: Path = Argument(..., help="Bundle file written by `forest cache export`"),
+    interim_dir: Path = Option(
+        INTERIM_DIR,
+        "--interim-dir",
+        help="Directory with cached interim results"
+    ),
+) -> None:
+    """
+    Merge a cache bundle into the local cache, skipping results that are already present.
+    """
+    from eliot import start_action
+    from longevity_forest.core.cache_bundle import import_bundle, read_manifest
+    if not bundle.exists():
+        typer.echo(f"Error: Bundle not found: {bundle}", err=True)
+        raise typer.Exit(1)
+    try:
+        manifest = read_manifest(bundle)
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1)
+    
+    with start_action(action_type="cache_import", bundle=str(bundle), interim_dir=str(interim_dir), manifest=manifest) as action:
+        print(f"Importing {manifest.get('results')} results and {manifest.get('tool_calls')} tool calls "
+              f"exported from {manifest.get('source_host')}...")
+        counts = import_bundle(bundle, interim_dir)
+        print(f"✓ Imported {counts['imported']} results ({counts['duplicates']} already present, "
+              f"{counts['conflicts']} kept local), {counts['tool_calls']} tool calls "
+              f"({counts['tool_call_duplicates']} already present)")
+        if counts["corrupt"]:
+            print(f"⚠ Rejected {counts['corrupt']} records with mismatching content hashes")
+        action.log(message_type="cache_import_complete", **counts)
+
+
+def run_cache_gc(interim_dir: Path, max_bytes: Optional[int], dry_run: bool = False) -> dict[str, int]:
+    """
+    Evict expired and least recently used interim results and print a summary.
+    
+    Args:
+        interim_dir: Directory with cached interim results
+        max_bytes: Size budget of the interim directory (None disables size-based eviction)
+        dry_run: Only report what would be removed
+    
+    Returns:
+        Eviction statistics from collect_garbage
+    """
+    from eliot import start_action
+    from longevity_forest.core.tool_cache import prune_tool_cache
+    with start_action(action_type="cache_gc", interim_dir=str(interim_dir), max_bytes=max_bytes, dry_run=dry_run) as action:
+        stats = collect_garbage(interim_dir, max_bytes=max_bytes, dry_run=dry_run)
+        stats["expired_tool_calls"] = 0 if dry_run else prune_tool_cache(interim_dir)
+        verb = "Would remove" if dry_run else "Removed"
+        print(f"✓ {verb} {stats['removed_results']} results ({stats['removed_bytes'] / 1024 ** 2:.1f} MB): "
+              f"{stats['expired']} expired, {stats['evicted']} evicted over budget; "
+              f"{stats['remaining_bytes'] / 1024 ** 2:.1f} MB remaining")
+        if stats["expired_tool_calls"]:
+            print(f"✓ Removed {stats['expired_tool_calls']} expired MCP tool calls from the tool cache")
+        if stats["compacted_bytes"]:
+            print(f"✓ Compacted result packs, reclaimed {stats['compacted_bytes'] / 1024 ** 2:.1f} MB")
+        action.log(message_type="cache_gc_complete", **stats)
+        return stats
+
+
+@cache_app.command("gc")
+def cache_gc(
+    interim_dir: Path = Option(
+        INTERIM_DIR,
+        "--interim-dir",
+        help="Directory with cached interim results"
+    ),
+    max_mb: Optional[float] = Option(
+        CACHE_MAX_BYTES / 1024 ** 2,
+        "--max-mb",
+        help="Size budget of the interim directory in MB, least recently used results are evicted beyond it (defaults to config/cache.py)"
+    ),
+    dry_run: bool = Option(
+        False,
+        "--dry-run",
+        help="Only report what would be removed"
+    ),
+) -> None:
+    """
+    Evict interim results past their per-agent retention (config/cache.py), then the least
+    recently used ones until the directory fits the size budget.
+    """
+    if not interim_dir.exists():
+        typer.echo(f"Error: Interim directory not found: {interim_dir}", err=True)
+        raise typer.Exit(1)
+    
+    run_cache_gc(interim_dir, max_bytes=int(max_mb * 1024 ** 2) if max_mb is not None else None, dry_run=dry_run)
 
 
 def main() -> None:
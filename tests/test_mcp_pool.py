@@ -0,0 +1,116 @@
+"""MCP session pool: idle sessions are health-checked before tool calls reuse them, and the idle
+sweeper never closes a session a call is using.
+
+Run with `python -m unittest discover tests` (or pytest).
+"""
+
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+from longevity_forest.config.mcp import MCP_POOL_HEALTH_CHECK_AFTER_SECONDS
+from longevity_forest.core import mcp_pool
+
+
+class FakeSession:
+
+    def __init__(self, healthy: bool):
+        self.healthy = healthy
+        self.pings = 0
+
+    def is_connected(self) -> bool:
+        return True
+
+    async def ping(self) -> bool:
+        self.pings += 1
+        return self.healthy
+
+
+class FakeClient:
+    """Stands in for just_agents' MCPClient: _connect opens a session if there is none."""
+
+    def __init__(self, client_key: str, healthy: bool = True):
+        self.client_key = client_key
+        self.session = FakeSession(healthy)
+        self._client = self.session
+        self.closed = 0
+        self.connects = 0
+
+    async def _close(self) -> None:
+        self.closed += 1
+        self._client = None
+
+
+async def fake_connect(client: FakeClient) -> None:
+    if client._client is None:
+        client.connects += 1
+        client._client = FakeSession(healthy=True)
+
+
+async def fake_invoke_tool(client: FakeClient, tool_name: str, kwargs: dict) -> str:
+    # Like MCPClient.invoke_tool: connect first, then use the session
+    await mcp_pool._checked_connect(client)
+    await asyncio.sleep(0)
+    return f"{tool_name} via session {id(client._client)}"
+
+
+class McpPoolTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        patches = [
+            mock.patch.object(mcp_pool, "_original_connect", fake_connect),
+            mock.patch.object(mcp_pool, "_original_invoke_tool", fake_invoke_tool),
+            mock.patch.dict(mcp_pool._last_used, clear=True),
+            mock.patch.dict(mcp_pool._in_flight, clear=True),
+            mock.patch.dict(mcp_pool._connect_locks, clear=True),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def set_idle(self, client: FakeClient, seconds: float) -> None:
+        mcp_pool._last_used[client.client_key] = time.monotonic() - seconds
+
+    def test_idle_session_is_pinged_before_tool_call(self) -> None:
+        client = FakeClient("http://idle", healthy=True)
+        self.set_idle(client, MCP_POOL_HEALTH_CHECK_AFTER_SECONDS + 10_000)
+        asyncio.run(mcp_pool._tracked_invoke_tool(client, "bc_get_string_id", {}))
+        self.assertEqual(client.session.pings, 1)
+        self.assertEqual(client.closed, 0)
+
+    def test_dead_idle_session_is_replaced_before_tool_call(self) -> None:
+        client = FakeClient("http://dead", healthy=False)
+        self.set_idle(client, MCP_POOL_HEALTH_CHECK_AFTER_SECONDS + 10_000)
+        asyncio.run(mcp_pool._tracked_invoke_tool(client, "bc_get_string_id", {}))
+        self.assertEqual(client.closed, 1)
+        self.assertEqual(client.connects, 1)
+        self.assertEqual(mcp_pool._in_flight[client.client_key], 0)
+
+    def test_recently_used_session_is_not_pinged(self) -> None:
+        client = FakeClient("http://busy", healthy=True)
+        self.set_idle(client, 0)
+        asyncio.run(mcp_pool._tracked_invoke_tool(client, "bc_get_string_id", {}))
+        self.assertEqual(client.session.pings, 0)
+
+    def test_sweeper_keeps_session_with_call_in_flight(self) -> None:
+        client = FakeClient("http://sweep", healthy=True)
+        self.set_idle(client, 10_000)
+
+        async def sweep_during_call() -> tuple[bool, str]:
+            call = asyncio.create_task(mcp_pool._tracked_invoke_tool(client, "bc_get_string_id", {}))
+            await asyncio.sleep(0)
+            closed = await mcp_pool._close_if_idle(client, max_idle_seconds=1.0)
+            return closed, await call
+
+        closed, _ = asyncio.run(sweep_during_call())
+        self.assertFalse(closed)
+        self.assertEqual(client.closed, 0)
+        # Once the call finished the session counts as fresh again
+        self.assertFalse(asyncio.run(mcp_pool._close_if_idle(client, max_idle_seconds=1.0)))
+        self.set_idle(client, 10_000)
+        self.assertTrue(asyncio.run(mcp_pool._close_if_idle(client, max_idle_seconds=1.0)))
+
+
+if __name__ == "__main__":
+    unittest.main()
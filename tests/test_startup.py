@@ -0,0 +1,92 @@
+"""Startup-time regression tests: the CLI must not import the LLM stack for help or bookkeeping commands.
+
+Every check runs in a fresh interpreter, so modules imported by other tests don't hide a regression.
+Run with `python -m unittest discover tests` (or pytest).
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+# Modules that only commands calling LLMs or MCP servers may import
+HEAVY_MODULES = ("just_agents", "litellm", "eliot")
+
+# Budgets are generous for slow CI machines; eager imports of the LLM stack take several seconds
+IMPORT_BUDGET_SECONDS = 1.0
+COMMAND_BUDGET_SECONDS = 2.5
+
+# Runs a CLI invocation in-process and reports which heavy modules it loaded
+RUN_COMMAND = """
+import json, sys
+heavy_modules = json.loads(sys.argv[2])
+sys.argv = ["forest"] + json.loads(sys.argv[1])
+import longevity_forest.main as main
+try:
+    main.app()
+except SystemExit:
+    pass
+print("HEAVY_MODULES=" + json.dumps([name for name in heavy_modules if name in sys.modules]))
+"""
+
+
+def run_python(args: list[str], cwd: Path) -> tuple[subprocess.CompletedProcess, float]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, *args], cwd=cwd, env=env, capture_output=True, text=True, timeout=120)
+    return result, time.perf_counter() - start
+
+
+class StartupTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cwd = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def run_command(self, cli_args: list[str]) -> tuple[str, float]:
+        result, seconds = run_python(["-c", RUN_COMMAND, json.dumps(cli_args), json.dumps(HEAVY_MODULES)], self.cwd)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        match = re.search(r"^HEAVY_MODULES=(.*)$", result.stdout, re.M)
+        self.assertIsNotNone(match, result.stdout)
+        self.assertEqual(json.loads(match.group(1)), [], f"forest {' '.join(cli_args)} imported the LLM stack")
+        return result.stdout, seconds
+
+    def test_import_main_is_light(self) -> None:
+        result, _ = run_python(
+            ["-X", "importtime", "-c",
+             "import json, sys, longevity_forest.main; "
+             f"print(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))"],
+            self.cwd,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(json.loads(result.stdout.strip().splitlines()[-1]), [])
+        # -X importtime lines: "import time: self [us] | cumulative | imported package"
+        cumulative = [int(line.split("|")[1]) for line in result.stderr.splitlines()
+                      if line.startswith("import time:") and line.split("|")[-1].strip() == "longevity_forest.main"]
+        self.assertEqual(len(cumulative), 1, result.stderr[-2000:])
+        self.assertLess(cumulative[0] / 1e6, IMPORT_BUDGET_SECONDS)
+
+    def test_help_is_fast(self) -> None:
+        stdout, seconds = self.run_command(["--help"])
+        self.assertIn("analyze-gene", stdout)
+        self.assertLess(seconds, COMMAND_BUDGET_SECONDS)
+
+    def test_noop_command_is_fast(self) -> None:
+        stdout, seconds = self.run_command(["batch", "status", "--queue", str(self.cwd / "jobs.sqlite")])
+        self.assertIn("No jobs", stdout)
+        self.assertLess(seconds, COMMAND_BUDGET_SECONDS)
+
+
+if __name__ == "__main__":
+    unittest.main()